@@ -143,7 +143,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-output_dir = Path("./output")
+output_dir = Path(os.getenv("BRANDTRUTH_OUTPUT_DIR", "./output"))
 output_dir.mkdir(exist_ok=True)
 app.mount("/output", StaticFiles(directory=str(output_dir)), name="output")
 
@@ -30,6 +30,7 @@ from src.composers.image_matcher_v2 import match_images_v2
 from src.composers.ad_composer import compose_ads
 from src.models.copy_variant import Platform
 from src.models.composed_ad import AdFormat
+from src.utils.runtime import init_runtime
 
 
 console = Console()
@@ -324,4 +325,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    init_runtime()
     asyncio.run(main())
@@ -17,6 +17,27 @@ from pydantic import BaseModel, Field
 logger = logging.getLogger(__name__)
 
 
+def _two_proportion_z_test(
+    control_conversions: int,
+    control_visitors: int,
+    variant_conversions: int,
+    variant_visitors: int,
+) -> tuple[float, float, float, float]:
+    """Two-proportion z-test: (control_rate, variant_rate, lift, z_score)."""
+    control_visitors = max(control_visitors, 1)
+    variant_visitors = max(variant_visitors, 1)
+    control_rate = control_conversions / control_visitors
+    variant_rate = variant_conversions / variant_visitors
+
+    lift = (variant_rate - control_rate) / max(control_rate, 0.001)
+
+    pooled_rate = (control_conversions + variant_conversions) / (control_visitors + variant_visitors)
+    se = math.sqrt(pooled_rate * (1 - pooled_rate) * (1 / control_visitors + 1 / variant_visitors))
+    z_score = (variant_rate - control_rate) / max(se, 0.001)
+
+    return control_rate, variant_rate, lift, z_score
+
+
 class SplitElement(str, Enum):
     """Element types that can be A/B tested."""
     HEADLINE = "headline"
@@ -247,15 +268,9 @@ class SplitPlanner:
     def calculate_significance(self, control_conversions: int, control_visitors: int,
                                variant_conversions: int, variant_visitors: int) -> dict:
         """Calculate if test results are statistically significant."""
-        control_rate = control_conversions / max(control_visitors, 1)
-        variant_rate = variant_conversions / max(variant_visitors, 1)
-        
-        lift = (variant_rate - control_rate) / max(control_rate, 0.001)
-        
-        # Simplified significance calculation
-        pooled_rate = (control_conversions + variant_conversions) / (control_visitors + variant_visitors)
-        se = math.sqrt(pooled_rate * (1 - pooled_rate) * (1/control_visitors + 1/variant_visitors))
-        z_score = (variant_rate - control_rate) / max(se, 0.001)
+        control_rate, variant_rate, lift, z_score = _two_proportion_z_test(
+            control_conversions, control_visitors, variant_conversions, variant_visitors,
+        )
         
         is_significant = abs(z_score) > 1.96  # 95% confidence
         
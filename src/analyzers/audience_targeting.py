@@ -9,6 +9,7 @@ Provides:
 """
 
 import logging
+import re
 from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, Field
@@ -115,6 +116,14 @@ INTEREST_DATABASE = {
     },
 }
 
+# Product keyword patterns -> INTEREST_DATABASE category, checked in order.
+# Matching is plain substring (no word boundaries), e.g. "app" also hits "application".
+CATEGORY_PATTERNS: dict[re.Pattern[str], str] = {
+    re.compile("resume|job|career|interview|hire"): "career",
+    re.compile("shop|store|product|buy|ecommerce"): "ecommerce",
+    re.compile("saas|software|app|tool|platform"): "saas",
+}
+
 
 class AudienceTargeting:
     def __init__(self):
@@ -204,12 +213,9 @@ class AudienceTargeting:
     
     def _categorize_product(self, request: AudienceRequest) -> str:
         desc = (request.product_description + " " + request.product_type).lower()
-        if any(w in desc for w in ["resume", "job", "career", "interview", "hire"]):
-            return "career"
-        elif any(w in desc for w in ["shop", "store", "product", "buy", "ecommerce"]):
-            return "ecommerce"
-        elif any(w in desc for w in ["saas", "software", "app", "tool", "platform"]):
-            return "saas"
+        for pattern, category in CATEGORY_PATTERNS.items():
+            if pattern.search(desc):
+                return category
         return "default"
     
     def _get_tips(self, interest: str, request: AudienceRequest) -> list[str]:
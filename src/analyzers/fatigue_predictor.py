@@ -27,6 +27,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from src.utils.logging import get_logger
@@ -307,29 +308,28 @@ class FatiguePredictor:
         if len(ctr_history) < 5:
             return DecayPattern.NONE, 0.0
         
-        # Calculate daily changes
-        changes = []
-        for i in range(1, len(ctr_history)):
-            if ctr_history[i-1] > 0:
-                change = (ctr_history[i] - ctr_history[i-1]) / ctr_history[i-1]
-                changes.append(change)
+        # Calculate daily changes (skipping days that follow a zero CTR)
+        history = np.asarray(ctr_history, dtype=np.float64)
+        previous, current = history[:-1], history[1:]
+        valid = previous > 0
+        changes = (current[valid] - previous[valid]) / previous[valid]
         
-        if not changes:
+        if changes.size == 0:
             return DecayPattern.NONE, 0.0
         
-        avg_change = sum(changes) / len(changes)
+        avg_change = float(changes.mean())
         
         # Check for sudden drop (any day with >20% decline)
-        if any(c < -0.2 for c in changes):
-            return DecayPattern.SUDDEN, abs(min(changes))
+        if (changes < -0.2).any():
+            return DecayPattern.SUDDEN, abs(float(changes.min()))
         
         # Check for plateau (very small changes)
-        if all(abs(c) < 0.02 for c in changes):
+        if (np.abs(changes) < 0.02).all():
             return DecayPattern.PLATEAU, 0.01
         
         # Check for cyclical (alternating ups and downs)
-        sign_changes = sum(1 for i in range(1, len(changes)) if changes[i] * changes[i-1] < 0)
-        if sign_changes > len(changes) * 0.6:
+        sign_changes = int(np.count_nonzero(changes[1:] * changes[:-1] < 0))
+        if sign_changes > changes.size * 0.6:
             return DecayPattern.CYCLICAL, abs(avg_change)
         
         # Default to gradual if overall declining
@@ -278,7 +278,7 @@ class VideoGenerator:
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("VIDEO_API_KEY")
-        self.output_dir = Path("./output/videos")
+        self.output_dir = Path(os.getenv("BRANDTRUTH_OUTPUT_DIR", "./output")) / "videos"
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     async def generate_video(self, request: VideoGenerationRequest) -> GeneratedVideo:
@@ -108,7 +108,10 @@ async def embed_brand_activity(
         "campaign_id": campaign_id,
     }
 
-    await qdrant.upsert_brand(point_id, vector, payload)
+    # upsert_brand only queues the point; flush so a failed write raises
+    # here and Temporal retries the activity
+    if await qdrant.upsert_brand(point_id, vector, payload):
+        await qdrant.flush()
 
     activity.logger.info(f"Embedded brand: {brand_data.get('brand_name')} -> {point_id}")
 
@@ -66,6 +66,8 @@ from src.temporal.activities.publish import (
 )
 from src.temporal.workflows.publish_workflow import PublishToMetaWorkflow
 from src.utils.logging import get_logger
+from src.utils.runtime import init_runtime
+from src.vector.embeddings import close_embedding_service
 
 logger = get_logger(__name__)
 
@@ -148,6 +150,9 @@ async def run_worker():
         logger.info("Worker running. Press Ctrl+C to stop.")
         await shutdown_event.wait()
 
+    # Release the embedding service's pooled HTTP connections
+    await close_embedding_service()
+
     logger.info("Worker stopped")
 
 
@@ -163,6 +168,8 @@ def main():
 ╚═══════════════════════════════════════════════════════════════╝
     """)
 
+    init_runtime()
+
     try:
         asyncio.run(run_worker())
     except KeyboardInterrupt:
@@ -3,6 +3,7 @@
 
 from .retry import retry_sync, retry_async, RetryConfig, DEFAULT_RETRY_CONFIG
 from .logging import setup_logging, get_logger
+from .runtime import init_runtime
 
 __all__ = [
     "retry_sync",
@@ -11,4 +12,5 @@ __all__ = [
     "DEFAULT_RETRY_CONFIG",
     "setup_logging",
     "get_logger",
+    "init_runtime",
 ]
@@ -20,11 +20,16 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pre-render colored level names once instead of per record
+        self._precolored = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+    
     def format(self, record):
         # Add color to level name
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.RESET}"
+        record.levelname = self._precolored.get(record.levelname, record.levelname)
         
         # Add timestamp
         record.timestamp = datetime.now().strftime('%H:%M:%S')
@@ -87,6 +92,10 @@ def get_logger(name: str = "brandtruth") -> logging.Logger:
 # Module-level logger
 _logger: Optional[logging.Logger] = None
 
+# Cached default logger for the log_* helpers (loggers are process-wide singletons,
+# so this stays valid across setup_logging/init_logging calls)
+_default_logger = logging.getLogger("brandtruth")
+
 
 def init_logging(level: str = "INFO", log_file: Optional[str] = None):
     """Initialize global logging."""
@@ -97,33 +106,34 @@ def init_logging(level: str = "INFO", log_file: Optional[str] = None):
 
 def log_step(step: str, message: str):
     """Log a pipeline step with formatting."""
-    logger = get_logger()
-    logger.info(f"[{step}] {message}")
+    if not _default_logger.isEnabledFor(logging.INFO):
+        return
+    _default_logger.info(f"[{step}] {message}")
 
 
 def log_progress(current: int, total: int, message: str):
     """Log progress with formatting."""
-    logger = get_logger()
+    if not _default_logger.isEnabledFor(logging.INFO):
+        return
     pct = int((current / total) * 100) if total > 0 else 0
     bar_len = 20
     filled = int(bar_len * current / total) if total > 0 else 0
     bar = '█' * filled + '░' * (bar_len - filled)
-    logger.info(f"[{bar}] {pct}% - {message}")
+    _default_logger.info(f"[{bar}] {pct}% - {message}")
 
 
 def log_success(message: str):
     """Log success message."""
-    logger = get_logger()
-    logger.info(f"✅ {message}")
+    if not _default_logger.isEnabledFor(logging.INFO):
+        return
+    _default_logger.info(f"✅ {message}")
 
 
 def log_warning(message: str):
     """Log warning message."""
-    logger = get_logger()
-    logger.warning(f"⚠️  {message}")
+    _default_logger.warning(f"⚠️  {message}")
 
 
 def log_error(message: str):
     """Log error message."""
-    logger = get_logger()
-    logger.error(f"❌ {message}")
+    _default_logger.error(f"❌ {message}")
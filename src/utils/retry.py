@@ -6,7 +6,7 @@ import functools
 import logging
 import random
 import time
-from typing import Callable, TypeVar
+from typing import Callable, Optional, TypeVar
 
 logger = logging.getLogger("brandtruth")
 
@@ -40,14 +40,31 @@ DEFAULT_RETRY_CONFIG = RetryConfig(
 )
 
 
-def calculate_delay(attempt: int, config: RetryConfig) -> float:
-    """Calculate delay with exponential backoff and optional jitter."""
-    delay = min(
-        config.base_delay * (config.exponential_base ** attempt),
-        config.max_delay
+def backoff_schedule(config: RetryConfig) -> tuple[float, ...]:
+    """Precompute the capped exponential backoff delay for every attempt."""
+    return tuple(
+        min(config.base_delay * (config.exponential_base ** attempt), config.max_delay)
+        for attempt in range(config.max_attempts)
     )
+
+
+def calculate_delay(
+    attempt: int,
+    config: RetryConfig,
+    schedule: Optional[tuple[float, ...]] = None,
+) -> float:
+    """Calculate delay with exponential backoff and optional jitter.
+
+    Args:
+        attempt: Zero-based attempt number
+        config: Retry behavior
+        schedule: Precomputed backoff_schedule(config), if available
+    """
+    if schedule is None:
+        schedule = backoff_schedule(config)
+    delay = schedule[attempt]
     if config.jitter:
-        delay = delay * (0.5 + random.random())
+        delay *= 0.5 + random.random()
     return delay
 
 
@@ -77,6 +94,8 @@ def retry_sync(config: RetryConfig = None):
         config = DEFAULT_RETRY_CONFIG
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays = backoff_schedule(config)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
             last_error = None
@@ -92,7 +111,7 @@ def retry_sync(config: RetryConfig = None):
                         raise
                     
                     if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
+                        delay = calculate_delay(attempt, config, delays)
                         logger.warning(
                             f"⚠️  Retryable error (attempt {attempt + 1}/{config.max_attempts}): {type(e).__name__}. "
                             f"Retrying in {delay:.1f}s..."
@@ -109,12 +128,25 @@ def retry_sync(config: RetryConfig = None):
     return decorator
 
 
-def retry_async(config: RetryConfig = None):
-    """Decorator for async functions with retry logic."""
+def retry_async(
+    config: RetryConfig = None,
+    is_retryable: Optional[Callable[[Exception, RetryConfig], bool]] = None,
+):
+    """Decorator for async functions with retry logic.
+
+    Args:
+        config: Retry behavior (defaults to DEFAULT_RETRY_CONFIG)
+        is_retryable: Predicate deciding which errors to retry
+            (defaults to is_retryable_error)
+    """
     if config is None:
         config = DEFAULT_RETRY_CONFIG
+    if is_retryable is None:
+        is_retryable = is_retryable_error
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays = backoff_schedule(config)
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             last_error = None
@@ -125,12 +157,12 @@ def retry_async(config: RetryConfig = None):
                 except Exception as e:
                     last_error = e
                     
-                    if not is_retryable_error(e, config):
+                    if not is_retryable(e, config):
                         logger.error(f"Non-retryable error in {func.__name__}: {e}")
                         raise
                     
                     if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
+                        delay = calculate_delay(attempt, config, delays)
                         logger.warning(
                             f"⚠️  Retryable error (attempt {attempt + 1}/{config.max_attempts}): {type(e).__name__}. "
                             f"Retrying in {delay:.1f}s..."
@@ -0,0 +1,35 @@
+# src/utils/runtime.py
+"""Event loop runtime configuration for BrandTruth AI."""
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger("brandtruth")
+
+
+def init_runtime() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when available.
+    
+    uvloop considerably raises the request rate achievable by concurrent
+    httpx workloads (embedding batches, API retries). It is not available
+    on Windows, where the default asyncio loop is kept.
+    
+    Must be called before the event loop is created (i.e. before asyncio.run).
+    
+    Returns:
+        True if uvloop was installed, False if falling back to asyncio
+    """
+    if sys.platform == "win32":
+        return False
+    
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop policy")
+    return True
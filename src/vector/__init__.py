@@ -2,7 +2,8 @@
 """Vector database module for semantic search and embeddings."""
 
 from src.vector.qdrant_client import QdrantClient, get_qdrant_client, QdrantConfig
-from src.vector.embeddings import EmbeddingService, get_embedding_service
+from src.vector.embeddings import EmbeddingService, close_embedding_service, get_embedding_service
+from src.vector.cache import LRUEmbeddingCache
 
 __all__ = [
     "QdrantClient",
@@ -10,4 +11,6 @@ __all__ = [
     "QdrantConfig",
     "EmbeddingService",
     "get_embedding_service",
+    "close_embedding_service",
+    "LRUEmbeddingCache",
 ]
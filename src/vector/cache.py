@@ -0,0 +1,94 @@
+# src/vector/cache.py
+"""In-process LRU + TTL cache for embeddings and search results.
+
+This module provides:
+- LRUEmbeddingCache: async-safe LRU cache with per-entry expiry
+- Key helpers for query text
+
+Hot queries skip both the embedding API round-trip (text -> vector) and the
+Qdrant round-trip (vector + filters -> results).
+
+EmbeddingService.embed_search_query and the QdrantClient search methods use
+it internally.
+
+Usage:
+    cache = LRUEmbeddingCache(capacity=1024, ttl=3600)
+
+    key = LRUEmbeddingCache.text_key("running shoes for beginners")
+    vector = await cache.get(key)
+    if vector is None:
+        vector = await embed(query)
+        await cache.set(key, vector)
+
+    print(cache.stats())
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUEmbeddingCache:
+    """Async-safe LRU cache with a time-to-live per entry.
+
+    Entries are evicted least-recently-used first once capacity is reached,
+    and treated as missing once older than ttl seconds.
+    """
+
+    def __init__(self, capacity: int = 1024, ttl: float = 3600.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def text_key(text: str) -> str:
+        """Build a cache key for query text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry."""
+        async with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self._misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    async def set(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry if full."""
+        async with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+
+    async def clear(self):
+        """Drop all entries."""
+        async with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._data),
+            "capacity": self.capacity,
+            "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
@@ -25,16 +25,47 @@ Usage:
     vector = await service.embed_copy_variant(copy_variant)
 """
 
+import asyncio
+import base64
 import os
+import sys
+from array import array
 from typing import Optional, Union
 
+import httpx
 from openai import AsyncOpenAI, AsyncAzureOpenAI
 
 from src.utils.logging import get_logger
+from src.vector.cache import LRUEmbeddingCache
+
+# orjson parses the large float arrays in embedding responses much faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# httpx needs h2 for HTTP/2 (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 logger = get_logger(__name__)
 
 
+def _decode_embedding(value: Union[str, list[float]]) -> list[float]:
+    """Decode a base64 float32 embedding (or pass through a float list)."""
+    if not isinstance(value, str):
+        return value
+    vector = array("f", base64.b64decode(value))
+    if sys.byteorder == "big":
+        vector.byteswap()  # API returns little-endian float32
+    return vector.tolist()
+
+
 class EmbeddingService:
     """Async embedding generation with Azure OpenAI or OpenAI.
 
@@ -43,6 +74,9 @@ class EmbeddingService:
     """
 
     _instance: Optional['EmbeddingService'] = None
+    # Created per event loop: an asyncio.Lock binds to the loop that first waits on it
+    _init_lock: Optional[asyncio.Lock] = None
+    _init_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     # Model names
     OPENAI_MODEL = "text-embedding-3-small"  # 1536 dimensions
@@ -51,20 +85,61 @@ class EmbeddingService:
     DIMENSIONS = 1536
     BATCH_SIZE = 100  # OpenAI limit: 2048 per request
 
+    # Search query text -> vector (repeat queries skip the API round trip)
+    QUERY_CACHE_CAPACITY = 1024
+    QUERY_CACHE_TTL = 3600.0  # seconds
+
+    # HTTP transport tuning (HTTP/2 multiplexes concurrent batches over one connection)
+    MAX_CONNECTIONS = 64
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    REQUEST_TIMEOUT = 60.0
+    CONNECT_TIMEOUT = 5.0
+
     def __init__(self):
         self._client: Optional[Union[AsyncOpenAI, AsyncAzureOpenAI]] = None
         self._model: str = self.OPENAI_MODEL
         self._is_azure: bool = False
         self._initialized = False
+        self.query_cache = LRUEmbeddingCache(
+            capacity=self.QUERY_CACHE_CAPACITY,
+            ttl=self.QUERY_CACHE_TTL,
+        )
 
     @classmethod
     async def get_instance(cls) -> 'EmbeddingService':
-        """Get singleton instance."""
+        """Get singleton instance.
+
+        Guarded by a lock so concurrent cold-start callers share one client
+        instead of each building (and handshaking) their own.
+        """
         if cls._instance is None:
-            cls._instance = cls()
-            await cls._instance._initialize()
+            async with cls._get_init_lock():
+                if cls._instance is None:
+                    instance = cls()
+                    await instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
+    @classmethod
+    def _get_init_lock(cls) -> asyncio.Lock:
+        """Return the init lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._init_lock is None or cls._init_lock_loop is not loop:
+            cls._init_lock = asyncio.Lock()
+            cls._init_lock_loop = loop
+        return cls._init_lock
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """Build the pooled HTTP/2 transport shared by the OpenAI SDK clients."""
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(self.REQUEST_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+        )
+
     async def _initialize(self):
         """Initialize the OpenAI/Azure OpenAI client."""
         if self._initialized:
@@ -80,6 +155,7 @@ class EmbeddingService:
                     azure_endpoint=azure_endpoint,
                     api_key=azure_api_key,
                     api_version="2024-02-01",
+                    http_client=self._build_http_client(),
                 )
                 self._model = self.AZURE_DEPLOYMENT
                 self._is_azure = True
@@ -93,7 +169,10 @@ class EmbeddingService:
         openai_api_key = os.getenv("OPENAI_API_KEY")
         if openai_api_key:
             try:
-                self._client = AsyncOpenAI(api_key=openai_api_key)
+                self._client = AsyncOpenAI(
+                    api_key=openai_api_key,
+                    http_client=self._build_http_client(),
+                )
                 self._model = self.OPENAI_MODEL
                 self._is_azure = False
                 logger.info(f"Initialized OpenAI embedding service: {self._model}")
@@ -104,6 +183,13 @@ class EmbeddingService:
 
         logger.warning("No embedding API configured - set AZURE_OPENAI_ENDPOINT/AZURE_OPENAI_API_KEY or OPENAI_API_KEY")
 
+    async def close(self):
+        """Close the SDK client and its pooled HTTP transport."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        self._initialized = False
+
     async def embed_text(self, text: str, dimensions: Optional[int] = None) -> list[float]:
         """Embed a single text string.
 
@@ -151,15 +237,19 @@ class EmbeddingService:
                 create_params = {
                     "model": self._model,
                     "input": batch,
+                    # base64 float32 is ~5x smaller on the wire than a JSON float array
+                    "encoding_format": "base64",
                 }
                 # Only add dimensions for OpenAI (not Azure)
                 if not self._is_azure:
                     create_params["dimensions"] = dims
 
-                response = await self._client.embeddings.create(**create_params)
+                # Parse the raw body ourselves instead of building SDK models per item
+                response = await self._client.embeddings.with_raw_response.create(**create_params)
+                data = _json_loads(response.content)["data"]
 
                 # Extract vectors in order
-                embeddings = [item.embedding for item in response.data]
+                embeddings = [_decode_embedding(item["embedding"]) for item in data]
                 all_embeddings.extend(embeddings)
 
                 logger.debug(f"Embedded batch {i // self.BATCH_SIZE + 1} ({len(batch)} texts)")
@@ -238,18 +328,26 @@ class EmbeddingService:
         return vector
 
     async def embed_search_query(self, query: str) -> list[float]:
-        """Embed a search query.
+        """Embed a search query, reusing the vector for repeated queries.
 
-        Simple pass-through for now, but could apply query-specific
-        transformations in the future.
+        Vectors are cached in query_cache for QUERY_CACHE_TTL seconds. Zero
+        vectors (no API configured, or a failed request) are not cached.
 
         Args:
             query: Search query text
 
         Returns:
-            Embedding vector
+            Embedding vector (a fresh list the caller may modify)
         """
-        return await self.embed_text(query)
+        key = LRUEmbeddingCache.text_key(query)
+        cached = await self.query_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        vector = await self.embed_text(query)
+        if any(vector):
+            await self.query_cache.set(key, tuple(vector))
+        return vector
 
 
 # Singleton accessor
@@ -260,3 +358,11 @@ async def get_embedding_service() -> EmbeddingService:
         EmbeddingService instance
     """
     return await EmbeddingService.get_instance()
+
+
+async def close_embedding_service():
+    """Close the singleton embedding service (call on shutdown)."""
+    instance, EmbeddingService._instance = EmbeddingService._instance, None
+    if instance is not None:
+        await instance.close()
+        logger.info("Embedding service closed")
@@ -15,43 +15,211 @@ Usage:
     client = await get_qdrant_client()
     await client.ensure_collections()
 
-    # Upsert brand embedding
+    # Upsert brand embedding (queued, flushed in batches)
     await client.upsert_brand(brand_profile, embedding_vector)
 
+    # Bulk ingestion (parallel upload, indexing deferred until done)
+    await client.bulk_load(client.config.COLLECTION_AD_CREATIVES, points)
+
+    # Streaming ingestion (embedding overlapped with upserts)
+    stats = await client.ingest_stream(client.config.COLLECTION_BRANDS, items, embedder)
+
     # Search similar brands
     results = await client.search_similar_brands(query_vector, limit=10)
 """
 
+import asyncio
+import functools
+import itertools
 import os
-from typing import Optional, Any
-from dataclasses import dataclass
+import time
+from operator import attrgetter
+from typing import TYPE_CHECKING, AsyncIterable, AsyncIterator, ClassVar, Optional, Any, Iterable, Iterator, Union
+from dataclasses import dataclass, field
 
+import grpc
+import numpy as np
 from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException
 from qdrant_client.models import (
     Distance,
     VectorParams,
     PointStruct,
     Filter,
+    HnswConfigDiff,
     FieldCondition,
     MatchValue,
     Range,
     PayloadSchemaType,
+    OptimizersConfigDiff,
+    QueryRequest,
+    ScoredPoint,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    QuantizationSearchParams,
+    SearchParams,
+    SetPayload,
+    SetPayloadOperation,
 )
 
 from src.utils.logging import get_logger
+from src.utils.retry import RetryConfig, is_retryable_error, retry_async
+from src.vector.cache import LRUEmbeddingCache
+
+if TYPE_CHECKING:
+    from src.vector.embeddings import EmbeddingService
+
+# orjson normalizes numpy scalars/arrays in payloads in a single C pass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# xxh3 hashes a 1536-d float32 vector straight from its buffer in well under 1µs
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 logger = get_logger(__name__)
 
+Vector = Union[list[float], np.ndarray]
+
+# Backoff for batch writes that hit timeouts / RESOURCE_EXHAUSTED under load
+UPSERT_RETRY_CONFIG = RetryConfig(max_attempts=3, base_delay=0.5, max_delay=5.0)
+
+
+def _is_retryable_qdrant_error(error: Exception, config: RetryConfig) -> bool:
+    """Also retry timeouts and transient gRPC statuses seen under write load."""
+    if isinstance(error, TimeoutError):
+        return True
+    error_str = str(error).lower()
+    if "resource_exhausted" in error_str or "deadline_exceeded" in error_str:
+        return True
+    return is_retryable_error(error, config)
+
+
+# Precompiled filter conditions. Dynamic values are swapped in with
+# model_copy (cheaper than re-validating a new FieldCondition), and whole
+# filters are memoized since thresholds/angles repeat across searches.
+_CONFIDENCE_CONDITION = FieldCondition(key="confidence_score", range=Range(gte=0.0))
+_PERFORMANCE_CONDITION = FieldCondition(key="performance_score", range=Range(gte=0.0))
+_BRAND_NAME_CONDITION = FieldCondition(key="brand_name", match=MatchValue(value=""))
+_ANGLE_CONDITION = FieldCondition(key="angle", match=MatchValue(value=""))
+_APPROVED_CONDITION = FieldCondition(key="is_approved", match=MatchValue(value=True))
+
+
+_ID_SCORE_PAYLOAD = attrgetter("id", "score", "payload")
+
+
+def _to_hits(results: list[ScoredPoint]) -> list[dict[str, Any]]:
+    """Map scored points to plain hit dicts (JSON-serializable for activities)."""
+    return [
+        {"id": point_id, "score": score, "payload": payload}
+        for point_id, score, payload in map(_ID_SCORE_PAYLOAD, results)
+    ]
+
+
+def _copy_hits(hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy cached hits (and their payloads) so callers can't mutate the cache."""
+    return [
+        {**hit, "payload": dict(hit["payload"]) if hit["payload"] is not None else None}
+        for hit in hits
+    ]
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    """Yield successive lists of up to size items without materializing the input."""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+async def _achunks(iterable: AsyncIterable, size: int) -> AsyncIterator[list]:
+    """Async counterpart of _chunks."""
+    chunk = []
+    async for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@functools.lru_cache(maxsize=64)
+def _search_params(hnsw_ef: int, oversampling: Optional[float]) -> SearchParams:
+    """Build (and memoize) search params for a given ef / oversampling."""
+    quantization = None
+    if oversampling is not None:
+        quantization = QuantizationSearchParams(rescore=True, oversampling=oversampling)
+    return SearchParams(hnsw_ef=hnsw_ef, exact=False, quantization=quantization)
+
+
+@functools.lru_cache(maxsize=256)
+def _brand_filter(min_confidence: float, exclude_brand_name: Optional[str]) -> Filter:
+    """Build (and memoize) the brand search filter."""
+    must = [_CONFIDENCE_CONDITION.model_copy(update={"range": Range(gte=min_confidence)})]
+
+    must_not = None
+    if exclude_brand_name:
+        must_not = [
+            _BRAND_NAME_CONDITION.model_copy(
+                update={"match": MatchValue(value=exclude_brand_name)}
+            )
+        ]
+
+    return Filter(must=must, must_not=must_not)
+
+
+@functools.lru_cache(maxsize=256)
+def _ad_filter(
+    angle: Optional[str],
+    min_performance: float,
+    only_approved: bool,
+) -> Optional[Filter]:
+    """Build (and memoize) the ad creative search filter."""
+    must = []
+
+    if min_performance > 0:
+        must.append(
+            _PERFORMANCE_CONDITION.model_copy(update={"range": Range(gte=min_performance)})
+        )
+
+    if angle:
+        must.append(_ANGLE_CONDITION.model_copy(update={"match": MatchValue(value=angle)}))
+
+    if only_approved:
+        must.append(_APPROVED_CONDITION)
+
+    return Filter(must=must) if must else None
+
 
 @dataclass
 class QdrantConfig:
-    """Qdrant connection configuration from environment variables."""
+    """Qdrant connection configuration from environment variables.
+
+    Environment-backed fields are resolved when the config is constructed
+    (not at import), so values loaded by load_dotenv() after import are
+    picked up. Use QdrantConfig.load() to share one resolved config.
+    """
 
-    URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
-    GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
-    API_KEY: Optional[str] = os.getenv("QDRANT_API_KEY")
+    _resolved: ClassVar[Optional['QdrantConfig']] = None
+
+    URL: str = field(default_factory=lambda: os.getenv("QDRANT_URL", "http://localhost:6333"))
+    GRPC_PORT: int = field(default_factory=lambda: int(os.getenv("QDRANT_GRPC_PORT", "6334")))
+    API_KEY: Optional[str] = field(default_factory=lambda: os.getenv("QDRANT_API_KEY"))
     TIMEOUT: int = 30
 
+    # Number of client connections requests are spread across. Each client has
+    # its own gRPC channel, so concurrent calls don't queue behind one HTTP/2
+    # connection or one protobuf encoder. Keep this small: unlike SQL pools
+    # (25-50), a few multiplexed gRPC channels already saturate the server.
+    POOL_SIZE: int = field(default_factory=lambda: int(os.getenv("QDRANT_POOL_SIZE", "4")))
+
     # Collection names
     COLLECTION_BRANDS: str = "brands"
     COLLECTION_AD_CREATIVES: str = "ad_creatives"
@@ -59,6 +227,118 @@ class QdrantConfig:
     # Embedding dimensions (OpenAI text-embedding-3-small)
     EMBEDDING_DIM: int = 1536
 
+    # Vector quantization: scalar (int8), binary, or none
+    QUANTIZATION: str = field(default_factory=lambda: os.getenv("QDRANT_QUANTIZATION", "scalar"))
+    BINARY_OVERSAMPLING: float = 2.0
+
+    # HNSW graph (applies to new collections). payload_m builds extra links
+    # per indexed payload value so filtered searches stay on the graph;
+    # filters matching fewer than full_scan_threshold KB of vectors are
+    # served by a payload-index scan instead
+    HNSW_M: int = 32
+    HNSW_EF_CONSTRUCT: int = 200
+    HNSW_FULL_SCAN_THRESHOLD: int = 10000  # KB
+    HNSW_PAYLOAD_M: int = 16
+    HNSW_EF_MIN: int = 128  # search ef = max(HNSW_EF_MIN, limit * 4)
+
+    # dtype numpy vectors are cast to before transport (Qdrant stores float32)
+    VECTOR_DTYPE: str = field(default_factory=lambda: os.getenv("QDRANT_VECTOR_DTYPE", "float32"))
+    # Unit-normalize vectors client-side and index with dot product, which
+    # ranks like cosine without the server-side normalize per query
+    USE_DOT: bool = field(
+        default_factory=lambda: os.getenv("QDRANT_USE_DOT", "false").lower() == "true"
+    )
+
+    # Single-point upserts are queued and flushed in batches
+    UPSERT_BATCH_SIZE: int = 256
+    UPSERT_FLUSH_INTERVAL: float = 0.05  # seconds
+
+    # Concurrent batch upserts in flight (bounded to avoid saturating the server WAL)
+    MAX_INFLIGHT: int = field(default_factory=lambda: int(os.getenv("QDRANT_MAX_INFLIGHT", "8")))
+
+    # Bulk loads (keep batches well under ~1800 points to avoid server stalls)
+    BULK_LOAD_PARALLEL: int = 8
+    BULK_LOAD_BATCH_SIZE: int = 1000
+    DEFAULT_INDEXING_THRESHOLD: int = 20000  # if the collection reports none
+
+    # Streaming ingestion (embed -> upsert); the queue bounds buffered points
+    INGEST_EMBED_BATCH_SIZE: int = 64
+    INGEST_QUEUE_SIZE: int = 512
+
+    # In-process search result cache (query vector + filters -> hits)
+    CACHE_CAPACITY: int = 1024
+    SEARCH_CACHE_TTL: float = 60.0  # seconds (other processes may write)
+    SCHEMA_CACHE_TTL: float = 60.0  # seconds (collections + payload indexes)
+
+    # Concurrent searches are coalesced into one query_batch_points call per
+    # window; set QDRANT_COALESCE_MS=0 to send each search directly
+    COALESCE_MS: float = field(default_factory=lambda: float(os.getenv("QDRANT_COALESCE_MS", "5")))
+    COALESCE_MAX_BATCH: int = 64
+
+    # Circuit breaker: after this many consecutive connection failures, fail
+    # fast for BREAKER_COOLDOWN seconds instead of waiting on RPC timeouts
+    BREAKER_FAILURE_THRESHOLD: int = 5
+    BREAKER_COOLDOWN: float = 30.0  # seconds
+
+    @classmethod
+    def load(cls) -> 'QdrantConfig':
+        """Resolve the config from the environment once and reuse it."""
+        if cls._resolved is None:
+            cls._resolved = cls()
+        return cls._resolved
+
+
+class CircuitBreaker:
+    """Fast-fail guard for an unreliable backend.
+
+    closed: calls go through; consecutive failures are counted.
+    open: calls are refused until the cooldown elapses.
+    half_open: calls go through on trial; one failure re-opens the
+    circuit, one success closes it.
+    """
+
+    # Errors that indicate Qdrant is unreachable/overloaded (not bad requests)
+    CONNECTION_ERRORS = (TimeoutError, ConnectionError, ResponseHandlingException, grpc.aio.AioRpcError)
+    TRANSIENT_GRPC_CODES = {grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED}
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.fail_count = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = "half_open"
+        return True
+
+    def is_connection_error(self, error: BaseException) -> bool:
+        """Whether an error should count towards opening the circuit."""
+        if isinstance(error, grpc.aio.AioRpcError):
+            return error.code() in self.TRANSIENT_GRPC_CODES
+        return isinstance(error, self.CONNECTION_ERRORS)
+
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        self.state = "closed"
+        self.fail_count = 0
+
+    def record_failure(self):
+        """Count a connection failure, opening the circuit at the threshold."""
+        self.fail_count += 1
+        if self.state == "half_open" or self.fail_count >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(
+                    f"Qdrant circuit opened after {self.fail_count} failures - "
+                    f"failing fast for {self.cooldown:.0f}s"
+                )
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
 
 class QdrantClient:
     """Async Qdrant client for vector operations.
@@ -68,51 +348,214 @@ class QdrantClient:
     """
 
     _instance: Optional['QdrantClient'] = None
+    # Created per event loop: an asyncio.Lock binds to the loop that first waits on it
+    _init_lock: Optional[asyncio.Lock] = None
+    _init_lock_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def __init__(self):
-        self.config = QdrantConfig()
-        self._client: Optional[AsyncQdrantClient] = None
+        self.config = QdrantConfig.load()
+        self._client: Optional[AsyncQdrantClient] = None  # primary (admin operations)
+        self._clients: list[AsyncQdrantClient] = []
+        self._rr: Optional[Iterator[AsyncQdrantClient]] = None
         self._initialized = False
+        self._breaker = CircuitBreaker(
+            failure_threshold=self.config.BREAKER_FAILURE_THRESHOLD,
+            cooldown=self.config.BREAKER_COOLDOWN,
+        )
+        self._ingest_queue: asyncio.Queue[tuple[str, PointStruct]] = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Queued points that could not be written, and the last write error
+        # (re-raised by flush())
+        self.failed_points = 0
+        self._flush_error: Optional[Exception] = None
+        self._search_queues: dict[str, asyncio.Queue] = {}
+        self._search_tasks: dict[str, asyncio.Task] = {}
+
+        # Payload fields known to be indexed, per collection (filled by ensure_collections)
+        # Collection -> indexed payload fields, refreshed every SCHEMA_CACHE_TTL
+        self._schema_cache: dict[str, dict[str, PayloadSchemaType]] = {}
+        self._schema_fetched_at: Optional[float] = None
+        self._unindexed_warned: set[tuple[str, str]] = set()
+
+        # Search results per collection, invalidated on every write to it
+        self._search_cache: dict[str, LRUEmbeddingCache] = {
+            name: LRUEmbeddingCache(
+                capacity=self.config.CACHE_CAPACITY,
+                ttl=self.config.SEARCH_CACHE_TTL,
+            )
+            for name in (self.config.COLLECTION_BRANDS, self.config.COLLECTION_AD_CREATIVES)
+        }
 
     @classmethod
     async def get_instance(cls) -> 'QdrantClient':
-        """Get or create the singleton instance."""
+        """Get or create the singleton instance.
+
+        Guarded by a lock so concurrent first callers at startup share one
+        set of gRPC channels instead of racing through _initialize.
+        """
         if cls._instance is None:
-            cls._instance = cls()
-            await cls._instance._initialize()
+            async with cls._get_init_lock():
+                if cls._instance is None:
+                    instance = cls()
+                    await instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
+    @classmethod
+    def _get_init_lock(cls) -> asyncio.Lock:
+        """Return the init lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if cls._init_lock is None or cls._init_lock_loop is not loop:
+            cls._init_lock = asyncio.Lock()
+            cls._init_lock_loop = loop
+        return cls._init_lock
+
     async def _initialize(self):
         """Initialize the async Qdrant client."""
         if self._initialized:
             return
 
         try:
-            self._client = AsyncQdrantClient(
-                url=self.config.URL,
-                api_key=self.config.API_KEY,
-                port=6333,
-                grpc_port=self.config.GRPC_PORT,
-                prefer_grpc=True,
-                timeout=self.config.TIMEOUT,
-            )
-
-            # Verify connection
-            collections = await self._client.get_collections()
+            self._clients = [
+                AsyncQdrantClient(
+                    url=self.config.URL,
+                    api_key=self.config.API_KEY,
+                    port=6333,
+                    grpc_port=self.config.GRPC_PORT,
+                    prefer_grpc=True,
+                    timeout=self.config.TIMEOUT,
+                )
+                for _ in range(max(1, self.config.POOL_SIZE))
+            ]
+            self._client = self._clients[0]
+            self._rr = itertools.cycle(self._clients)
+
+            # Verify connection (and open every channel up front)
+            results = await asyncio.gather(*(c.get_collections() for c in self._clients))
+            collections = results[0]
             collection_names = [c.name for c in collections.collections]
             logger.info(f"Connected to Qdrant - collections: {collection_names}")
             self._initialized = True
 
         except Exception as e:
             logger.warning(f"Qdrant not available: {e}")
-            # Don't fail - Qdrant is optional for local dev
+            # Don't fail - Qdrant is optional for local dev. Drop the clients
+            # so _available() is False and writes are refused, not queued.
+            self._client = None
+            self._clients = []
+            self._rr = None
+
+    def _prep_vector(self, vector: Vector) -> np.ndarray:
+        """Validate a vector's shape and return it as contiguous float32.
+
+        Catches dimension mismatches before they cost a round-trip to the
+        server. With USE_DOT the vector is also L2-normalized.
+
+        Raises:
+            ValueError: If the vector is not EMBEDDING_DIM long
+        """
+        arr = np.array(vector, dtype=np.float32)
+        if arr.shape != (self.config.EMBEDDING_DIM,):
+            raise ValueError(
+                f"Expected vector of shape ({self.config.EMBEDDING_DIM},), got {arr.shape}"
+            )
+        if self.config.USE_DOT:
+            arr /= np.linalg.norm(arr) + 1e-12
+        return arr
+
+    def _distance(self) -> Distance:
+        """Distance metric for new collections (USE_DOT requires normalized vectors)."""
+        return Distance.DOT if self.config.USE_DOT else Distance.COSINE
+
+    def _as_vector(self, vector: Vector) -> list[float]:
+        """Convert a numpy vector to a plain float list at the client boundary.
+
+        qdrant-client models validate element by element, so handing them an
+        ndarray is far slower than a list; ndarray.tolist() does the
+        conversion in C. Lists are passed through untouched.
+        """
+        if isinstance(vector, np.ndarray):
+            return vector.astype(self.config.VECTOR_DTYPE, copy=False).tolist()
+        return vector
+
+    @staticmethod
+    def _prepare_payload(payload: dict[str, Any]) -> dict[str, Any]:
+        """Normalize numpy values in a payload to JSON-native types."""
+        if orjson is None:
+            return payload
+        return orjson.loads(
+            orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+        )
+
+    def _quantization_config(self) -> Optional[Union[ScalarQuantization, BinaryQuantization]]:
+        """Build the collection quantization config from QDRANT_QUANTIZATION."""
+        mode = self.config.QUANTIZATION.lower()
+        if mode == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                ),
+            )
+        if mode == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _search_params(self, limit: int) -> SearchParams:
+        """Search params sized to the result limit.
+
+        hnsw_ef scales with the limit so large result sets keep their
+        recall; binary quantization additionally rescores oversampled hits.
+        """
+        oversampling = (
+            self.config.BINARY_OVERSAMPLING if self.config.QUANTIZATION.lower() == "binary" else None
+        )
+        return _search_params(max(self.config.HNSW_EF_MIN, limit * 4), oversampling)
+
+    @staticmethod
+    def _vector_key(vector: Vector) -> int:
+        """Hash a query vector for result caching.
+
+        Lists and arrays with the same float32 values map to the same key.
+        With xxhash installed the array buffer is hashed in place (no copy).
+        """
+        v32 = np.ascontiguousarray(vector, dtype=np.float32)
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(v32)
+        return hash(v32.tobytes())
+
+    async def _invalidate(self, collection_name: str):
+        """Drop cached search results for a collection after a write."""
+        cache = self._search_cache.get(collection_name)
+        if cache is not None:
+            await cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Return hit/miss statistics for the search result caches."""
+        return {name: cache.stats() for name, cache in self._search_cache.items()}
 
     @property
     def client(self) -> AsyncQdrantClient:
-        """Get the underlying async client."""
+        """Get the next async client from the pool (round-robin)."""
         if self._client is None:
             raise RuntimeError("Qdrant client not initialized - call get_instance() first")
-        return self._client
+        return next(self._rr) if self._rr is not None else self._client
+
+    def _available(self) -> bool:
+        """Whether Qdrant is configured and the circuit breaker allows a call."""
+        return self._client is not None and self._breaker.allow()
+
+    async def _call(self, awaitable):
+        """Await an RPC, recording the outcome on the circuit breaker."""
+        try:
+            result = await awaitable
+        except Exception as e:
+            if self._breaker.is_connection_error(e):
+                self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return result
 
     async def ensure_collections(self):
         """Create collections if they don't exist.
@@ -120,51 +563,77 @@ class QdrantClient:
         Creates:
         - brands: Brand profile embeddings with metadata filtering
         - ad_creatives: Ad copy embeddings with performance data
+
+        Collections that already exist are reconciled: any expected payload
+        index they lack (e.g. a field added after they were created) is
+        created, since filtering on an unindexed field is a full scan.
         """
         if self._client is None:
             logger.warning("Qdrant client not initialized, skipping collection creation")
             return
 
-        # Get existing collections
-        collections = await self._client.get_collections()
-        existing = {c.name for c in collections.collections}
-
-        # Create brands collection
-        if self.config.COLLECTION_BRANDS not in existing:
-            await self._client.create_collection(
-                collection_name=self.config.COLLECTION_BRANDS,
-                vectors_config=VectorParams(
-                    size=self.config.EMBEDDING_DIM,
-                    distance=Distance.COSINE,
-                ),
-            )
+        # Existing collections and their indexes (cached, so warm calls are free)
+        existing = await self._refresh_schema()
 
-            # Create payload indexes for filtering
-            for field_name, field_type in [
-                ("brand_name", PayloadSchemaType.KEYWORD),
-                ("industry", PayloadSchemaType.KEYWORD),
-                ("confidence_score", PayloadSchemaType.FLOAT),
-            ]:
-                await self._client.create_payload_index(
-                    collection_name=self.config.COLLECTION_BRANDS,
-                    field_name=field_name,
-                    field_schema=field_type,
-                )
+        # Create missing collections / reconcile existing ones concurrently
+        await asyncio.gather(*(
+            self._reconcile_payload_indexes(collection_name, indexes)
+            if collection_name in existing
+            else self._create_collection(collection_name, indexes)
+            for collection_name, indexes in self._payload_indexes().items()
+        ))
 
-            logger.info(f"Created collection: {self.config.COLLECTION_BRANDS}")
+    async def _refresh_schema(self, force: bool = False) -> dict[str, dict[str, PayloadSchemaType]]:
+        """Fetch the payload schema of each managed collection.
 
-        # Create ad_creatives collection
-        if self.config.COLLECTION_AD_CREATIVES not in existing:
-            await self._client.create_collection(
-                collection_name=self.config.COLLECTION_AD_CREATIVES,
-                vectors_config=VectorParams(
-                    size=self.config.EMBEDDING_DIM,
-                    distance=Distance.COSINE,
-                ),
-            )
+        Collections are fetched concurrently and the result is cached for
+        SCHEMA_CACHE_TTL seconds. Collections that don't exist are absent
+        from the result.
+
+        Args:
+            force: Refetch even if the cache is still fresh
+
+        Returns:
+            Collection name -> {indexed field: schema type}
+        """
+        if (
+            not force
+            and self._schema_fetched_at is not None
+            and time.monotonic() - self._schema_fetched_at < self.config.SCHEMA_CACHE_TTL
+        ):
+            return self._schema_cache
+
+        names = list(self._payload_indexes())
+        infos = await asyncio.gather(
+            *(self._client.get_collection(name) for name in names),
+            return_exceptions=True,
+        )
+
+        schema = {}
+        for name, info in zip(names, infos):
+            if isinstance(info, Exception):
+                # Missing collections raise; anything else is a real error
+                if await self._client.collection_exists(name):
+                    raise info
+                continue
+            schema[name] = {
+                field_name: index.data_type
+                for field_name, index in (info.payload_schema or {}).items()
+            }
+
+        self._schema_cache = schema
+        self._schema_fetched_at = time.monotonic()
+        return schema
 
-            # Create payload indexes for filtering
-            for field_name, field_type in [
+    def _payload_indexes(self) -> dict[str, list[tuple[str, PayloadSchemaType]]]:
+        """Payload indexes required for filtering, per collection."""
+        return {
+            self.config.COLLECTION_BRANDS: [
+                ("brand_name", PayloadSchemaType.KEYWORD),
+                ("industry", PayloadSchemaType.KEYWORD),
+                ("confidence_score", PayloadSchemaType.FLOAT),
+            ],
+            self.config.COLLECTION_AD_CREATIVES: [
                 ("campaign_id", PayloadSchemaType.KEYWORD),
                 ("copy_variant_id", PayloadSchemaType.KEYWORD),
                 ("angle", PayloadSchemaType.KEYWORD),
@@ -172,121 +641,547 @@ class QdrantClient:
                 ("platform", PayloadSchemaType.KEYWORD),
                 ("performance_score", PayloadSchemaType.FLOAT),
                 ("is_approved", PayloadSchemaType.BOOL),
-            ]:
-                await self._client.create_payload_index(
-                    collection_name=self.config.COLLECTION_AD_CREATIVES,
+            ],
+        }
+
+    async def _create_collection(
+        self,
+        collection_name: str,
+        indexes: list[tuple[str, PayloadSchemaType]],
+    ):
+        """Create a collection and its payload indexes."""
+        await self._client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(
+                size=self.config.EMBEDDING_DIM,
+                distance=self._distance(),
+            ),
+            hnsw_config=HnswConfigDiff(
+                m=self.config.HNSW_M,
+                ef_construct=self.config.HNSW_EF_CONSTRUCT,
+                full_scan_threshold=self.config.HNSW_FULL_SCAN_THRESHOLD,
+                payload_m=self.config.HNSW_PAYLOAD_M,
+            ),
+            quantization_config=self._quantization_config(),
+        )
+
+        # Create payload indexes for filtering (independent requests, sent together)
+        await self._create_payload_indexes(collection_name, indexes)
+
+        logger.info(f"Created collection: {collection_name}")
+
+    async def _create_payload_indexes(
+        self,
+        collection_name: str,
+        indexes: list[tuple[str, PayloadSchemaType]],
+    ):
+        """Create payload indexes concurrently, ignoring ones that already exist."""
+        results = await asyncio.gather(
+            *(
+                self._client.create_payload_index(
+                    collection_name=collection_name,
                     field_name=field_name,
                     field_schema=field_type,
                 )
+                for field_name, field_type in indexes
+            ),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception) and "already exists" not in str(result).lower():
+                raise result
 
-            logger.info(f"Created collection: {self.config.COLLECTION_AD_CREATIVES}")
+        self._schema_cache.setdefault(collection_name, {}).update(indexes)
+
+    async def _reconcile_payload_indexes(
+        self,
+        collection_name: str,
+        indexes: list[tuple[str, PayloadSchemaType]],
+    ):
+        """Create any expected payload indexes missing from an existing collection."""
+        indexed = self._schema_cache.get(collection_name, {})
+        missing = [
+            (field_name, field_type)
+            for field_name, field_type in indexes
+            if field_name not in indexed
+        ]
+        if missing:
+            logger.warning(
+                f"Collection {collection_name} is missing payload indexes "
+                f"{[field_name for field_name, _ in missing]} - creating them"
+            )
+            await self._create_payload_indexes(collection_name, missing)
+
+    def _check_indexed(self, collection_name: str, filters: Optional[Filter]):
+        """Warn (once per field) when a search filters on an unindexed payload field."""
+        indexed = self._schema_cache.get(collection_name)
+        if filters is None or indexed is None:
+            return
+
+        for condition in (filters.must or []) + (filters.must_not or []):
+            key = getattr(condition, "key", None)
+            if key is None or key in indexed or (collection_name, key) in self._unindexed_warned:
+                continue
+            self._unindexed_warned.add((collection_name, key))
+            logger.warning(
+                f"Filtering {collection_name} on unindexed payload field '{key}' "
+                f"(full scan) - run ensure_collections() to create the index"
+            )
 
     async def upsert_brand(
         self,
         point_id: str,
-        vector: list[float],
+        vector: Vector,
         payload: dict[str, Any],
     ) -> bool:
         """Upsert a brand embedding.
 
         Args:
             point_id: Unique identifier (e.g., "brand_{campaign_id}")
-            vector: Embedding vector (1536 dimensions)
+            vector: Embedding vector (1536 dimensions, list or numpy array)
             payload: Brand metadata (brand_name, industry, etc.)
 
         Returns:
-            True if successful
+            True if queued, False if Qdrant is unavailable. Write errors
+            surface from flush() and in failed_points.
+
+        Raises:
+            ValueError: If the vector has the wrong dimension
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, skipping brand upsert")
             return False
 
         point = PointStruct(
             id=point_id,
-            vector=vector,
-            payload=payload,
+            vector=self._as_vector(self._prep_vector(vector)),
+            payload=self._prepare_payload(payload),
         )
 
-        result = await self._client.upsert(
-            collection_name=self.config.COLLECTION_BRANDS,
-            points=[point],
-            wait=False,
-        )
+        await self._enqueue(self.config.COLLECTION_BRANDS, point)
 
-        logger.info(f"Upserted brand: {point_id}")
+        logger.info(f"Queued brand upsert: {point_id}")
         return True
 
     async def upsert_ad_creative(
         self,
         point_id: str,
-        vector: list[float],
+        vector: Vector,
         payload: dict[str, Any],
     ) -> bool:
         """Upsert an ad creative embedding.
 
         Args:
             point_id: Unique identifier (e.g., "variant_{variant_id}")
-            vector: Embedding vector (1536 dimensions)
+            vector: Embedding vector (1536 dimensions, list or numpy array)
             payload: Ad metadata (headline, angle, emotion, score, etc.)
 
         Returns:
-            True if successful
+            True if queued, False if Qdrant is unavailable. Write errors
+            surface from flush() and in failed_points.
+
+        Raises:
+            ValueError: If the vector has the wrong dimension
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, skipping ad creative upsert")
             return False
 
         point = PointStruct(
             id=point_id,
-            vector=vector,
-            payload=payload,
+            vector=self._as_vector(self._prep_vector(vector)),
+            payload=self._prepare_payload(payload),
         )
 
-        result = await self._client.upsert(
-            collection_name=self.config.COLLECTION_AD_CREATIVES,
-            points=[point],
-            wait=False,
-        )
+        await self._enqueue(self.config.COLLECTION_AD_CREATIVES, point)
 
-        logger.info(f"Upserted ad creative: {point_id}")
+        logger.info(f"Queued ad creative upsert: {point_id}")
         return True
 
+    async def _enqueue(self, collection_name: str, point: PointStruct):
+        """Queue a point for the batched writer, starting the writer on first use."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        await self._ingest_queue.put((collection_name, point))
+
+    async def _flush_loop(self):
+        """Drain queued single-point upserts into batched upsert calls.
+
+        Collects up to UPSERT_BATCH_SIZE points, or whatever arrived within
+        UPSERT_FLUSH_INTERVAL of the first one, then writes them grouped by
+        collection.
+        """
+        while True:
+            pending = await self._drain_batch(
+                self._ingest_queue,
+                self.config.UPSERT_BATCH_SIZE,
+                self.config.UPSERT_FLUSH_INTERVAL,
+            )
+            await self._write_pending(pending)
+
+    @staticmethod
+    async def _drain_batch(queue: asyncio.Queue, max_items: int, window: float) -> list:
+        """Wait for one queue item, then collect more until max_items or window elapses."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + window
+
+        while len(batch) < max_items:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _write_pending(self, pending: list[tuple[str, PointStruct]]):
+        """Write queued points, one upsert per collection.
+
+        Points that can't be written (circuit open or the upsert failed) are
+        counted in failed_points and the error is kept for flush() to raise.
+        """
+        by_collection: dict[str, list[PointStruct]] = {}
+        for collection_name, point in pending:
+            by_collection.setdefault(collection_name, []).append(point)
+
+        try:
+            if not self._breaker.allow():
+                self._record_flush_failure(
+                    len(pending), ConnectionError("Qdrant circuit open"),
+                )
+                return
+            for collection_name, points in by_collection.items():
+                try:
+                    await self._call(self.client.upsert(
+                        collection_name=collection_name,
+                        points=points,
+                        wait=False,
+                    ))
+                except Exception as e:
+                    self._record_flush_failure(len(points), e)
+                    continue
+                await self._invalidate(collection_name)
+                logger.debug(f"Flushed {len(points)} queued points to {collection_name}")
+        finally:
+            for _ in pending:
+                self._ingest_queue.task_done()
+
+    def _record_flush_failure(self, count: int, error: Exception):
+        """Count queued points that were dropped and remember why."""
+        self.failed_points += count
+        self._flush_error = error
+        logger.error(f"Failed to write {count} queued points: {error}")
+
+    async def flush(self):
+        """Wait until all queued upserts have been processed.
+
+        Raises:
+            Exception: The last write error since the previous flush(), if
+                any queued points could not be written
+        """
+        await self._ingest_queue.join()
+        error, self._flush_error = self._flush_error, None
+        if error is not None:
+            raise error
+
+    @retry_async(UPSERT_RETRY_CONFIG, is_retryable=_is_retryable_qdrant_error)
+    async def _send_batch(self, collection_name: str, batch: list[PointStruct], batch_number: int):
+        """Upsert one batch, retrying transient failures."""
+        await self._call(self.client.upsert(
+            collection_name=collection_name,
+            points=batch,
+            wait=False,
+        ))
+        logger.debug(f"Upserted batch {batch_number} ({len(batch)} points)")
+
     async def batch_upsert(
         self,
         collection_name: str,
-        points: list[PointStruct],
+        points: Iterable[PointStruct],
         batch_size: int = 100,
+        parallel: Optional[int] = None,
     ) -> bool:
         """Batch upsert points for efficiency.
 
+        Points are consumed lazily, so callers can stream them from a
+        generator without materializing the full list. Up to `parallel`
+        batches are in flight at once; transient failures are retried
+        with backoff.
+
         Args:
             collection_name: Target collection
-            points: List of PointStruct to upsert
+            points: PointStructs to upsert (list or any iterable)
             batch_size: Number of points per batch
+            parallel: Max concurrent batch requests (default QDRANT_MAX_INFLIGHT)
 
         Returns:
             True if successful
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, skipping batch upsert")
             return False
 
-        total = len(points)
-        for i in range(0, total, batch_size):
-            batch = points[i : i + batch_size]
-            await self._client.upsert(
+        # Acquire before scheduling so at most `parallel` batches are buffered
+        semaphore = asyncio.Semaphore(parallel or self.config.MAX_INFLIGHT)
+        tasks = []
+        total = 0
+        for batch_number, batch in enumerate(_chunks(points, batch_size), start=1):
+            await semaphore.acquire()
+            task = asyncio.create_task(self._send_batch(collection_name, batch, batch_number))
+            task.add_done_callback(lambda _: semaphore.release())
+            tasks.append(task)
+            total += len(batch)
+
+        await asyncio.gather(*tasks)
+
+        await self._invalidate(collection_name)
+        logger.info(f"Batch upserted {total} points to {collection_name}")
+        return True
+
+    async def bulk_load(
+        self,
+        collection_name: str,
+        points: Iterable[PointStruct],
+        parallel: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> bool:
+        """Bulk load points with parallel upload workers.
+
+        HNSW indexing is disabled for the duration of the load and restored
+        afterwards, so the index is built once instead of incrementally.
+
+        Args:
+            collection_name: Target collection
+            points: Points to load (any iterable, consumed lazily)
+            parallel: Number of upload workers (default BULK_LOAD_PARALLEL)
+            batch_size: Points per request (default BULK_LOAD_BATCH_SIZE)
+
+        Returns:
+            True if successful
+        """
+        if not self._available():
+            logger.warning("Qdrant not available, skipping bulk load")
+            return False
+
+        # Restore whatever threshold the collection had, not a fixed default
+        info = await self._call(self._client.get_collection(collection_name))
+        indexing_threshold = info.config.optimizer_config.indexing_threshold
+        if indexing_threshold is None:
+            indexing_threshold = self.config.DEFAULT_INDEXING_THRESHOLD
+
+        await self._call(self._client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+        ))
+        try:
+            # upload_points is synchronous (it drives its own worker clients)
+            await self._call(asyncio.to_thread(
+                self._client.upload_points,
                 collection_name=collection_name,
-                points=batch,
+                points=points,
+                batch_size=batch_size or self.config.BULK_LOAD_BATCH_SIZE,
+                parallel=parallel or self.config.BULK_LOAD_PARALLEL,
                 wait=False,
-            )
-            logger.debug(f"Upserted batch {i // batch_size + 1}/{(total - 1) // batch_size + 1}")
+            ))
+        finally:
+            await self._call(self._client.update_collection(
+                collection_name=collection_name,
+                optimizers_config=OptimizersConfigDiff(
+                    indexing_threshold=indexing_threshold,
+                ),
+            ))
 
-        logger.info(f"Batch upserted {total} points to {collection_name}")
+        await self._invalidate(collection_name)
+        logger.info(f"Bulk loaded points to {collection_name}")
         return True
 
+    async def ingest_stream(
+        self,
+        collection_name: str,
+        items: AsyncIterable[tuple[str, str, dict[str, Any]]],
+        embedder: "EmbeddingService",
+        batch_size: int = 100,
+        parallel: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """Embed and upsert a stream of items with the two stages overlapped.
+
+        A producer embeds items in groups of INGEST_EMBED_BATCH_SIZE while a
+        consumer upserts the resulting points, so throughput approaches the
+        slower stage instead of the sum of both. The queue between them is
+        bounded by INGEST_QUEUE_SIZE.
+
+        Args:
+            collection_name: Target collection
+            items: Async iterable of (point_id, text, payload)
+            embedder: Embedding service used to embed the texts
+            batch_size: Number of points per upsert
+            parallel: Max concurrent upserts (default QDRANT_MAX_INFLIGHT)
+
+        Returns:
+            Ingestion metrics (points, seconds, embed/upsert rates, max queue length)
+        """
+        stats = {
+            "points": 0,
+            "seconds": 0.0,
+            "embed_per_sec": 0.0,
+            "upsert_per_sec": 0.0,
+            "max_queue": 0,
+        }
+        if not self._available():
+            logger.warning("Qdrant not available, skipping stream ingestion")
+            return stats
+
+        queue: asyncio.Queue[Optional[PointStruct]] = asyncio.Queue(
+            maxsize=self.config.INGEST_QUEUE_SIZE,
+        )
+        embedded = 0
+        embed_seconds = 0.0
+
+        async def produce():
+            nonlocal embedded, embed_seconds
+            async for group in _achunks(items, self.config.INGEST_EMBED_BATCH_SIZE):
+                point_ids, texts, payloads = zip(*group)
+                started = time.perf_counter()
+                vectors = await embedder.embed_batch(list(texts))
+                embed_seconds += time.perf_counter() - started
+                embedded += len(group)
+
+                for point_id, vector, payload in zip(point_ids, vectors, payloads):
+                    await queue.put(PointStruct(
+                        id=point_id,
+                        vector=self._as_vector(self._prep_vector(vector)),
+                        payload=self._prepare_payload(payload),
+                    ))
+                stats["max_queue"] = max(stats["max_queue"], queue.qsize())
+            # On failure the consumer is cancelled instead
+            await queue.put(None)
+
+        async def consume():
+            semaphore = asyncio.Semaphore(parallel or self.config.MAX_INFLIGHT)
+            tasks = []
+            batch_number = 0
+            done = False
+            while not done:
+                batch = []
+                while len(batch) < batch_size:
+                    point = await queue.get()
+                    if point is None:
+                        done = True
+                        break
+                    batch.append(point)
+                if not batch:
+                    continue
+
+                batch_number += 1
+                await semaphore.acquire()
+                task = asyncio.create_task(self._send_batch(collection_name, batch, batch_number))
+                task.add_done_callback(lambda _: semaphore.release())
+                tasks.append(task)
+                stats["points"] += len(batch)
+            await asyncio.gather(*tasks)
+
+        started = time.perf_counter()
+        producer = asyncio.create_task(produce())
+        consumer = asyncio.create_task(consume())
+        try:
+            await asyncio.gather(producer, consumer)
+        except BaseException:
+            producer.cancel()
+            consumer.cancel()
+            raise
+        elapsed = time.perf_counter() - started
+
+        await self._invalidate(collection_name)
+
+        stats["seconds"] = elapsed
+        stats["embed_per_sec"] = embedded / embed_seconds if embed_seconds else 0.0
+        stats["upsert_per_sec"] = stats["points"] / elapsed if elapsed else 0.0
+        logger.info(
+            f"Ingested {stats['points']} points to {collection_name} in {elapsed:.1f}s "
+            f"({stats['upsert_per_sec']:.0f} points/s)"
+        )
+        return stats
+
+    async def _coalesce_search(
+        self,
+        collection_name: str,
+        query_vector: Vector,
+        filters: Optional[Filter],
+        limit: int,
+        score_threshold: float,
+    ) -> list[ScoredPoint]:
+        """Run a search, batching it with concurrent searches on the same collection.
+
+        Requests arriving within COALESCE_MS of each other (up to
+        COALESCE_MAX_BATCH) are sent as a single query_batch_points call.
+        """
+        if self.config.COALESCE_MS <= 0:
+            response = await self._call(self.client.query_points(
+                collection_name=collection_name,
+                query=self._as_vector(query_vector),
+                query_filter=filters,
+                search_params=self._search_params(limit),
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+            ))
+            return response.points
+
+        queue = self._search_queues.get(collection_name)
+        if queue is None:
+            queue = self._search_queues[collection_name] = asyncio.Queue()
+            self._search_tasks[collection_name] = asyncio.create_task(
+                self._search_batch_loop(collection_name, queue)
+            )
+
+        request = QueryRequest(
+            query=self._as_vector(query_vector),
+            filter=filters,
+            params=self._search_params(limit),
+            limit=limit,
+            score_threshold=score_threshold,
+            with_payload=True,
+        )
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((request, future))
+        return await future
+
+    async def _search_batch_loop(self, collection_name: str, queue: asyncio.Queue):
+        """Send queued searches for a collection as batched requests."""
+        while True:
+            pending = await self._drain_batch(
+                queue,
+                self.config.COALESCE_MAX_BATCH,
+                self.config.COALESCE_MS / 1000,
+            )
+            pending = [(request, future) for request, future in pending if not future.done()]
+            if not pending:
+                continue
+
+            try:
+                responses = await self._call(self.client.query_batch_points(
+                    collection_name=collection_name,
+                    requests=[request for request, _ in pending],
+                ))
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), response in zip(pending, responses):
+                if not future.done():
+                    future.set_result(response.points)
+
+            logger.debug(f"Coalesced {len(pending)} searches on {collection_name}")
+
     async def search_similar_brands(
         self,
-        query_vector: list[float],
+        query_vector: Vector,
         limit: int = 10,
         min_confidence: float = 0.7,
         exclude_brand_name: Optional[str] = None,
@@ -302,50 +1197,36 @@ class QdrantClient:
         Returns:
             List of similar brands with scores
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, returning empty results")
             return []
 
-        # Build filter
-        must_conditions = [
-            FieldCondition(
-                key="confidence_score",
-                range=Range(gte=min_confidence),
-            ),
-        ]
+        query_vector = self._prep_vector(query_vector)
 
-        must_not = []
-        if exclude_brand_name:
-            must_not.append(
-                FieldCondition(
-                    key="brand_name",
-                    match=MatchValue(value=exclude_brand_name),
-                )
-            )
+        cache = self._search_cache[self.config.COLLECTION_BRANDS]
+        cache_key = (self._vector_key(query_vector), limit, min_confidence, exclude_brand_name)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _copy_hits(cached)
 
-        filters = Filter(must=must_conditions, must_not=must_not if must_not else None)
+        filters = _brand_filter(min_confidence, exclude_brand_name)
+        self._check_indexed(self.config.COLLECTION_BRANDS, filters)
 
-        results = await self._client.search(
+        results = await self._coalesce_search(
             collection_name=self.config.COLLECTION_BRANDS,
             query_vector=query_vector,
-            query_filter=filters,
+            filters=filters,
             limit=limit,
             score_threshold=0.6,
-            with_payload=True,
         )
 
-        return [
-            {
-                "id": hit.id,
-                "score": hit.score,
-                "payload": hit.payload,
-            }
-            for hit in results
-        ]
+        hits = _to_hits(results)
+        await cache.set(cache_key, hits)
+        return _copy_hits(hits)
 
     async def search_similar_ads(
         self,
-        query_vector: list[float],
+        query_vector: Vector,
         limit: int = 10,
         angle: Optional[str] = None,
         min_performance: float = 0.0,
@@ -363,56 +1244,34 @@ class QdrantClient:
         Returns:
             List of similar ads with scores
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, returning empty results")
             return []
 
-        # Build filter
-        must_conditions = []
-
-        if min_performance > 0:
-            must_conditions.append(
-                FieldCondition(
-                    key="performance_score",
-                    range=Range(gte=min_performance),
-                )
-            )
-
-        if angle:
-            must_conditions.append(
-                FieldCondition(
-                    key="angle",
-                    match=MatchValue(value=angle),
-                )
-            )
+        query_vector = self._prep_vector(query_vector)
 
-        if only_approved:
-            must_conditions.append(
-                FieldCondition(
-                    key="is_approved",
-                    match=MatchValue(value=True),
-                )
-            )
+        cache = self._search_cache[self.config.COLLECTION_AD_CREATIVES]
+        cache_key = (
+            self._vector_key(query_vector), limit, angle, min_performance, only_approved,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _copy_hits(cached)
 
-        filters = Filter(must=must_conditions) if must_conditions else None
+        filters = _ad_filter(angle, min_performance, only_approved)
+        self._check_indexed(self.config.COLLECTION_AD_CREATIVES, filters)
 
-        results = await self._client.search(
+        results = await self._coalesce_search(
             collection_name=self.config.COLLECTION_AD_CREATIVES,
             query_vector=query_vector,
-            query_filter=filters,
+            filters=filters,
             limit=limit,
             score_threshold=0.5,
-            with_payload=True,
         )
 
-        return [
-            {
-                "id": hit.id,
-                "score": hit.score,
-                "payload": hit.payload,
-            }
-            for hit in results
-        ]
+        hits = _to_hits(results)
+        await cache.set(cache_key, hits)
+        return _copy_hits(hits)
 
     async def update_ad_performance(
         self,
@@ -430,25 +1289,88 @@ class QdrantClient:
         Returns:
             True if successful
         """
-        if self._client is None:
+        if not self._available():
             logger.warning("Qdrant not available, skipping performance update")
             return False
 
-        await self._client.set_payload(
+        await self._call(self.client.set_payload(
             collection_name=self.config.COLLECTION_AD_CREATIVES,
             payload={
                 "performance_score": performance_score,
                 "is_approved": is_approved,
             },
             points=[point_id],
-        )
+        ))
+        await self._invalidate(self.config.COLLECTION_AD_CREATIVES)
 
         logger.info(f"Updated performance for {point_id}: score={performance_score}")
         return True
 
+    async def update_ad_performance_many(
+        self,
+        updates: Iterable[tuple[str, float, bool]],
+    ) -> bool:
+        """Update performance data for many ad creatives in one request.
+
+        Points sharing the same (performance_score, is_approved) values are
+        grouped into a single set_payload operation, and all groups are sent
+        together via batch_update_points.
+
+        Args:
+            updates: (point_id, performance_score, is_approved) tuples
+
+        Returns:
+            True if successful
+        """
+        if not self._available():
+            logger.warning("Qdrant not available, skipping performance updates")
+            return False
+
+        groups: dict[tuple[float, bool], list[str]] = {}
+        for point_id, performance_score, is_approved in updates:
+            groups.setdefault((performance_score, is_approved), []).append(point_id)
+
+        if not groups:
+            return True
+
+        await self._call(self.client.batch_update_points(
+            collection_name=self.config.COLLECTION_AD_CREATIVES,
+            update_operations=[
+                SetPayloadOperation(
+                    set_payload=SetPayload(
+                        payload={
+                            "performance_score": performance_score,
+                            "is_approved": is_approved,
+                        },
+                        points=point_ids,
+                    )
+                )
+                for (performance_score, is_approved), point_ids in groups.items()
+            ],
+        ))
+        await self._invalidate(self.config.COLLECTION_AD_CREATIVES)
+
+        count = sum(len(point_ids) for point_ids in groups.values())
+        logger.info(f"Updated performance for {count} ad creatives ({len(groups)} groups)")
+        return True
+
     async def close(self):
         """Close the client connection."""
-        if self._client:
+        if self._flush_task is not None:
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Queued upserts lost on close: {e}")
+            self._flush_task.cancel()
+            self._flush_task = None
+        for task in self._search_tasks.values():
+            task.cancel()
+        self._search_tasks.clear()
+        self._search_queues.clear()
+        if self._clients:
+            await asyncio.gather(*(c.close() for c in self._clients))
+            logger.info(f"Closed {len(self._clients)} Qdrant clients")
+        elif self._client:
             await self._client.close()
             logger.info("Closed Qdrant client")
 
@@ -3,19 +3,35 @@
 Test modules with mocked external dependencies.
 """
 
+import asyncio
+import math
+from itertools import pairwise
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from src.analyzers.ab_test_planner import ABTestRequest
+from src.analyzers.audience_targeting import AudienceRequest
+from src.analyzers.budget_simulator import (
+    BudgetRequest, Industry, CampaignGoal, INDUSTRY_BENCHMARKS,
+)
+from src.analyzers.iteration_assistant import (
+    IterationRequest, PerformanceIssue, IssueSeverity,
+)
+from src.analyzers.landing_page_analyzer import LandingPageRequest
+from src.analyzers.platform_recommender import (
+    PlatformRequest, ProductType, AudienceType,
+)
+from src.extractors.social_proof_collector import SocialProofRequest
+from src.generators.hook_generator import HookGeneratorRequest, HookPattern
+
 
 class TestHookGeneratorComponent:
     """Component tests for Hook Generator."""
 
-    @pytest.mark.asyncio
-    async def test_hook_generator_with_claude_mock(self):
-        """Test hook generator with mocked Claude API."""
-        from src.generators.hook_generator import HookGenerator, HookGeneratorRequest
-        
-        generator = HookGenerator()
+    async def test_hook_generator_basic(self, hook_generator):
+        """Test hook generation (mocked Claude API) and patterns in one pass."""
+        # Generation works even without Claude API
         request = HookGeneratorRequest(
             product_name="TestProduct",
             product_description="A test product",
@@ -23,20 +39,14 @@ class TestHookGeneratorComponent:
             num_hooks=5,
         )
         
-        result = await generator.generate(request)
+        result = await hook_generator.generate(request)
         
-        # Component should work even without Claude API
         assert len(result.hooks) == 5
         assert result.best_hook is not None
         assert all(0 <= h.score <= 100 for h in result.hooks)
-
-    @pytest.mark.asyncio
-    async def test_hook_patterns_isolated(self):
-        """Test hook patterns work in isolation."""
-        from src.generators.hook_generator import HookGenerator, HookPattern
         
-        generator = HookGenerator()
-        patterns = generator.get_patterns()
+        # Patterns are available in isolation
+        patterns = hook_generator.get_patterns()
         
         assert len(patterns) == 10
         pattern_ids = [p["id"] for p in patterns]
@@ -47,12 +57,8 @@ class TestHookGeneratorComponent:
 class TestLandingAnalyzerComponent:
     """Component tests for Landing Page Analyzer."""
 
-    @pytest.mark.asyncio
-    async def test_analyzer_without_network(self):
+    async def test_analyzer_without_network(self, landing_page_analyzer):
         """Test analyzer works without actual page fetch."""
-        from src.analyzers.landing_page_analyzer import LandingPageAnalyzer, LandingPageRequest
-        
-        analyzer = LandingPageAnalyzer()
         request = LandingPageRequest(
             landing_page_url="https://example.com",
             ad_headline="Test Headline",
@@ -60,18 +66,14 @@ class TestLandingAnalyzerComponent:
             ad_cta="Click Here",
         )
         
-        result = await analyzer.analyze(request)
+        result = await landing_page_analyzer.analyze(request)
         
         # Should return simulated scores
         assert 0 <= result.overall_score <= 100
         assert result.message_match_level is not None
 
-    @pytest.mark.asyncio
-    async def test_message_match_scoring_isolated(self):
+    async def test_message_match_scoring_isolated(self, landing_page_analyzer):
         """Test message match scoring logic."""
-        from src.analyzers.landing_page_analyzer import LandingPageAnalyzer, LandingPageRequest
-        
-        analyzer = LandingPageAnalyzer()
         
         # High match scenario
         request = LandingPageRequest(
@@ -80,19 +82,15 @@ class TestLandingAnalyzerComponent:
             ad_primary_text="Increase your sales with our tool",
             ad_cta="Start Now",
         )
-        result = await analyzer.analyze(request)
+        result = await landing_page_analyzer.analyze(request)
         assert result.message_match_score >= 0
 
 
 class TestBudgetSimulatorComponent:
     """Component tests for Budget Simulator."""
 
-    @pytest.mark.asyncio
-    async def test_budget_calculation_logic(self):
+    async def test_budget_calculation_logic(self, budget_simulator):
         """Test budget calculation without external services."""
-        from src.analyzers.budget_simulator import BudgetSimulator, BudgetRequest, Industry, CampaignGoal
-        
-        simulator = BudgetSimulator()
         request = BudgetRequest(
             industry=Industry.SAAS,
             goal=CampaignGoal.LEADS,
@@ -100,64 +98,46 @@ class TestBudgetSimulatorComponent:
             target_monthly_conversions=50,
         )
         
-        result = await simulator.simulate(request)
+        result = await budget_simulator.simulate(request)
         
         # Verify calculation logic
         assert result.daily_budget > 0
-        assert result.monthly_budget == pytest.approx(result.daily_budget * 30, rel=0.01)
+        assert math.isclose(result.monthly_budget, result.daily_budget * 30, rel_tol=0.01)
         assert result.expected_cpa > 0
 
-    @pytest.mark.asyncio
-    async def test_all_industries_have_benchmarks(self):
+    @pytest.mark.parametrize("industry", list(Industry))
+    def test_all_industries_have_benchmarks(self, industry):
         """Test benchmark data completeness."""
-        from src.analyzers.budget_simulator import INDUSTRY_BENCHMARKS, Industry
-        
-        for industry in Industry:
-            assert industry in INDUSTRY_BENCHMARKS
-            bench = INDUSTRY_BENCHMARKS[industry]
-            assert "cpm" in bench
-            assert "ctr" in bench
-            assert "cvr" in bench
+        assert industry in INDUSTRY_BENCHMARKS
+        assert {"cpm", "ctr", "cvr"} <= INDUSTRY_BENCHMARKS[industry].keys()
 
 
 class TestPlatformRecommenderComponent:
     """Component tests for Platform Recommender."""
 
-    @pytest.mark.asyncio
-    async def test_scoring_algorithm(self):
+    async def test_scoring_algorithm(self, platform_recommender):
         """Test platform scoring without external data."""
-        from src.analyzers.platform_recommender import (
-            PlatformRecommender, PlatformRequest, ProductType, AudienceType
-        )
-        
-        recommender = PlatformRecommender()
         request = PlatformRequest(
             product_type=ProductType.B2B_SAAS,
             audience_type=AudienceType.FOUNDERS,
             monthly_budget=2000,
         )
         
-        result = await recommender.recommend(request)
+        result = await platform_recommender.recommend(request)
         
         # Verify scoring logic
         scores = [r.score for r in result.recommendations]
-        assert scores == sorted(scores, reverse=True)  # Should be sorted
+        assert all(a >= b for a, b in pairwise(scores))  # Should be sorted
 
-    @pytest.mark.asyncio
-    async def test_budget_allocation_sums_correctly(self):
+    async def test_budget_allocation_sums_correctly(self, platform_recommender):
         """Test budget allocation logic."""
-        from src.analyzers.platform_recommender import (
-            PlatformRecommender, PlatformRequest, ProductType, AudienceType
-        )
-        
-        recommender = PlatformRecommender()
         request = PlatformRequest(
             product_type=ProductType.ECOMMERCE,
             audience_type=AudienceType.CONSUMERS,
             monthly_budget=5000,
         )
         
-        result = await recommender.recommend(request)
+        result = await platform_recommender.recommend(request)
         
         total = sum(result.budget_allocation.values())
         assert total <= 100
@@ -166,12 +146,8 @@ class TestPlatformRecommenderComponent:
 class TestABTestPlannerComponent:
     """Component tests for A/B Test Planner."""
 
-    @pytest.mark.asyncio
-    async def test_sample_size_calculation(self):
+    async def test_sample_size_calculation(self, ab_test_planner):
         """Test statistical sample size calculation."""
-        from src.analyzers.ab_test_planner import ABTestPlanner, ABTestRequest
-        
-        planner = ABTestPlanner()
         request = ABTestRequest(
             variants=[{"headline": "A"}, {"headline": "B"}],
             baseline_ctr=1.0,
@@ -181,47 +157,38 @@ class TestABTestPlannerComponent:
             minimum_lift=0.20,
         )
         
-        result = await planner.plan(request)
+        result = await ab_test_planner.plan(request)
         
         # Sample size should be positive
         assert result.required_sample_size > 0
         # Days should be reasonable
         assert result.estimated_days >= 7
 
-    def test_significance_calculation_math(self):
+    @pytest.mark.parametrize(
+        "control_conv,control_vis,variant_conv,variant_vis,expected_lift",
+        [
+            pytest.param(50, 1000, 100, 1000, 100.0, id="clear-winner"),
+            pytest.param(50, 1000, 50, 1000, 0.0, id="no-difference"),
+        ],
+    )
+    def test_significance_calculation_math(
+        self, ab_test_planner, control_conv, control_vis, variant_conv, variant_vis, expected_lift
+    ):
         """Test statistical significance math."""
-        from src.analyzers.ab_test_planner import ABTestPlanner
-        
-        planner = ABTestPlanner()
-        
-        # Clear winner
-        result = planner.calculate_significance(
-            control_conversions=50,
-            control_visitors=1000,
-            variant_conversions=100,
-            variant_visitors=1000,
-        )
-        assert result["lift"] == 100.0  # 100% lift
-        
-        # No difference
-        result = planner.calculate_significance(
-            control_conversions=50,
-            control_visitors=1000,
-            variant_conversions=50,
-            variant_visitors=1000,
+        result = ab_test_planner.calculate_significance(
+            control_conversions=control_conv,
+            control_visitors=control_vis,
+            variant_conversions=variant_conv,
+            variant_visitors=variant_vis,
         )
-        assert result["lift"] == 0.0
+        assert result["lift"] == expected_lift
 
 
 class TestAudienceTargetingComponent:
     """Component tests for Audience Targeting."""
 
-    @pytest.mark.asyncio
-    async def test_interest_detection(self):
+    async def test_interest_detection(self, audience_targeting):
         """Test interest category detection logic."""
-        from src.analyzers.audience_targeting import AudienceTargeting, AudienceRequest
-        
-        targeting = AudienceTargeting()
         
         # Career-related product
         request = AudienceRequest(
@@ -229,24 +196,20 @@ class TestAudienceTargetingComponent:
             product_description="Resume and job application tool",
             target_persona="Job seekers",
         )
-        result = await targeting.suggest(request)
+        result = await audience_targeting.suggest(request)
         
         # Should detect career interests
         assert len(result.primary_audiences) > 0
 
-    @pytest.mark.asyncio
-    async def test_exclusion_logic(self):
+    async def test_exclusion_logic(self, audience_targeting):
         """Test exclusion generation logic."""
-        from src.analyzers.audience_targeting import AudienceTargeting, AudienceRequest
-        
-        targeting = AudienceTargeting()
         request = AudienceRequest(
             product_name="Test",
             product_description="Test product",
             target_persona="Users",
             price_point=500,  # High price
         )
-        result = await targeting.suggest(request)
+        result = await audience_targeting.suggest(request)
         
         # Should exclude low-income for high-priced products
         exclusion_names = [e.name.lower() for e in result.exclusions]
@@ -256,14 +219,8 @@ class TestAudienceTargetingComponent:
 class TestIterationAssistantComponent:
     """Component tests for Iteration Assistant."""
 
-    @pytest.mark.asyncio
-    async def test_issue_detection_logic(self):
+    async def test_issue_detection_logic(self, iteration_assistant):
         """Test issue detection thresholds."""
-        from src.analyzers.iteration_assistant import (
-            IterationAssistant, IterationRequest, PerformanceIssue, IssueSeverity
-        )
-        
-        assistant = IterationAssistant()
         
         # Bad CTR
         request = IterationRequest(
@@ -275,18 +232,14 @@ class TestIterationAssistantComponent:
             current_cpa=80,
             target_cpa=50,
         )
-        result = await assistant.analyze(request)
+        result = await iteration_assistant.analyze(request)
         
         ctr_issues = [d for d in result.diagnoses if d.issue == PerformanceIssue.LOW_CTR]
         assert len(ctr_issues) > 0
         assert ctr_issues[0].severity == IssueSeverity.CRITICAL
 
-    @pytest.mark.asyncio
-    async def test_improvement_generation(self):
+    async def test_improvement_generation(self, iteration_assistant):
         """Test improvement suggestion generation."""
-        from src.analyzers.iteration_assistant import IterationAssistant, IterationRequest
-        
-        assistant = IterationAssistant()
         request = IterationRequest(
             headline="Check out our product",
             primary_text="We have a product",
@@ -296,7 +249,7 @@ class TestIterationAssistantComponent:
             current_cpa=100,
             target_cpa=50,
         )
-        result = await assistant.analyze(request)
+        result = await iteration_assistant.analyze(request)
         
         # Should generate improvements
         assert len(result.improved_variants) > 0
@@ -307,12 +260,8 @@ class TestIterationAssistantComponent:
 class TestSocialProofComponent:
     """Component tests for Social Proof Collector."""
 
-    @pytest.mark.asyncio
-    async def test_trust_score_calculation(self):
+    async def test_trust_score_calculation(self, social_proof_collector):
         """Test trust score calculation logic."""
-        from src.extractors.social_proof_collector import SocialProofCollector, SocialProofRequest
-        
-        collector = SocialProofCollector()
         
         # Minimal proof
         minimal = SocialProofRequest(
@@ -320,7 +269,6 @@ class TestSocialProofComponent:
             brand_url="https://test.com",
             product_description="Test",
         )
-        minimal_result = await collector.collect(minimal)
         
         # Full proof
         full = SocialProofRequest(
@@ -332,24 +280,23 @@ class TestSocialProofComponent:
             rating=4.9,
             notable_customers=["Google", "Microsoft"],
         )
-        full_result = await collector.collect(full)
+        minimal_result, full_result = await asyncio.gather(
+            social_proof_collector.collect(minimal),
+            social_proof_collector.collect(full),
+        )
         
         # More proof = higher score
         assert full_result.trust_score > minimal_result.trust_score
 
-    @pytest.mark.asyncio
-    async def test_number_formatting(self):
+    async def test_number_formatting(self, social_proof_collector):
         """Test large number formatting."""
-        from src.extractors.social_proof_collector import SocialProofCollector, SocialProofRequest
-        
-        collector = SocialProofCollector()
         request = SocialProofRequest(
             brand_name="Test",
             brand_url="https://test.com",
             product_description="Test",
             user_count=2500000,  # 2.5M
         )
-        result = await collector.collect(request)
+        result = await social_proof_collector.collect(request)
         
         # Should format nicely
         stat_proofs = [p for p in result.proofs if p.type.value == "stat"]
@@ -2,148 +2,326 @@
 """Pytest configuration and shared fixtures for BrandTruth AI tests."""
 
 import asyncio
+import contextlib
 import json
 import os
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Generator
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from httpx import AsyncClient, ASGITransport
+import pytest_asyncio
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from api_server import app
-
 
 # =============================================================================
 # ASYNC FIXTURES
 # =============================================================================
 
+# Run async tests on uvloop when installed, like the app does (src/utils/runtime.py)
+try:
+    import uvloop
+except ImportError:
+    _LOOP_FACTORIES = {"asyncio": asyncio.new_event_loop}
+else:
+    _LOOP_FACTORIES = {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Event loop used by pytest-asyncio for every async test and fixture."""
+    return _LOOP_FACTORIES
+
+
+# Static catalog endpoints: their GET responses never change within a session
+_CACHEABLE_GETS = frozenset({
+    "/hooks/patterns",
+    "/platforms/list",
+    "/budget/benchmarks",
+    "/video/styles",
+    "/export/formats",
+})
+
+
+class _CachingClient:
+    """Wraps an AsyncClient, memoizing GETs of the static catalog endpoints.
+
+    Everything else (other paths, other methods) goes straight through.
+    """
+
+    def __init__(self, inner):
+        self._inner = inner
+        self._cache = {}
+
+    async def get(self, url, **kwargs):
+        if url not in _CACHEABLE_GETS or kwargs:
+            return await self._inner.get(url, **kwargs)
+        if url not in self._cache:
+            self._cache[url] = await self._inner.get(url)
+        return self._cache[url]
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+
+# orjson decodes response bodies faster than httpx's stdlib json.loads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+async def _orjson_response_hook(response) -> None:
+    """httpx response hook: decode ``response.json()`` with orjson."""
+    await response.aread()
+    content = response.content
+    response.json = lambda **kwargs: orjson.loads(content)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client() -> AsyncGenerator["AsyncClient", None]:
+    """Async HTTP client for API testing using ASGITransport (httpx 0.28+).
+
+    Shared by the whole session (all tests run in the session event loop,
+    see pytest.ini). The app is warmed up (OpenAPI schema built, one
+    request served) before the first test. With asgi-lifespan installed,
+    app startup/shutdown runs exactly once around the whole session
+    (ASGITransport itself never sends lifespan events). GETs of the static
+    catalog endpoints (_CACHEABLE_GETS) are served once and then memoized,
+    and ``response.json()`` decodes with orjson when it is installed.
+
+    With CONTRACT_REMOTE=1 the client talks to a running server at API_BASE
+    over real sockets instead, using requestx (a Rust-backed httpx drop-in)
+    when installed.
+    """
+    if os.getenv("CONTRACT_REMOTE"):
+        try:
+            import requestx as http_client
+        except ImportError:
+            import httpx as http_client
+
+        base_url = os.getenv("API_BASE", "http://localhost:8000")
+        async with http_client.AsyncClient(base_url=base_url, timeout=30.0) as client:
+            yield _CachingClient(client)
+        return
+
+    # Imported here so runs that never touch the API skip loading the app
+    from httpx import AsyncClient, ASGITransport
+    from api_server import app
+
+    try:
+        from asgi_lifespan import LifespanManager
+    except ImportError:
+        lifespan = contextlib.nullcontext(SimpleNamespace(app=app))
+    else:
+        lifespan = LifespanManager(app)
+
+    app.openapi()
+    async with lifespan as manager:
+        transport = ASGITransport(app=manager.app)
+        hooks = {"response": [_orjson_response_hook]} if orjson is not None else {}
+        async with AsyncClient(
+            transport=transport, base_url="http://test", event_hooks=hooks
+        ) as client:
+            await client.get("/health")
+            yield _CachingClient(client)
+
+
+# =============================================================================
+# SHARED INSTANCE FIXTURES
+# =============================================================================
+# The analyzers/generators hold no per-request state, so one instance per
+# session serves every test.
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def hook_generator():
+    """Shared HookGenerator."""
+    from src.generators.hook_generator import HookGenerator
+    return HookGenerator()
 
 
-@pytest.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
-    """Async HTTP client for API testing using ASGITransport (httpx 0.28+)."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+@pytest.fixture(scope="session")
+def landing_page_analyzer():
+    """Shared LandingPageAnalyzer."""
+    from src.analyzers.landing_page_analyzer import LandingPageAnalyzer
+    return LandingPageAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def budget_simulator():
+    """Shared BudgetSimulator."""
+    from src.analyzers.budget_simulator import BudgetSimulator
+    return BudgetSimulator()
+
+
+@pytest.fixture(scope="session")
+def platform_recommender():
+    """Shared PlatformRecommender."""
+    from src.analyzers.platform_recommender import PlatformRecommender
+    return PlatformRecommender()
+
+
+@pytest.fixture(scope="session")
+def ab_test_planner():
+    """Shared ABTestPlanner."""
+    from src.analyzers.ab_test_planner import ABTestPlanner
+    return ABTestPlanner()
+
+
+@pytest.fixture(scope="session")
+def audience_targeting():
+    """Shared AudienceTargeting."""
+    from src.analyzers.audience_targeting import AudienceTargeting
+    return AudienceTargeting()
+
+
+@pytest.fixture(scope="session")
+def iteration_assistant():
+    """Shared IterationAssistant."""
+    from src.analyzers.iteration_assistant import IterationAssistant
+    return IterationAssistant()
+
+
+@pytest.fixture(scope="session")
+def social_proof_collector():
+    """Shared SocialProofCollector."""
+    from src.extractors.social_proof_collector import SocialProofCollector
+    return SocialProofCollector()
 
 
 # =============================================================================
 # SAMPLE DATA FIXTURES
 # =============================================================================
+# Payloads are built once at import. Fixtures hand out a shallow copy, so
+# tests may set top-level keys but must not mutate nested lists/dicts.
+
+_SAMPLE_BRAND_PROFILE = MappingProxyType({
+    "brand_name": "Careerfied",
+    "tagline": "Build resumes that get interviews",
+    "value_propositions": [
+        "AI-powered resume optimization",
+        "ATS-friendly templates",
+        "Real-time feedback",
+    ],
+    "target_audience": "Job seekers frustrated with resume rejections",
+    "tone_of_voice": "Confident, supportive, professional",
+    "claims": [
+        {
+            "claim": "Join 10,000+ job seekers",
+            "source_text": "Based on user surveys",
+            "risk_level": "low",
+        },
+        {
+            "claim": "AI-powered optimization",
+            "source_text": "Uses GPT-4",
+            "risk_level": "low",
+        },
+    ],
+    "primary_color": "#4F46E5",
+    "secondary_color": "#F59E0B",
+})
+
 
 @pytest.fixture
 def sample_brand_profile():
     """Sample brand profile for testing."""
-    return {
-        "brand_name": "Careerfied",
-        "tagline": "Build resumes that get interviews",
-        "value_propositions": [
-            "AI-powered resume optimization",
-            "ATS-friendly templates",
-            "Real-time feedback",
-        ],
-        "target_audience": "Job seekers frustrated with resume rejections",
-        "tone_of_voice": "Confident, supportive, professional",
-        "claims": [
-            {
-                "claim": "Join 10,000+ job seekers",
-                "source_text": "Based on user surveys",
-                "risk_level": "low",
-            },
-            {
-                "claim": "AI-powered optimization",
-                "source_text": "Uses GPT-4",
-                "risk_level": "low",
-            },
-        ],
-        "primary_color": "#4F46E5",
-        "secondary_color": "#F59E0B",
-    }
+    return dict(_SAMPLE_BRAND_PROFILE)
+
+
+_SAMPLE_COPY_VARIANT = MappingProxyType({
+    "id": "variant_001",
+    "headline": "Stop Getting Rejected by ATS",
+    "primary_text": "Build resumes that get interviews with AI-powered optimization.",
+    "cta": "Get Started",
+    "hook_type": "pain_point",
+    "emotion_target": "frustration_relief",
+})
 
 
 @pytest.fixture
 def sample_copy_variant():
     """Sample copy variant for testing."""
-    return {
-        "id": "variant_001",
-        "headline": "Stop Getting Rejected by ATS",
-        "primary_text": "Build resumes that get interviews with AI-powered optimization.",
-        "cta": "Get Started",
-        "hook_type": "pain_point",
-        "emotion_target": "frustration_relief",
-    }
+    return dict(_SAMPLE_COPY_VARIANT)
+
+
+_SAMPLE_AD_PERFORMANCE_DATA = MappingProxyType({
+    "ad_id": "test_ad_001",
+    "days_running": 14,
+    "impressions": 50000,
+    "clicks": 1000,
+    "frequency": 2.5,
+    "reach": 20000,
+    "audience_size": 100000,
+    "ctr_history": [2.0, 1.95, 1.9, 1.85, 1.8, 1.75, 1.7, 1.65, 1.6, 1.55, 1.5, 1.48, 1.45, 1.42],
+    "cpm_history": [10.0, 10.2, 10.4, 10.6, 10.8, 11.0, 11.2, 11.4, 11.6, 11.8, 12.0, 12.2, 12.4, 12.6],
+    "industry": "saas",
+})
 
 
 @pytest.fixture
 def sample_ad_performance_data():
     """Sample ad performance data for fatigue testing."""
-    return {
-        "ad_id": "test_ad_001",
-        "days_running": 14,
-        "impressions": 50000,
-        "clicks": 1000,
-        "frequency": 2.5,
-        "reach": 20000,
-        "audience_size": 100000,
-        "ctr_history": [2.0, 1.95, 1.9, 1.85, 1.8, 1.75, 1.7, 1.65, 1.6, 1.55, 1.5, 1.48, 1.45, 1.42],
-        "cpm_history": [10.0, 10.2, 10.4, 10.6, 10.8, 11.0, 11.2, 11.4, 11.6, 11.8, 12.0, 12.2, 12.4, 12.6],
-        "industry": "saas",
-    }
+    return dict(_SAMPLE_AD_PERFORMANCE_DATA)
+
+
+_SAMPLE_VIDEO_REQUEST = MappingProxyType({
+    "brand_name": "Careerfied",
+    "product_description": "AI-powered resume builder",
+    "target_audience": "Job seekers",
+    "key_benefits": ["ATS-optimized", "Industry templates", "Real-time feedback"],
+    "cta": "Get Started Free",
+    "style": "ugc",
+    "aspect_ratio": "9:16",
+    "avatar_style": "casual",
+    "include_captions": True,
+    "include_music": True,
+})
 
 
 @pytest.fixture
 def sample_video_request():
     """Sample video generation request."""
-    return {
-        "brand_name": "Careerfied",
-        "product_description": "AI-powered resume builder",
-        "target_audience": "Job seekers",
-        "key_benefits": ["ATS-optimized", "Industry templates", "Real-time feedback"],
-        "cta": "Get Started Free",
-        "style": "ugc",
-        "aspect_ratio": "9:16",
-        "avatar_style": "casual",
-        "include_captions": True,
-        "include_music": True,
-    }
+    return dict(_SAMPLE_VIDEO_REQUEST)
+
+
+_SAMPLE_COMPETITOR_REQUEST = MappingProxyType({
+    "brand_name": "Careerfied",
+    "industry": "career",
+    "competitor_names": ["Resume.io", "Zety", "Indeed"],
+})
 
 
 @pytest.fixture
 def sample_competitor_request():
     """Sample competitor intel request."""
-    return {
-        "brand_name": "Careerfied",
-        "industry": "career",
-        "competitor_names": ["Resume.io", "Zety", "Indeed"],
-    }
+    return dict(_SAMPLE_COMPETITOR_REQUEST)
+
+
+_SAMPLE_PROOF_PACK_REQUEST = MappingProxyType({
+    "ad_id": "test_ad_001",
+    "campaign_name": "Launch Campaign",
+    "brand_name": "Careerfied",
+    "headline": "Stop Getting Rejected by ATS",
+    "primary_text": "Build resumes that get interviews with AI-powered optimization.",
+    "cta": "Get Started",
+    "claims": [
+        {"claim": "Join 10,000+ users", "source_text": "User surveys", "risk_level": "low"},
+    ],
+})
 
 
 @pytest.fixture
 def sample_proof_pack_request():
     """Sample proof pack request."""
-    return {
-        "ad_id": "test_ad_001",
-        "campaign_name": "Launch Campaign",
-        "brand_name": "Careerfied",
-        "headline": "Stop Getting Rejected by ATS",
-        "primary_text": "Build resumes that get interviews with AI-powered optimization.",
-        "cta": "Get Started",
-        "claims": [
-            {"claim": "Join 10,000+ users", "source_text": "User surveys", "risk_level": "low"},
-        ],
-    }
+    return dict(_SAMPLE_PROOF_PACK_REQUEST)
 
 
 # =============================================================================
@@ -203,145 +381,204 @@ def temp_jobs_dir(tmp_path):
 
 
 # =============================================================================
-# CLEANUP FIXTURES
+# OUTPUT FIXTURES
 # =============================================================================
 
-@pytest.fixture(autouse=True)
-def cleanup_output_files():
-    """Clean up generated files after tests."""
-    yield
-    # Cleanup code runs after test
-    output_dir = Path("./output")
-    if output_dir.exists():
-        for file in output_dir.glob("test_*"):
-            try:
-                file.unlink()
-            except Exception:
-                pass
+@pytest.fixture(scope="session", autouse=True)
+def redirect_output_dir(tmp_path_factory):
+    """Send generated files to a session temp dir instead of ./output.
+
+    pytest prunes old temp dirs itself, so no per-test cleanup is needed.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BRANDTRUTH_OUTPUT_DIR", str(tmp_path_factory.mktemp("output")))
+        yield
+
+
+@pytest.fixture
+def cleanup_output(request, tmp_path, monkeypatch):
+    """Give a file-writing test its own output dir, removed on teardown.
+
+    Opt in with ``@pytest.mark.writes_output`` (applied automatically under
+    tests/e2e/) or ``@pytest.mark.usefixtures("cleanup_output")``.
+
+    The API server's cached generators captured the output dir when they
+    were built, so the test gets an empty cache (restored on teardown)
+    and never reuses or keeps an instance that points at a deleted dir.
+    """
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    monkeypatch.setenv("BRANDTRUTH_OUTPUT_DIR", str(output_dir))
+    api_server = sys.modules.get("api_server")
+    if api_server is not None:
+        monkeypatch.setattr(api_server, "_instances", {})
+
+    def _cleanup():
+        shutil.rmtree(output_dir, ignore_errors=True)
+        # Imported during the test: its cache only holds instances built for output_dir
+        if api_server is None and "api_server" in sys.modules:
+            sys.modules["api_server"]._instances.clear()
+
+    request.addfinalizer(_cleanup)
+    return output_dir
 
 
 # =============================================================================
 # NEW FEATURE FIXTURES (Slices 16-23)
 # =============================================================================
 
+_SAMPLE_HOOK_REQUEST = MappingProxyType({
+    "product_name": "Careerfied",
+    "product_description": "AI-powered resume builder",
+    "target_audience": "Job seekers",
+    "pain_points": ["getting rejected", "ATS systems"],
+    "benefits": ["land more interviews", "stand out"],
+    "tone": "professional",
+    "include_emojis": False,
+    "num_hooks": 10,
+})
+
+
 @pytest.fixture
 def sample_hook_request():
     """Sample hook generation request."""
-    return {
-        "product_name": "Careerfied",
-        "product_description": "AI-powered resume builder",
-        "target_audience": "Job seekers",
-        "pain_points": ["getting rejected", "ATS systems"],
-        "benefits": ["land more interviews", "stand out"],
-        "tone": "professional",
-        "include_emojis": False,
-        "num_hooks": 10,
-    }
+    return dict(_SAMPLE_HOOK_REQUEST)
+
+
+_SAMPLE_LANDING_REQUEST = MappingProxyType({
+    "landing_page_url": "https://careerfied.ai",
+    "ad_headline": "Stop Getting Rejected",
+    "ad_primary_text": "Build ATS-optimized resumes",
+    "ad_cta": "Get Started Free",
+})
 
 
 @pytest.fixture
 def sample_landing_request():
     """Sample landing page analysis request."""
-    return {
-        "landing_page_url": "https://careerfied.ai",
-        "ad_headline": "Stop Getting Rejected",
-        "ad_primary_text": "Build ATS-optimized resumes",
-        "ad_cta": "Get Started Free",
-    }
+    return dict(_SAMPLE_LANDING_REQUEST)
+
+
+_SAMPLE_BUDGET_REQUEST = MappingProxyType({
+    "industry": "saas",
+    "goal": "leads",
+    "product_price": 99.0,
+    "target_monthly_conversions": 50,
+    "target_cpa": None,
+})
 
 
 @pytest.fixture
 def sample_budget_request():
     """Sample budget simulation request."""
-    return {
-        "industry": "saas",
-        "goal": "leads",
-        "product_price": 99.0,
-        "target_monthly_conversions": 50,
-        "target_cpa": None,
-    }
+    return dict(_SAMPLE_BUDGET_REQUEST)
+
+
+_SAMPLE_PLATFORM_REQUEST = MappingProxyType({
+    "product_type": "b2b_saas",
+    "audience_type": "founders",
+    "monthly_budget": 1000,
+    "product_price": 99,
+    "is_visual": True,
+})
 
 
 @pytest.fixture
 def sample_platform_request():
     """Sample platform recommendation request."""
-    return {
-        "product_type": "b2b_saas",
-        "audience_type": "founders",
-        "monthly_budget": 1000,
-        "product_price": 99,
-        "is_visual": True,
-    }
+    return dict(_SAMPLE_PLATFORM_REQUEST)
+
+
+_SAMPLE_ABTEST_REQUEST = MappingProxyType({
+    "variants": [
+        {"headline": "Stop Getting Rejected", "primary_text": "Build resumes", "cta": "Get Started"},
+        {"headline": "Land More Interviews", "primary_text": "AI-powered", "cta": "Try Free"},
+    ],
+    "baseline_ctr": 1.0,
+    "baseline_cvr": 2.0,
+    "daily_budget": 50,
+    "confidence_level": 0.95,
+    "minimum_lift": 0.20,
+})
 
 
 @pytest.fixture
 def sample_abtest_request():
     """Sample A/B test planning request."""
-    return {
-        "variants": [
-            {"headline": "Stop Getting Rejected", "primary_text": "Build resumes", "cta": "Get Started"},
-            {"headline": "Land More Interviews", "primary_text": "AI-powered", "cta": "Try Free"},
-        ],
-        "baseline_ctr": 1.0,
-        "baseline_cvr": 2.0,
-        "daily_budget": 50,
-        "confidence_level": 0.95,
-        "minimum_lift": 0.20,
-    }
+    return dict(_SAMPLE_ABTEST_REQUEST)
+
+
+_SAMPLE_AUDIENCE_REQUEST = MappingProxyType({
+    "product_name": "Careerfied",
+    "product_description": "AI-powered resume builder",
+    "product_type": "saas",
+    "target_persona": "Job seekers",
+    "price_point": 29,
+    "existing_customers": False,
+    "website_traffic": False,
+})
 
 
 @pytest.fixture
 def sample_audience_request():
     """Sample audience targeting request."""
-    return {
-        "product_name": "Careerfied",
-        "product_description": "AI-powered resume builder",
-        "product_type": "saas",
-        "target_persona": "Job seekers",
-        "price_point": 29,
-        "existing_customers": False,
-        "website_traffic": False,
-    }
+    return dict(_SAMPLE_AUDIENCE_REQUEST)
+
+
+_SAMPLE_ITERATION_REQUEST = MappingProxyType({
+    "headline": "Check out our product",
+    "primary_text": "We have a great product",
+    "cta": "Learn More",
+    "current_ctr": 0.5,
+    "current_cvr": 1.0,
+    "current_cpa": 120,
+    "target_cpa": 50,
+    "impressions": 10000,
+    "frequency": 2.0,
+    "days_running": 7,
+})
 
 
 @pytest.fixture
 def sample_iteration_request():
     """Sample ad iteration request."""
-    return {
-        "headline": "Check out our product",
-        "primary_text": "We have a great product",
-        "cta": "Learn More",
-        "current_ctr": 0.5,
-        "current_cvr": 1.0,
-        "current_cpa": 120,
-        "target_cpa": 50,
-        "impressions": 10000,
-        "frequency": 2.0,
-        "days_running": 7,
-    }
+    return dict(_SAMPLE_ITERATION_REQUEST)
+
+
+_SAMPLE_SOCIAL_PROOF_REQUEST = MappingProxyType({
+    "brand_name": "Careerfied",
+    "brand_url": "https://careerfied.ai",
+    "product_description": "AI-powered resume builder",
+    "existing_testimonials": [
+        "This helped me land my dream job!",
+        "Got 3 interviews in the first week",
+    ],
+    "user_count": 1500,
+    "rating": 4.8,
+    "notable_customers": ["Google", "Meta", "Microsoft"],
+})
 
 
 @pytest.fixture
 def sample_social_proof_request():
     """Sample social proof collection request."""
-    return {
-        "brand_name": "Careerfied",
-        "brand_url": "https://careerfied.ai",
-        "product_description": "AI-powered resume builder",
-        "existing_testimonials": [
-            "This helped me land my dream job!",
-            "Got 3 interviews in the first week",
-        ],
-        "user_count": 1500,
-        "rating": 4.8,
-        "notable_customers": ["Google", "Meta", "Microsoft"],
-    }
+    return dict(_SAMPLE_SOCIAL_PROOF_REQUEST)
 
 
 # =============================================================================
-# MARKERS
+# OPTIONS & MARKERS
 # =============================================================================
 
+def pytest_addoption(parser):
+    """Command-line options for the test suite."""
+    parser.addoption(
+        "--no-pact-cache",
+        action="store_true",
+        default=False,
+        help="Re-verify every pact file, even ones already verified unchanged",
+    )
+
+
 def pytest_configure(config):
     """Configure custom markers."""
     config.addinivalue_line("markers", "unit: Unit tests")
@@ -351,3 +588,16 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "component: Component tests")
     config.addinivalue_line("markers", "slow: Slow tests")
     config.addinivalue_line("markers", "api: API tests")
+    config.addinivalue_line(
+        "markers", "writes_output: Test writes generated files (isolated via cleanup_output)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Attach cleanup_output only to tests that write files."""
+    e2e_dir = Path(__file__).parent / "e2e"
+    for item in items:
+        if e2e_dir in item.path.parents:
+            item.add_marker(pytest.mark.writes_output)
+        if item.get_closest_marker("writes_output") and "cleanup_output" not in item.fixturenames:
+            item.fixturenames.append("cleanup_output")
@@ -0,0 +1,208 @@
+# tests/contract/conftest.py
+"""Shared fixtures for contract tests that talk to live infrastructure.
+
+Tests needing a service that is down are skipped at collection time (one
+blocking probe per service). Otherwise health is confirmed once per session
+over a single aiohttp session, and the MinIO/Qdrant singletons are built once
+and shared by every test.
+"""
+
+import socket
+import urllib.request
+from pathlib import Path
+from typing import AsyncGenerator, Optional
+
+import pytest
+import pytest_asyncio
+
+# pytest-xdist provides worker_id; without it every test runs in "master"
+try:
+    import xdist  # noqa: F401
+except ImportError:
+    @pytest.fixture(scope="session")
+    def worker_id() -> str:
+        """Fallback for runs without pytest-xdist."""
+        return "master"
+
+
+def _minio_health_url() -> str:
+    from src.storage.minio_client import MinIOConfig
+
+    return f"{MinIOConfig.ENDPOINT_URL}/minio/health/live"
+
+
+def _qdrant_health_url() -> str:
+    from src.vector.qdrant_client import QdrantConfig
+
+    return f"{QdrantConfig.load().URL}/"
+
+
+# Service -> (fixture that needs it, health URL factory)
+_SERVICES = {
+    "MinIO": ("minio_client", _minio_health_url),
+    "Qdrant": ("qdrant_client", _qdrant_health_url),
+}
+
+
+def _probe_sync(url: str, timeout: float = 0.5) -> bool:
+    """Blocking health check used at collection time."""
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.status == 200
+    except Exception:
+        return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests needing a service that is down before any fixture runs.
+
+    Each service is probed once, and only if a selected test needs it.
+    """
+    here = Path(__file__).parent
+    items = [item for item in items if here in item.path.parents]
+    for service, (fixture, health_url) in _SERVICES.items():
+        needing = [item for item in items if fixture in item.fixturenames]
+        if needing and not _probe_sync(health_url()):
+            skip = pytest.mark.skip(reason=f"{service} not available")
+            for item in needing:
+                item.add_marker(skip)
+
+
+async def _probe(session, url: str) -> bool:
+    """Return True if ``url`` answers 200, False on any error."""
+    try:
+        async with session.get(url) as resp:
+            return resp.status == 200
+    except Exception:
+        return False
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_session() -> AsyncGenerator:
+    """One aiohttp session (and connection pool) for all in-test HTTP calls.
+
+    Keep-alive connections and the DNS cache are reused across probes and
+    any test that takes this fixture.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def minio_available(http_session) -> bool:
+    """Whether MinIO answers its liveness probe (checked once)."""
+    return await _probe(http_session, _minio_health_url())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def qdrant_available(http_session) -> bool:
+    """Whether Qdrant answers on its root endpoint (checked once)."""
+    return await _probe(http_session, _qdrant_health_url())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def minio_client(minio_available):
+    """Shared MinIO client; skips dependent tests if MinIO is down."""
+    if not minio_available:
+        pytest.skip("MinIO not available")
+    from src.storage.minio_client import get_minio_client
+
+    return await get_minio_client()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def qdrant_client(qdrant_available):
+    """Shared Qdrant client; skips dependent tests if Qdrant is down."""
+    if not qdrant_available:
+        pytest.skip("Qdrant not available")
+    from src.vector.qdrant_client import get_qdrant_client
+
+    return await get_qdrant_client()
+
+
+@pytest.fixture(scope="session")
+def cached_embeddings():
+    """Memoize EmbeddingService.embed_batch per (text, dimensions) for the session.
+
+    embed_text goes through embed_batch, so tests that embed the same input
+    pay for the API round trip once.
+    """
+    from src.vector.embeddings import EmbeddingService
+
+    original = EmbeddingService.embed_batch
+    cache: dict[tuple[str, Optional[int]], list[float]] = {}
+
+    async def embed_batch(self, texts, dimensions=None):
+        missing = [t for t in dict.fromkeys(texts) if (t, dimensions) not in cache]
+        if missing:
+            vectors = await original(self, missing, dimensions)
+            cache.update(((t, dimensions), v) for t, v in zip(missing, vectors))
+        return [list(cache[(t, dimensions)]) for t in texts]
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(EmbeddingService, "embed_batch", embed_batch)
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The FastAPI app, imported on first use rather than at collection."""
+    from api_server import app
+
+    return app
+
+
+def _free_port() -> int:
+    """A TCP port on the loopback that is free right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive requests session for the sync (Pact) contract tests."""
+    requests = pytest.importorskip("requests")
+    from requests.adapters import HTTPAdapter
+
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        yield session
+
+
+@pytest.fixture(scope="session")
+def pact_mock(worker_id):
+    """Frontend/API pact with its mock service started once for the session.
+
+    Tests register interactions, then call ``setup()`` before and
+    ``verify()`` after their requests; the mock server stays up between them.
+    Under pytest-xdist each worker runs its own mock service on a free port,
+    and workers merge their interactions into the shared pact file.
+    """
+    pact_lib = pytest.importorskip("pact", reason="pact-python not installed")
+
+    pact_dir = Path(__file__).parent / "pacts"
+    pact_dir.mkdir(exist_ok=True)
+    pact = pact_lib.Consumer("BrandTruthFrontend").has_pact_with(
+        pact_lib.Provider("BrandTruthAPI"),
+        # An IP, not "localhost": avoids a slow IPv6-then-IPv4 lookup per request
+        host_name="127.0.0.1",
+        port=_free_port(),
+        file_write_mode="overwrite" if worker_id == "master" else "merge",
+        pact_dir=str(pact_dir),
+        log_dir=str(pact_dir / "logs"),
+    )
+    pact.start_service()
+    try:
+        yield pact
+    finally:
+        pact.stop_service()
+
+
+@pytest.fixture(scope="session")
+def pact_url(pact_mock) -> str:
+    """Base URL of the Pact mock service, always a literal IPv4 address."""
+    return pact_mock.uri.replace("localhost", "127.0.0.1")
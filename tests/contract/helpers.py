@@ -0,0 +1,17 @@
+# tests/contract/helpers.py
+"""Helpers shared by the HTTP contract tests.
+
+Request bodies are serialized once at import, not on every post.
+"""
+
+try:
+    import orjson
+    dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        """Serialize obj to JSON bytes."""
+        return json.dumps(obj).encode()
+
+JSON_HEADERS = {"content-type": "application/json"}
@@ -7,118 +7,196 @@ These tests verify:
 3. Activity dataclass shapes match expectations
 """
 
-import pytest
+import asyncio
+import dataclasses
+import importlib
+import json
 import os
-import tempfile
+import time
+import typing
+import uuid
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import asdict
-
-# Test activity result shapes first (no external deps)
-
-
-class TestUploadActivityContracts:
-    """Contract tests for MinIO upload activity result shapes."""
-
-    def test_upload_result_shape(self):
-        """Verify UploadResult dataclass has required fields."""
-        from src.temporal.activities.upload import UploadResult
-
-        result = UploadResult(
-            object_url="http://localhost:9000/ad-creatives/test.png",
-            presigned_url="http://localhost:9000/ad-creatives/test.png?X-Amz-Signature=...",
-            bucket="ad-creatives",
-            object_key="campaigns/test/variants/v1/1x1.png",
-            size_bytes=12345,
-        )
-
-        # Required fields
-        assert hasattr(result, "object_url")
-        assert hasattr(result, "presigned_url")
-        assert hasattr(result, "bucket")
-        assert hasattr(result, "object_key")
-        assert hasattr(result, "size_bytes")
 
-        # Field types
-        assert isinstance(result.object_url, str)
-        assert isinstance(result.presigned_url, str)
-        assert isinstance(result.bucket, str)
-        assert isinstance(result.object_key, str)
-        assert isinstance(result.size_bytes, int)
+import numpy as np
+import pytest
+import pytest_asyncio
+
+try:
+    from qdrant_client.models import Filter, HasIdCondition, PointIdsList, PointStruct
+    from src.storage.minio_client import MinIOClient, MinIOConfig
+    from src.temporal.activities.embed import EmbeddingResult
+    from src.temporal.activities.upload import BatchUploadResult, UploadResult
+    from src.temporal.workflows.ad_pipeline import AdPipelineWorkflow, PipelineStage
+    from src.vector.embeddings import EmbeddingService, get_embedding_service
+    from src.vector.qdrant_client import QdrantClient, QdrantConfig
+except ImportError as e:
+    pytest.skip(f"src not importable: {e}", allow_module_level=True)
+
+# orjson serializes dataclasses natively in C (no recursive asdict copy)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Minimal PNG (1x1 transparent pixel)
+_ONE_PX_PNG: bytes = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01'
+    b'\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89'
+    b'\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01'
+    b'\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+
+# Expected contract shapes
+_UPLOAD_RESULT_FIELDS = frozenset(
+    {"object_url", "presigned_url", "bucket", "object_key", "size_bytes"}
+)
+_BATCH_UPLOAD_RESULT_FIELDS = frozenset({"uploads", "total_bytes"})
+_EMBEDDING_RESULT_FIELDS = frozenset({"point_ids", "collection_name", "count", "skipped"})
+_MINIO_CONFIG_ATTRS = frozenset({
+    "ENDPOINT_URL", "PUBLIC_URL", "ACCESS_KEY", "SECRET_KEY",
+    "BUCKET_AD_CREATIVES", "BUCKET_BRAND_ASSETS",
+})
+_QDRANT_CONFIG_INSTANCE_ATTRS = frozenset({"URL", "GRPC_PORT", "API_KEY"})
+_QDRANT_CONFIG_CLASS_ATTRS = frozenset(
+    {"COLLECTION_BRANDS", "COLLECTION_AD_CREATIVES", "EMBEDDING_DIM"}
+)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls) -> frozenset[str]:
+    """Dataclass field names, computed once per class."""
+    return frozenset(f.name for f in dataclasses.fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _field_types(cls) -> dict[str, type]:
+    """Runtime type to isinstance-check for each field (``list[X]`` -> ``list``)."""
+    return {
+        name: typing.get_origin(hint) or hint
+        for name, hint in typing.get_type_hints(cls).items()
+    }
+
+
+def _to_json(obj) -> dict:
+    """Round-trip a result dataclass through JSON, as Temporal does."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return json.loads(json.dumps(dataclasses.asdict(obj)))
+
+
+def _write_bytes_fast(path, *chunks: bytes) -> None:
+    """Write small fixture files with one unbuffered syscall (no BufferedWriter).
+
+    Multiple chunks go out in a single writev where available (not Windows).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if hasattr(os, "writev"):
+            os.writev(fd, chunks)
+        else:
+            os.write(fd, b"".join(chunks))
+    finally:
+        os.close(fd)
+
+
+def _missing_attrs(obj, names: frozenset[str]) -> set[str]:
+    """Names from ``names`` that ``obj`` does not have."""
+    return {name for name in names if not hasattr(obj, name)}
 
-        # URL format validation
-        assert result.object_url.startswith("http")
-        assert result.presigned_url.startswith("http")
-        assert "/" in result.object_key
 
-    def test_batch_upload_result_shape(self):
-        """Verify BatchUploadResult dataclass has required fields."""
-        from src.temporal.activities.upload import UploadResult, BatchUploadResult
+# Test activity result shapes first (no external deps)
 
-        upload1 = UploadResult(
+_UPLOAD_RESULT_KWARGS = dict(
+    object_url="http://localhost:9000/ad-creatives/test.png",
+    presigned_url="http://localhost:9000/ad-creatives/test.png?X-Amz-Signature=...",
+    bucket="ad-creatives",
+    object_key="campaigns/test/variants/v1/1x1.png",
+    size_bytes=12345,
+)
+_BATCH_UPLOAD_RESULT_KWARGS = dict(
+    uploads=[
+        UploadResult(
             object_url="http://test/1.png",
             presigned_url="http://test/1.png?sig=...",
             bucket="ad-creatives",
             object_key="test/1.png",
             size_bytes=1000,
-        )
-        upload2 = UploadResult(
+        ),
+        UploadResult(
             object_url="http://test/2.png",
             presigned_url="http://test/2.png?sig=...",
             bucket="ad-creatives",
             object_key="test/2.png",
             size_bytes=2000,
-        )
-
-        batch = BatchUploadResult(
-            uploads=[upload1, upload2],
-            total_bytes=3000,
-        )
+        ),
+    ],
+    total_bytes=3000,
+)
+_EMBEDDING_RESULT_KWARGS = dict(
+    point_ids=["id-1", "id-2"],
+    collection_name="brands",
+    count=2,
+    skipped=0,
+)
+
+
+class TestDataclassShapes:
+    """Contract tests for upload/embed activity result shapes."""
+
+    @pytest.mark.parametrize("cls,kwargs,fields", [
+        pytest.param(UploadResult, _UPLOAD_RESULT_KWARGS, _UPLOAD_RESULT_FIELDS, id="UploadResult"),
+        pytest.param(
+            BatchUploadResult, _BATCH_UPLOAD_RESULT_KWARGS, _BATCH_UPLOAD_RESULT_FIELDS,
+            id="BatchUploadResult",
+        ),
+        pytest.param(
+            EmbeddingResult, _EMBEDDING_RESULT_KWARGS, _EMBEDDING_RESULT_FIELDS,
+            id="EmbeddingResult",
+        ),
+    ])
+    def test_shape(self, cls, kwargs, fields):
+        """Verify result dataclasses have required fields of the declared types."""
+        obj = cls(**kwargs)
+        assert dataclasses.is_dataclass(obj)
 
         # Required fields
-        assert hasattr(batch, "uploads")
-        assert hasattr(batch, "total_bytes")
+        assert _field_names(cls) >= fields
 
         # Field types
-        assert isinstance(batch.uploads, list)
-        assert isinstance(batch.total_bytes, int)
-        assert len(batch.uploads) == 2
-        assert batch.total_bytes == 3000
+        field_types = _field_types(cls)
+        for name in fields:
+            assert isinstance(getattr(obj, name), field_types[name]), name
 
+    def test_upload_result_urls(self):
+        """Verify UploadResult URL and key formats."""
+        result = UploadResult(**_UPLOAD_RESULT_KWARGS)
 
-class TestEmbedActivityContracts:
-    """Contract tests for Qdrant embed activity result shapes."""
+        assert result.object_url.startswith("http")
+        assert result.presigned_url.startswith("http")
+        assert "/" in result.object_key
 
-    def test_embedding_result_shape(self):
-        """Verify EmbeddingResult dataclass has required fields."""
-        from src.temporal.activities.embed import EmbeddingResult
+    def test_batch_upload_result_json(self):
+        """Verify BatchUploadResult totals survive a JSON round-trip."""
+        batch = BatchUploadResult(**_BATCH_UPLOAD_RESULT_KWARGS)
 
-        result = EmbeddingResult(
-            point_ids=["id-1", "id-2"],
-            collection_name="brands",
-            count=2,
-            skipped=0,
-        )
+        assert len(batch.uploads) == 2
+        assert batch.total_bytes == 3000
 
-        # Required fields
-        assert hasattr(result, "point_ids")
-        assert hasattr(result, "collection_name")
-        assert hasattr(result, "count")
-        assert hasattr(result, "skipped")
+        # JSON-serializable with nested uploads intact
+        payload = _to_json(batch)
+        assert payload["total_bytes"] == 3000
+        assert [u["object_key"] for u in payload["uploads"]] == ["test/1.png", "test/2.png"]
 
-        # Field types
-        assert isinstance(result.point_ids, list)
-        assert isinstance(result.collection_name, str)
-        assert isinstance(result.count, int)
-        assert isinstance(result.skipped, int)
+    def test_embedding_result_values(self):
+        """Verify EmbeddingResult counts and collection name."""
+        result = EmbeddingResult(**_EMBEDDING_RESULT_KWARGS)
 
-        # Values
         assert len(result.point_ids) == result.count
         assert result.collection_name in ["brands", "ad_creatives"]
 
     def test_embedding_result_with_skipped(self):
         """Verify EmbeddingResult handles skipped items."""
-        from src.temporal.activities.embed import EmbeddingResult
-
         result = EmbeddingResult(
             point_ids=[],
             collection_name="brands",
@@ -136,113 +214,99 @@ class TestMinIOClientContracts:
 
     def test_minio_config_shape(self):
         """Verify MinIOConfig has required fields."""
-        from src.storage.minio_client import MinIOConfig
-
         # Required class attributes
-        assert hasattr(MinIOConfig, "ENDPOINT_URL")
-        assert hasattr(MinIOConfig, "PUBLIC_URL")
-        assert hasattr(MinIOConfig, "ACCESS_KEY")
-        assert hasattr(MinIOConfig, "SECRET_KEY")
-        assert hasattr(MinIOConfig, "BUCKET_AD_CREATIVES")
-        assert hasattr(MinIOConfig, "BUCKET_BRAND_ASSETS")
+        assert not _missing_attrs(MinIOConfig, _MINIO_CONFIG_ATTRS)
 
         # Bucket names are strings
         assert isinstance(MinIOConfig.BUCKET_AD_CREATIVES, str)
         assert isinstance(MinIOConfig.BUCKET_BRAND_ASSETS, str)
 
-    def test_minio_client_interface(self):
+    @pytest.fixture(scope="class")
+    def minio_instance(self):
+        """One unconnected MinIOClient shared by the interface and URL checks."""
+        return MinIOClient()
+
+    @pytest.mark.parametrize("name", [
+        "upload_file",
+        "upload_fileobj",
+        "generate_presigned_url",
+        "download_file",
+        "delete_object",
+        "object_exists",
+        "get_public_url",
+    ])
+    def test_minio_client_has_method(self, minio_instance, name):
         """Verify MinIOClient has required methods."""
-        from src.storage.minio_client import MinIOClient
-
-        client = MinIOClient()
-
-        # Required async methods
-        assert hasattr(client, "upload_file")
-        assert hasattr(client, "upload_fileobj")
-        assert hasattr(client, "generate_presigned_url")
-        assert hasattr(client, "download_file")
-        assert hasattr(client, "delete_object")
-        assert hasattr(client, "object_exists")
-        assert hasattr(client, "get_public_url")
+        assert callable(getattr(minio_instance, name, None))
 
-        # Methods are callable
-        assert callable(client.upload_file)
-        assert callable(client.generate_presigned_url)
-        assert callable(client.get_public_url)
-
-    def test_minio_public_url_format(self):
+    def test_minio_public_url_format(self, minio_instance):
         """Verify get_public_url returns correct format."""
-        from src.storage.minio_client import MinIOClient, MinIOConfig
-
-        client = MinIOClient()
-        url = client.get_public_url("ad-creatives", "test/image.png")
+        url = minio_instance.get_public_url("ad-creatives", "test/image.png")
 
         # URL structure
         assert url.startswith("http")
         assert "ad-creatives" in url
         assert "test/image.png" in url
 
+        # Pure string formatting over config: no I/O, stable across calls
+        assert url == f"{minio_instance.config.PUBLIC_URL}/ad-creatives/test/image.png"
+        assert minio_instance.get_public_url("ad-creatives", "test/image.png") == url
+
 
 class TestQdrantClientContracts:
     """Contract tests for Qdrant client interface."""
 
     def test_qdrant_config_shape(self):
         """Verify QdrantConfig has required fields."""
-        from src.vector.qdrant_client import QdrantConfig
+        # Environment-backed fields are resolved per instance
+        config = QdrantConfig()
+        assert not _missing_attrs(config, _QDRANT_CONFIG_INSTANCE_ATTRS)
 
         # Required class attributes
-        assert hasattr(QdrantConfig, "URL")
-        assert hasattr(QdrantConfig, "GRPC_PORT")
-        assert hasattr(QdrantConfig, "API_KEY")
-        assert hasattr(QdrantConfig, "COLLECTION_BRANDS")
-        assert hasattr(QdrantConfig, "COLLECTION_AD_CREATIVES")
-        assert hasattr(QdrantConfig, "EMBEDDING_DIM")
+        assert not _missing_attrs(QdrantConfig, _QDRANT_CONFIG_CLASS_ATTRS)
 
         # Embedding dimension is correct for text-embedding-3-small
         assert QdrantConfig.EMBEDDING_DIM == 1536
 
-    def test_qdrant_client_interface(self):
+    @pytest.mark.parametrize("name", [
+        "get_instance",
+        "ensure_collections",
+        "upsert_brand",
+        "upsert_ad_creative",
+        "batch_upsert",
+        "bulk_load",
+        "flush",
+        "search_similar_brands",
+        "search_similar_ads",
+        "update_ad_performance",
+        "update_ad_performance_many",
+    ])
+    def test_qdrant_client_has_method(self, name):
         """Verify QdrantClient has required methods."""
-        from src.vector.qdrant_client import QdrantClient
-
-        # Required async methods
-        assert hasattr(QdrantClient, "get_instance")
-        assert hasattr(QdrantClient, "ensure_collections")
-        assert hasattr(QdrantClient, "upsert_brand")
-        assert hasattr(QdrantClient, "upsert_ad_creative")
-        assert hasattr(QdrantClient, "batch_upsert")
-        assert hasattr(QdrantClient, "search_similar_brands")
-        assert hasattr(QdrantClient, "search_similar_ads")
-        assert hasattr(QdrantClient, "update_ad_performance")
+        assert callable(getattr(QdrantClient, name, None))
 
 
 class TestEmbeddingServiceContracts:
     """Contract tests for embedding service interface."""
 
-    def test_embedding_service_interface(self):
+    @pytest.mark.parametrize("name", [
+        "get_instance",
+        "embed_text",
+        "embed_batch",
+        "embed_brand_profile",
+        "embed_copy_variant",
+    ])
+    def test_embedding_service_has_method(self, name):
         """Verify EmbeddingService has required methods."""
-        from src.vector.embeddings import EmbeddingService
-
-        # Required class methods
-        assert hasattr(EmbeddingService, "get_instance")
+        assert callable(getattr(EmbeddingService, name, None))
 
-        # Required instance methods
-        assert hasattr(EmbeddingService, "embed_text")
-        assert hasattr(EmbeddingService, "embed_batch")
-        assert hasattr(EmbeddingService, "embed_brand_profile")
-        assert hasattr(EmbeddingService, "embed_copy_variant")
+    @pytest.mark.parametrize("name", ["OPENAI_MODEL", "DIMENSIONS", "BATCH_SIZE"])
+    def test_embedding_service_has_constant(self, name):
+        """Verify embedding service has model constants."""
+        assert hasattr(EmbeddingService, name)
 
-    def test_embedding_service_constants(self):
-        """Verify embedding service has correct constants."""
-        from src.vector.embeddings import EmbeddingService
-
-        # Model constants
-        assert hasattr(EmbeddingService, "OPENAI_MODEL")
-        assert hasattr(EmbeddingService, "DIMENSIONS")
-        assert hasattr(EmbeddingService, "BATCH_SIZE")
-
-        # Dimensions match Qdrant config
-        from src.vector.qdrant_client import QdrantConfig
+    def test_embedding_dimensions_match_qdrant(self):
+        """Verify embedding dimensions match the Qdrant collection config."""
         assert EmbeddingService.DIMENSIONS == QdrantConfig.EMBEDDING_DIM
 
 
@@ -251,8 +315,6 @@ class TestWorkflowIntegrationContracts:
 
     def test_pipeline_stage_enum_has_new_stages(self):
         """Verify PipelineStage enum includes new stages."""
-        from src.temporal.workflows.ad_pipeline import PipelineStage
-
         # New stages added
         assert hasattr(PipelineStage, "EMBEDDING_BRAND")
         assert hasattr(PipelineStage, "EMBEDDING_VARIANTS")
@@ -263,168 +325,124 @@ class TestWorkflowIntegrationContracts:
         assert PipelineStage.EMBEDDING_VARIANTS.value == "embedding_variants"
         assert PipelineStage.UPLOADING.value == "uploading"
 
-    def test_pipeline_stage_order(self):
+    @pytest.fixture(scope="class")
+    def stage_order(self):
+        """Position of each PipelineStage value, built once."""
+        return {stage.value: i for i, stage in enumerate(PipelineStage)}
+
+    @pytest.mark.parametrize("before,after", [
+        ("extracting", "embedding_brand"),
+        ("generating", "embedding_variants"),
+        ("composing", "uploading"),
+        ("uploading", "scoring"),
+    ])
+    def test_pipeline_stage_order(self, stage_order, before, after):
         """Verify pipeline stages are in correct order."""
-        from src.temporal.workflows.ad_pipeline import PipelineStage
-
-        stages = list(PipelineStage)
-        stage_names = [s.value for s in stages]
-
-        # Embedding brand comes after extracting
-        assert stage_names.index("embedding_brand") > stage_names.index("extracting")
-
-        # Embedding variants comes after generating
-        assert stage_names.index("embedding_variants") > stage_names.index("generating")
-
-        # Uploading comes after composing
-        assert stage_names.index("uploading") > stage_names.index("composing")
-
-        # Scoring comes after uploading
-        assert stage_names.index("scoring") > stage_names.index("uploading")
+        assert stage_order[before] < stage_order[after], f"{before} must precede {after}"
 
 
 class TestActivityImportsContract:
     """Verify all new activities can be imported in workflow."""
 
-    def test_upload_activities_importable(self):
-        """Verify upload activities are importable."""
-        from src.temporal.activities.upload import (
-            upload_composed_ad_activity,
-            UploadResult,
-            BatchUploadResult,
-        )
-
-        # Activities are decorated functions
-        assert callable(upload_composed_ad_activity)
-
-    def test_embed_activities_importable(self):
-        """Verify embed activities are importable."""
-        from src.temporal.activities.embed import (
-            embed_brand_activity,
-            embed_variants_activity,
-            find_similar_brands_activity,
-            find_similar_ads_activity,
-            EmbeddingResult,
-        )
-
-        # Activities are decorated functions
-        assert callable(embed_brand_activity)
-        assert callable(embed_variants_activity)
-        assert callable(find_similar_brands_activity)
-        assert callable(find_similar_ads_activity)
+    @pytest.mark.parametrize("module,name", [
+        ("src.temporal.activities.upload", "upload_composed_ad_activity"),
+        ("src.temporal.activities.upload", "UploadResult"),
+        ("src.temporal.activities.upload", "BatchUploadResult"),
+        ("src.temporal.activities.embed", "embed_brand_activity"),
+        ("src.temporal.activities.embed", "embed_variants_activity"),
+        ("src.temporal.activities.embed", "find_similar_brands_activity"),
+        ("src.temporal.activities.embed", "find_similar_ads_activity"),
+        ("src.temporal.activities.embed", "EmbeddingResult"),
+    ])
+    def test_activity_importable(self, module, name):
+        """Verify activities and their result types are importable."""
+        # Activities are decorated functions; result types are dataclasses
+        assert callable(getattr(importlib.import_module(module), name, None))
 
     def test_workflow_imports_new_activities(self):
         """Verify workflow module can import new activities."""
-        # This tests the import statements in the workflow file
-        from src.temporal.workflows.ad_pipeline import AdPipelineWorkflow
-
-        # Workflow class exists and is decorated
+        # The module-level import exercises the workflow's own imports;
+        # workflow class exists and is decorated
         assert hasattr(AdPipelineWorkflow, "run")
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="minio_bucket")
 class TestMinIOIntegrationContracts:
     """Integration tests requiring MinIO service (skipped if unavailable)."""
 
-    @pytest.fixture
-    def temp_image(self):
-        """Create a temporary test image."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            # Write minimal PNG header (1x1 transparent pixel)
-            f.write(
-                b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01'
-                b'\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89'
-                b'\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01'
-                b'\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
-            )
-            temp_path = f.name
-        yield temp_path
-        os.unlink(temp_path)
-
-    @pytest.mark.anyio
-    async def test_minio_upload_download_roundtrip(self, temp_image):
-        """Test uploading and downloading a file from MinIO."""
-        import aiohttp
-        from src.storage.minio_client import get_minio_client, MinIOConfig
-
-        # Check if MinIO is available
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{MinIOConfig.ENDPOINT_URL}/minio/health/live") as resp:
-                    if resp.status != 200:
-                        pytest.skip("MinIO not available")
-        except Exception:
-            pytest.skip("MinIO not available")
-
-        minio = await get_minio_client()
+    @pytest.fixture(scope="session")
+    def temp_image(self, tmp_path_factory):
+        """Write the test image once per session; pytest removes the dir."""
+        path = tmp_path_factory.mktemp("imgs") / "px.png"
+        _write_bytes_fast(path, _ONE_PX_PNG)
+        return str(path)
+
+    @pytest.mark.parametrize("n_objects", [8])
+    async def test_minio_upload_download_roundtrip(
+        self, temp_image, minio_client, tmp_path, worker_id, n_objects
+    ):
+        """Test uploading and downloading a batch of files from MinIO concurrently.
+
+        n_objects stays below MinIOConfig.MAX_POOL_CONNECTIONS so every
+        request in a batch gets its own pooled connection.
+        """
+        minio = minio_client
+        bucket = MinIOConfig.BUCKET_AD_CREATIVES
+        # Unique per xdist worker and per run, so parallel runs never share keys
+        prefix = f"test-contracts/{worker_id}/{uuid.uuid4().hex}"
+        keys = [f"{prefix}/rt-{i}.png" for i in range(n_objects)]
 
         # Upload
-        object_key = "test-contracts/test-roundtrip.png"
-        url = await minio.upload_file(
-            file_path=temp_image,
-            bucket=MinIOConfig.BUCKET_AD_CREATIVES,
-            object_key=object_key,
-            content_type="image/png",
-        )
-
-        assert url is not None
-        assert "ad-creatives" in url
-
-        # Verify exists
-        exists = await minio.object_exists(MinIOConfig.BUCKET_AD_CREATIVES, object_key)
-        assert exists is True
-
-        # Generate presigned URL
-        presigned = await minio.generate_presigned_url(
-            bucket=MinIOConfig.BUCKET_AD_CREATIVES,
-            object_key=object_key,
-            expiry_seconds=300,
-        )
-        assert "X-Amz-" in presigned or "?" in presigned
-
-        # Download and verify
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            download_path = f.name
-
-        try:
-            await minio.download_file(
-                bucket=MinIOConfig.BUCKET_AD_CREATIVES,
-                object_key=object_key,
-                local_path=download_path,
+        urls = await asyncio.gather(*(
+            minio.upload_file(
+                file_path=temp_image,
+                bucket=bucket,
+                object_key=key,
+                content_type="image/png",
             )
+            for key in keys
+        ))
 
-            assert os.path.exists(download_path)
-            assert os.path.getsize(download_path) > 0
+        try:
+            for url in urls:
+                assert url is not None
+                assert "ad-creatives" in url
+
+            # Verify exists
+            exists = await asyncio.gather(*(minio.object_exists(bucket, key) for key in keys))
+            assert all(e is True for e in exists)
+
+            # Generate presigned URLs
+            presigned = await asyncio.gather(*(
+                minio.generate_presigned_url(bucket=bucket, object_key=key, expiry_seconds=300)
+                for key in keys
+            ))
+            for url in presigned:
+                assert "X-Amz-" in url or "?" in url
+
+            # Download and verify
+            download_paths = [tmp_path / f"rt-{i}.png" for i in range(n_objects)]
+            await asyncio.gather(*(
+                minio.download_file(bucket=bucket, object_key=key, local_path=str(path))
+                for key, path in zip(keys, download_paths)
+            ))
+            # One stat per file; a missing download raises FileNotFoundError
+            for path in download_paths:
+                assert path.stat().st_size > 0
         finally:
-            if os.path.exists(download_path):
-                os.unlink(download_path)
-
-        # Cleanup
-        await minio.delete_object(MinIOConfig.BUCKET_AD_CREATIVES, object_key)
+            # Cleanup
+            await asyncio.gather(*(minio.delete_object(bucket, key) for key in keys))
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="qdrant_collections")
 class TestQdrantIntegrationContracts:
     """Integration tests requiring Qdrant service (skipped if unavailable)."""
 
-    @pytest.mark.anyio
-    async def test_qdrant_collections_exist(self):
+    async def test_qdrant_collections_exist(self, qdrant_client):
         """Test Qdrant collections are created."""
-        import aiohttp
-        from src.vector.qdrant_client import QdrantConfig
-
-        # Check if Qdrant is available
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{QdrantConfig.URL}/") as resp:
-                    if resp.status != 200:
-                        pytest.skip("Qdrant not available")
-        except Exception:
-            pytest.skip("Qdrant not available")
-
-        from src.vector.qdrant_client import get_qdrant_client
-
-        client = await get_qdrant_client()
+        client = qdrant_client
         await client.ensure_collections()
 
         # Collections should exist now
@@ -438,32 +456,150 @@ class TestQdrantIntegrationContracts:
         assert ads_info is not None
 
 
+_SEED_POINTS = 256
+_SEED_BATCH_SIZE = 64
+_SEED_PARALLEL = 4
+_SEED_MAX_SECONDS = 10.0
+
+
+def _seed_ids(prefix: str) -> list[str]:
+    """Deterministic UUIDs for seeded points (Qdrant ids must be int or UUID)."""
+    return [
+        str(uuid.uuid5(uuid.NAMESPACE_URL, f"test-contracts/{prefix}/{i}"))
+        for i in range(_SEED_POINTS)
+    ]
+
+
+async def _wait_for_points(client, collection_name: str, ids: list[str], timeout: float = 10.0):
+    """Wait until all ``ids`` are visible (batch_upsert does not wait for writes)."""
+    id_filter = Filter(must=[HasIdCondition(has_id=ids)])
+    deadline = time.monotonic() + timeout
+    while True:
+        result = await client._client.count(collection_name, count_filter=id_filter, exact=True)
+        if result.count == len(ids) or time.monotonic() > deadline:
+            return result.count
+        await asyncio.sleep(0.1)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_qdrant(qdrant_client):
+    """Seed both collections once via batch_upsert; shared by the search tests."""
+    await qdrant_client.ensure_collections()
+
+    # One vectorized draw for both collections; rows go to PointStruct as arrays
+    rng = np.random.default_rng(0)
+    brand_vectors, ad_vectors = rng.standard_normal(
+        (2, _SEED_POINTS, QdrantConfig.EMBEDDING_DIM), dtype=np.float32
+    )
+    brand_ids = _seed_ids("brand")
+    ad_ids = _seed_ids("ad")
+
+    started = time.perf_counter()
+    ok = await asyncio.gather(
+        qdrant_client.batch_upsert(
+            QdrantConfig.COLLECTION_BRANDS,
+            (
+                PointStruct(
+                    id=point_id,
+                    vector=vector,
+                    payload={"brand_name": f"Seed Brand {i}", "confidence_score": 0.9},
+                )
+                for i, (point_id, vector) in enumerate(zip(brand_ids, brand_vectors))
+            ),
+            batch_size=_SEED_BATCH_SIZE,
+            parallel=_SEED_PARALLEL,
+        ),
+        qdrant_client.batch_upsert(
+            QdrantConfig.COLLECTION_AD_CREATIVES,
+            (
+                PointStruct(
+                    id=point_id,
+                    vector=vector,
+                    payload={"angle": "benefit", "performance_score": 0.8, "is_approved": True},
+                )
+                for point_id, vector in zip(ad_ids, ad_vectors)
+            ),
+            batch_size=_SEED_BATCH_SIZE,
+            parallel=_SEED_PARALLEL,
+        ),
+    )
+    visible = await asyncio.gather(
+        _wait_for_points(qdrant_client, QdrantConfig.COLLECTION_BRANDS, brand_ids),
+        _wait_for_points(qdrant_client, QdrantConfig.COLLECTION_AD_CREATIVES, ad_ids),
+    )
+    elapsed = time.perf_counter() - started
+
+    yield {
+        "ok": ok,
+        "visible": visible,
+        "elapsed": elapsed,
+        "brand_ids": brand_ids,
+        "brand_vectors": brand_vectors,
+        "ad_ids": ad_ids,
+        "ad_vectors": ad_vectors,
+    }
+
+    await asyncio.gather(
+        qdrant_client._client.delete(
+            QdrantConfig.COLLECTION_BRANDS, points_selector=PointIdsList(points=brand_ids)
+        ),
+        qdrant_client._client.delete(
+            QdrantConfig.COLLECTION_AD_CREATIVES, points_selector=PointIdsList(points=ad_ids)
+        ),
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="qdrant_collections")
+class TestQdrantBatchContracts:
+    """Batched upsert + search contracts against one shared seed (skipped if Qdrant is down)."""
+
+    async def test_batch_upsert_completes(self, seeded_qdrant):
+        """Test a 256-point batched upsert lands in both collections quickly."""
+        assert seeded_qdrant["ok"] == [True, True]
+        assert seeded_qdrant["visible"] == [_SEED_POINTS, _SEED_POINTS]
+        assert seeded_qdrant["elapsed"] < _SEED_MAX_SECONDS
+
+    async def test_search_similar_brands_finds_seeded_point(self, seeded_qdrant, qdrant_client):
+        """Test a seeded brand vector is its own nearest neighbour."""
+        hits = await qdrant_client.search_similar_brands(
+            seeded_qdrant["brand_vectors"][0], limit=5
+        )
+        assert hits
+        assert str(hits[0]["id"]) == seeded_qdrant["brand_ids"][0]
+        assert hits[0]["payload"]["brand_name"] == "Seed Brand 0"
+
+    async def test_search_similar_ads_finds_seeded_point(self, seeded_qdrant, qdrant_client):
+        """Test a seeded ad vector is its own nearest neighbour under filters."""
+        hits = await qdrant_client.search_similar_ads(
+            seeded_qdrant["ad_vectors"][0], limit=5, angle="benefit", only_approved=True
+        )
+        assert hits
+        assert str(hits[0]["id"]) == seeded_qdrant["ad_ids"][0]
+
+
 @pytest.mark.integration
+@pytest.mark.usefixtures("cached_embeddings")
 class TestEmbeddingIntegrationContracts:
     """Integration tests requiring embedding API (skipped if unavailable)."""
 
-    @pytest.mark.anyio
     async def test_embedding_service_initializes(self):
         """Test embedding service initializes (may use zero vectors if no API key)."""
-        from src.vector.embeddings import get_embedding_service
-
         service = await get_embedding_service()
 
         # Service should exist
         assert service is not None
         assert hasattr(service, "_initialized")
 
-    @pytest.mark.anyio
     async def test_embed_text_returns_vector(self):
         """Test embed_text returns a vector of correct dimension."""
-        from src.vector.embeddings import get_embedding_service, EmbeddingService
-
         service = await get_embedding_service()
         vector = await service.embed_text("test text")
 
         # Should return a list of floats
         assert isinstance(vector, list)
-        assert len(vector) == EmbeddingService.DIMENSIONS
 
-        # All elements should be floats (even if zero)
-        assert all(isinstance(v, float) for v in vector)
+        # Shape and float dtype checked in one C-level conversion (even if zero)
+        arr = np.asarray(vector)
+        assert arr.shape == (EmbeddingService.DIMENSIONS,)
+        assert np.issubdtype(arr.dtype, np.floating)
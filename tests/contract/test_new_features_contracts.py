@@ -4,91 +4,293 @@
 These tests verify API contracts - request/response shapes remain stable.
 """
 
-import pytest
-from httpx import AsyncClient, ASGITransport
-from api_server import app
-
-
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
+import asyncio
 
-@pytest.fixture
-async def client():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from .helpers import JSON_HEADERS, dumps
+
+# One xdist group for the module: every test reads the module-scoped
+# shape_responses, which splitting classes across workers would re-fire
+pytestmark = pytest.mark.xdist_group(name="new_features_api")
+
+
+@pytest.fixture(scope="session")
+def client(async_client):
+    """The session-wide ASGI client from tests/conftest.py (built once)."""
+    return async_client
+
+
+# Fields each response (or nested item) must carry
+REQUIRED_HOOK_FIELDS = frozenset({
+    "hooks",
+    "best_hook",
+    "avg_score",
+    "pattern_distribution",
+    "recommendations",
+    "summary",
+})
+REQUIRED_HOOK_ITEM_FIELDS = frozenset({"text", "pattern", "score", "character_count"})
+REQUIRED_PATTERNS_FIELDS = frozenset({"patterns", "power_words"})
+REQUIRED_PATTERN_ITEM_FIELDS = frozenset({"id", "name"})
+REQUIRED_LANDING_FIELDS = frozenset({
+    "url",
+    "overall_score",
+    "message_match_score",
+    "message_match_level",
+    "above_fold_score",
+    "cta_score",
+    "mobile_score",
+    "load_speed_score",
+})
+REQUIRED_BUDGET_FIELDS = frozenset({
+    "daily_budget",
+    "monthly_budget",
+    "tier",
+    "expected_impressions",
+    "expected_clicks",
+    "expected_conversions",
+    "expected_cpa",
+    "expected_roas",
+    "break_even_days",
+    "confidence_level",
+    "recommendations",
+})
+REQUIRED_BENCHMARK_FIELDS = frozenset({"cpm", "ctr", "cvr", "avg_cpa"})
+REQUIRED_PLATFORM_FIELDS = frozenset({
+    "primary_platform",
+    "strategy",
+    "budget_allocation",
+    "recommendations",
+})
+REQUIRED_PLATFORM_REC_FIELDS = frozenset({
+    "platform",
+    "score",
+    "rank",
+    "min_budget",
+    "cpa_range",
+    "strengths",
+    "best_formats",
+})
+REQUIRED_PLATFORM_LIST_ITEM_FIELDS = frozenset({"id", "name", "min_budget"})
+REQUIRED_ABTEST_PLAN_FIELDS = frozenset({
+    "test_pairs",
+    "required_sample_size",
+    "estimated_days",
+    "daily_budget_needed",
+    "testing_sequence",
+    "recommendations",
+})
+REQUIRED_TEST_PAIR_FIELDS = frozenset({
+    "element",
+    "variant_a",
+    "variant_b",
+    "hypothesis",
+    "priority",
+    "expected_lift",
+})
+REQUIRED_SIGNIFICANCE_FIELDS = frozenset({
+    "is_significant",
+    "confidence",
+    "lift",
+    "control_rate",
+    "variant_rate",
+})
+REQUIRED_AUDIENCE_FIELDS = frozenset({
+    "primary_audiences",
+    "secondary_audiences",
+    "exclusions",
+    "lookalike_strategy",
+    "budget_allocation",
+    "testing_order",
+    "recommendations",
+})
+REQUIRED_AUDIENCE_ITEM_FIELDS = frozenset({
+    "name",
+    "type",
+    "estimated_size",
+    "relevance_score",
+})
+REQUIRED_EXCLUSION_FIELDS = frozenset({"name", "reason", "impact"})
+REQUIRED_ITERATION_FIELDS = frozenset({
+    "diagnoses",
+    "improved_variants",
+    "priority_fixes",
+    "testing_roadmap",
+    "quick_wins",
+    "estimated_improvement",
+})
+REQUIRED_DIAGNOSIS_FIELDS = frozenset({
+    "issue",
+    "severity",
+    "description",
+    "likely_cause",
+    "impact",
+})
+REQUIRED_IMPROVEMENT_FIELDS = frozenset({
+    "element",
+    "original",
+    "improved",
+    "rationale",
+    "expected_improvement",
+})
+REQUIRED_SOCIAL_FIELDS = frozenset({
+    "proofs",
+    "trust_score",
+    "ad_snippets",
+    "recommendations",
+})
+REQUIRED_PROOF_FIELDS = frozenset({"type", "content", "source", "ad_ready"})
+
+
+def _missing_item_fields(items, required: frozenset) -> dict:
+    """Map each item (by index, or key for a dict) to the fields it lacks.
+
+    One pass over the collection; an item that is not an object is reported
+    as such instead of raising mid-loop.
+    """
+    pairs = items.items() if isinstance(items, dict) else enumerate(items)
+    missing = {}
+    for key, item in pairs:
+        if not isinstance(item, dict):
+            missing[key] = f"not an object: {item!r}"
+        elif not required <= item.keys():
+            missing[key] = required - item.keys()
+    return missing
+
+
+def _all_in_range(items, key: str, lo: float, hi: float) -> bool:
+    """Whether ``item[key]`` lies in [lo, hi] for every item (one array pass)."""
+    values = np.fromiter((item[key] for item in items), dtype=float)
+    return values.size == 0 or bool(values.min() >= lo and values.max() <= hi)
+
+
+# (method, path) -> JSON body for every shape-only request in this module
+_SHAPE_REQUESTS = {
+    ("POST", "/hooks/generate"): {
+        "product_name": "Test",
+        "product_description": "Test",
+        "target_audience": "Users",
+    },
+    ("GET", "/hooks/patterns"): None,
+    ("POST", "/landing/analyze"): {
+        "landing_page_url": "https://test.com",
+        "ad_headline": "Test",
+        "ad_primary_text": "Test",
+        "ad_cta": "Test",
+    },
+    ("POST", "/budget/simulate"): {
+        "industry": "saas",
+        "goal": "leads",
+        "product_price": 99.0,
+        "target_monthly_conversions": 50,
+    },
+    ("GET", "/budget/benchmarks"): None,
+    ("POST", "/platforms/recommend"): {
+        "product_type": "b2b_saas",
+        "audience_type": "founders",
+        "monthly_budget": 1000,
+    },
+    ("GET", "/platforms/list"): None,
+    ("POST", "/abtest/plan"): {
+        "variants": [{"headline": "A"}, {"headline": "B"}],
+        "daily_budget": 50,
+    },
+    ("POST", "/abtest/calculate"): {
+        "control_conversions": 100,
+        "control_visitors": 5000,
+        "variant_conversions": 150,
+        "variant_visitors": 5000,
+    },
+    ("POST", "/audience/suggest"): {
+        "product_name": "Test",
+        "product_description": "Test",
+        "target_persona": "Users",
+    },
+    ("POST", "/iterate/analyze"): {
+        "headline": "Test",
+        "primary_text": "Test",
+        "cta": "Test",
+        "current_ctr": 1.0,
+        "current_cvr": 2.0,
+        "current_cpa": 80,
+        "target_cpa": 50,
+    },
+    ("POST", "/social/collect"): {
+        "brand_name": "Test",
+        "product_description": "Test",
+    },
+}
+
+
+class _Responses(dict):
+    """Responses keyed by (method, path); re-raises a failed call on lookup."""
+
+    def __getitem__(self, key):
+        result = super().__getitem__(key)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shape_responses(async_client):
+    """Fire every shape-only request concurrently, once per module.
+
+    Each shape test then asserts on its own response, so failures are still
+    reported per endpoint; a call that raised is re-raised in its test.
+    """
+    results = await asyncio.gather(
+        *(
+            async_client.get(path) if method == "GET"
+            else async_client.post(path, content=dumps(body), headers=JSON_HEADERS)
+            for (method, path), body in _SHAPE_REQUESTS.items()
+        ),
+        return_exceptions=True,
+    )
+    return _Responses(zip(_SHAPE_REQUESTS, results))
 
 
 class TestHookGeneratorContract:
     """Contract tests for Hook Generator API."""
 
-    @pytest.mark.anyio
-    async def test_generate_response_shape(self, client):
+    async def test_generate_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/hooks/generate", json={
-            "product_name": "Test",
-            "product_description": "Test",
-            "target_audience": "Users",
-        })
+        response = shape_responses["POST", "/hooks/generate"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "hooks" in data
-        assert "best_hook" in data
-        assert "avg_score" in data
-        assert "pattern_distribution" in data
-        assert "recommendations" in data
-        assert "summary" in data
+        assert not REQUIRED_HOOK_FIELDS - data.keys()
         
         # Hook shape
-        for hook in data["hooks"]:
-            assert "text" in hook
-            assert "pattern" in hook
-            assert "score" in hook
-            assert "character_count" in hook
-
-    @pytest.mark.anyio
-    async def test_patterns_response_shape(self, client):
+        assert not _missing_item_fields(data["hooks"], REQUIRED_HOOK_ITEM_FIELDS)
+        assert _all_in_range(data["hooks"], "score", 0, 100)
+
+    async def test_patterns_response_shape(self, shape_responses):
         """Verify patterns response shape."""
-        response = await client.get("/hooks/patterns")
+        response = shape_responses["GET", "/hooks/patterns"]
         assert response.status_code == 200
         data = response.json()
         
-        assert "patterns" in data
-        assert "power_words" in data
+        assert not REQUIRED_PATTERNS_FIELDS - data.keys()
         
-        for pattern in data["patterns"]:
-            assert "id" in pattern
-            assert "name" in pattern
+        assert not _missing_item_fields(data["patterns"], REQUIRED_PATTERN_ITEM_FIELDS)
 
 
 class TestLandingPageAnalyzerContract:
     """Contract tests for Landing Page Analyzer API."""
 
-    @pytest.mark.anyio
-    async def test_analyze_response_shape(self, client):
+    async def test_analyze_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/landing/analyze", json={
-            "landing_page_url": "https://test.com",
-            "ad_headline": "Test",
-            "ad_primary_text": "Test",
-            "ad_cta": "Test",
-        })
+        response = shape_responses["POST", "/landing/analyze"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "url" in data
-        assert "overall_score" in data
-        assert "message_match_score" in data
-        assert "message_match_level" in data
-        assert "above_fold_score" in data
-        assert "cta_score" in data
-        assert "mobile_score" in data
-        assert "load_speed_score" in data
+        assert not REQUIRED_LANDING_FIELDS - data.keys()
         
         # Score ranges
         assert 0 <= data["overall_score"] <= 100
@@ -98,286 +300,168 @@ class TestLandingPageAnalyzerContract:
 class TestBudgetSimulatorContract:
     """Contract tests for Budget Simulator API."""
 
-    @pytest.mark.anyio
-    async def test_simulate_response_shape(self, client):
+    async def test_simulate_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/budget/simulate", json={
-            "industry": "saas",
-            "goal": "leads",
-            "product_price": 99.0,
-            "target_monthly_conversions": 50,
-        })
+        response = shape_responses["POST", "/budget/simulate"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "daily_budget" in data
-        assert "monthly_budget" in data
-        assert "tier" in data
-        assert "expected_impressions" in data
-        assert "expected_clicks" in data
-        assert "expected_conversions" in data
-        assert "expected_cpa" in data
-        assert "expected_roas" in data
-        assert "break_even_days" in data
-        assert "confidence_level" in data
-        assert "recommendations" in data
+        assert not REQUIRED_BUDGET_FIELDS - data.keys()
         
         # Type checks
         assert isinstance(data["daily_budget"], (int, float))
         assert data["tier"] in ["starter", "growth", "scale", "enterprise"]
 
-    @pytest.mark.anyio
-    async def test_benchmarks_response_shape(self, client):
+    async def test_benchmarks_response_shape(self, shape_responses):
         """Verify benchmarks response shape."""
-        response = await client.get("/budget/benchmarks")
+        response = shape_responses["GET", "/budget/benchmarks"]
         assert response.status_code == 200
         data = response.json()
         
         # Each industry should have benchmark data
-        for industry, benchmarks in data.items():
-            assert "cpm" in benchmarks
-            assert "ctr" in benchmarks
-            assert "cvr" in benchmarks
-            assert "avg_cpa" in benchmarks
+        assert not _missing_item_fields(data, REQUIRED_BENCHMARK_FIELDS)
 
 
 class TestPlatformRecommenderContract:
     """Contract tests for Platform Recommender API."""
 
-    @pytest.mark.anyio
-    async def test_recommend_response_shape(self, client):
+    async def test_recommend_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/platforms/recommend", json={
-            "product_type": "b2b_saas",
-            "audience_type": "founders",
-            "monthly_budget": 1000,
-        })
+        response = shape_responses["POST", "/platforms/recommend"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "primary_platform" in data
-        assert "strategy" in data
-        assert "budget_allocation" in data
-        assert "recommendations" in data
+        assert not REQUIRED_PLATFORM_FIELDS - data.keys()
         
         # Recommendation shape
-        for rec in data["recommendations"]:
-            assert "platform" in rec
-            assert "score" in rec
-            assert "rank" in rec
-            assert "min_budget" in rec
-            assert "cpa_range" in rec
-            assert "strengths" in rec
-            assert "best_formats" in rec
-
-    @pytest.mark.anyio
-    async def test_platforms_list_response_shape(self, client):
+        assert not _missing_item_fields(data["recommendations"], REQUIRED_PLATFORM_REC_FIELDS)
+        assert _all_in_range(data["recommendations"], "score", 0, 100)
+
+    async def test_platforms_list_response_shape(self, shape_responses):
         """Verify platforms list response shape."""
-        response = await client.get("/platforms/list")
+        response = shape_responses["GET", "/platforms/list"]
         assert response.status_code == 200
         data = response.json()
         
-        for platform in data:
-            assert "id" in platform
-            assert "name" in platform
-            assert "min_budget" in platform
+        assert not _missing_item_fields(data, REQUIRED_PLATFORM_LIST_ITEM_FIELDS)
 
 
 class TestABTestPlannerContract:
     """Contract tests for A/B Test Planner API."""
 
-    @pytest.mark.anyio
-    async def test_plan_response_shape(self, client):
+    async def test_plan_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/abtest/plan", json={
-            "variants": [{"headline": "A"}, {"headline": "B"}],
-            "daily_budget": 50,
-        })
+        response = shape_responses["POST", "/abtest/plan"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "test_pairs" in data
-        assert "required_sample_size" in data
-        assert "estimated_days" in data
-        assert "daily_budget_needed" in data
-        assert "testing_sequence" in data
-        assert "recommendations" in data
+        assert not REQUIRED_ABTEST_PLAN_FIELDS - data.keys()
         
         # Test pair shape
-        for pair in data["test_pairs"]:
-            assert "element" in pair
-            assert "variant_a" in pair
-            assert "variant_b" in pair
-            assert "hypothesis" in pair
-            assert "priority" in pair
-            assert "expected_lift" in pair
-
-    @pytest.mark.anyio
-    async def test_calculate_response_shape(self, client):
+        assert not _missing_item_fields(data["test_pairs"], REQUIRED_TEST_PAIR_FIELDS)
+
+    async def test_calculate_response_shape(self, shape_responses):
         """Verify calculate response shape."""
-        response = await client.post("/abtest/calculate", json={
-            "control_conversions": 100,
-            "control_visitors": 5000,
-            "variant_conversions": 150,
-            "variant_visitors": 5000,
-        })
+        response = shape_responses["POST", "/abtest/calculate"]
         assert response.status_code == 200
         data = response.json()
         
-        assert "is_significant" in data
-        assert "confidence" in data
-        assert "lift" in data
-        assert "control_rate" in data
-        assert "variant_rate" in data
+        assert not REQUIRED_SIGNIFICANCE_FIELDS - data.keys()
         assert isinstance(data["is_significant"], bool)
 
 
 class TestAudienceTargetingContract:
     """Contract tests for Audience Targeting API."""
 
-    @pytest.mark.anyio
-    async def test_suggest_response_shape(self, client):
+    async def test_suggest_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/audience/suggest", json={
-            "product_name": "Test",
-            "product_description": "Test",
-            "target_persona": "Users",
-        })
+        response = shape_responses["POST", "/audience/suggest"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "primary_audiences" in data
-        assert "secondary_audiences" in data
-        assert "exclusions" in data
-        assert "lookalike_strategy" in data
-        assert "budget_allocation" in data
-        assert "testing_order" in data
-        assert "recommendations" in data
+        assert not REQUIRED_AUDIENCE_FIELDS - data.keys()
         
         # Audience shape
-        for aud in data["primary_audiences"]:
-            assert "name" in aud
-            assert "type" in aud
-            assert "estimated_size" in aud
-            assert "relevance_score" in aud
+        assert not _missing_item_fields(data["primary_audiences"], REQUIRED_AUDIENCE_ITEM_FIELDS)
+        assert _all_in_range(data["primary_audiences"], "relevance_score", 0, 100)
         
         # Exclusion shape
-        for exc in data["exclusions"]:
-            assert "name" in exc
-            assert "reason" in exc
-            assert "impact" in exc
+        assert not _missing_item_fields(data["exclusions"], REQUIRED_EXCLUSION_FIELDS)
 
 
 class TestIterationAssistantContract:
     """Contract tests for Iteration Assistant API."""
 
-    @pytest.mark.anyio
-    async def test_analyze_response_shape(self, client):
+    async def test_analyze_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/iterate/analyze", json={
-            "headline": "Test",
-            "primary_text": "Test",
-            "cta": "Test",
-            "current_ctr": 1.0,
-            "current_cvr": 2.0,
-            "current_cpa": 80,
-            "target_cpa": 50,
-        })
+        response = shape_responses["POST", "/iterate/analyze"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "diagnoses" in data
-        assert "improved_variants" in data
-        assert "priority_fixes" in data
-        assert "testing_roadmap" in data
-        assert "quick_wins" in data
-        assert "estimated_improvement" in data
+        assert not REQUIRED_ITERATION_FIELDS - data.keys()
         
         # Diagnosis shape
-        for diag in data["diagnoses"]:
-            assert "issue" in diag
-            assert "severity" in diag
-            assert "description" in diag
-            assert "likely_cause" in diag
-            assert "impact" in diag
+        assert not _missing_item_fields(data["diagnoses"], REQUIRED_DIAGNOSIS_FIELDS)
         
         # Improvement shape
-        for imp in data["improved_variants"]:
-            assert "element" in imp
-            assert "original" in imp
-            assert "improved" in imp
-            assert "rationale" in imp
-            assert "expected_improvement" in imp
+        assert not _missing_item_fields(data["improved_variants"], REQUIRED_IMPROVEMENT_FIELDS)
 
 
 class TestSocialProofCollectorContract:
     """Contract tests for Social Proof Collector API."""
 
-    @pytest.mark.anyio
-    async def test_collect_response_shape(self, client):
+    async def test_collect_response_shape(self, shape_responses):
         """Verify response shape matches contract."""
-        response = await client.post("/social/collect", json={
-            "brand_name": "Test",
-            "product_description": "Test",
-        })
+        response = shape_responses["POST", "/social/collect"]
         assert response.status_code == 200
         data = response.json()
         
         # Required fields
-        assert "proofs" in data
-        assert "trust_score" in data
-        assert "ad_snippets" in data
-        assert "recommendations" in data
+        assert not REQUIRED_SOCIAL_FIELDS - data.keys()
         
         # Score range
         assert 0 <= data["trust_score"] <= 100
         
         # Proof shape
-        for proof in data["proofs"]:
-            assert "type" in proof
-            assert "content" in proof
-            assert "source" in proof
-            assert "ad_ready" in proof
+        assert not _missing_item_fields(data["proofs"], REQUIRED_PROOF_FIELDS)
+
+
+# Request bodies for the HTTP error tests, serialized once at import
+_BAD_INDUSTRY_BODY = dumps({
+    "industry": "invalid_industry",
+    "goal": "leads",
+    "product_price": 99.0,
+    "target_monthly_conversions": 50,
+})
+_MISSING_PRODUCT_NAME_BODY = dumps({
+    "product_description": "Test",
+})
+_NEGATIVE_CTR_BODY = dumps({
+    "headline": "Test",
+    "primary_text": "Test",
+    "cta": "Test",
+    "current_ctr": -1.0,  # Invalid negative
+    "current_cvr": 2.0,
+    "current_cpa": 80,
+    "target_cpa": 50,
+})
 
 
 class TestErrorContracts:
     """Test error response contracts."""
 
-    @pytest.mark.anyio
-    async def test_invalid_industry_error(self, client):
-        """Test error response for invalid industry."""
-        response = await client.post("/budget/simulate", json={
-            "industry": "invalid_industry",
-            "goal": "leads",
-            "product_price": 99.0,
-            "target_monthly_conversions": 50,
-        })
-        assert response.status_code == 422  # Validation error
-
-    @pytest.mark.anyio
-    async def test_missing_required_field_error(self, client):
-        """Test error response for missing required field."""
-        response = await client.post("/hooks/generate", json={
-            "product_description": "Test",
-        })
-        assert response.status_code == 422  # Validation error
-
-    @pytest.mark.anyio
-    async def test_invalid_score_range_error(self, client):
-        """Test error response for out-of-range values."""
-        response = await client.post("/iterate/analyze", json={
-            "headline": "Test",
-            "primary_text": "Test",
-            "cta": "Test",
-            "current_ctr": -1.0,  # Invalid negative
-            "current_cvr": 2.0,
-            "current_cpa": 80,
-            "target_cpa": 50,
-        })
-        # Should handle gracefully or return validation error
-        assert response.status_code in [200, 422]
+    @pytest.mark.parametrize("path, body, expected", [
+        pytest.param("/budget/simulate", _BAD_INDUSTRY_BODY, {422}, id="invalid_industry"),
+        pytest.param("/hooks/generate", _MISSING_PRODUCT_NAME_BODY, {422}, id="missing_required_field"),
+        # Negative CTR may be handled gracefully or rejected
+        pytest.param("/iterate/analyze", _NEGATIVE_CTR_BODY, {200, 422}, id="invalid_score_range"),
+    ])
+    async def test_error_response(self, client, path, body, expected):
+        """Test invalid requests get a validation error (or graceful handling)."""
+        response = await client.post(path, content=body, headers=JSON_HEADERS)
+        assert response.status_code in expected
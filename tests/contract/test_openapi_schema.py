@@ -6,37 +6,67 @@ Ensures contract between frontend and backend is maintained.
 """
 
 import pytest
-from httpx import AsyncClient, ASGITransport
 
-# Import the FastAPI app
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from api_server import app
+from .helpers import JSON_HEADERS, dumps
 
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def openapi_schema():
-    """Get the OpenAPI schema from the app."""
+# Operations that must declare responses (other keys are e.g. "parameters")
+HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+
+# Request bodies are serialized once at import, not on every post
+_PREDICT_BODY = dumps({
+    "headline": "Test Headline",
+    "primary_text": "Test primary text for the ad",
+    "cta": "Learn More",
+})
+_PREDICT_NO_HEADLINE_BODY = dumps({
+    "primary_text": "Test text",
+    "cta": "Learn More",
+})
+_VIDEO_GENERATE_BODY = dumps({
+    "brand_name": "TestBrand",
+    "product_description": "Test product description",
+    "target_audience": "Test audience",
+    "key_benefits": ["Benefit 1", "Benefit 2"],
+    "cta": "Get Started",
+})
+_ATTENTION_BODY = dumps({
+    "image_url": "https://images.unsplash.com/photo-1486312338219-ce68d2c6f44d?w=600",
+    "headline": "Test Headline",
+    "cta": "Learn More",
+})
+_SENTIMENT_CHECK_BODY = dumps({
+    "brand_name": "TestBrand",
+    "scenario": "normal",
+})
+
+
+@pytest.fixture(scope="session")
+def openapi_schema(app):
+    """Get the OpenAPI schema from the app (built once per session)."""
     return app.openapi()
 
 
-@pytest.fixture
-async def async_client():
-    """Create async test client."""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+@pytest.fixture(scope="session")
+def endpoint_index(openapi_schema):
+    """Flat (path, method, operation) tuples for every HTTP operation."""
+    return tuple(
+        (path, method, details)
+        for path, methods in openapi_schema["paths"].items()
+        for method, details in methods.items()
+        if method in HTTP_METHODS
+    )
 
 
 # =============================================================================
 # SCHEMA VALIDATION TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group(name="openapi_schema_validity")
 class TestOpenAPISchemaValidity:
     """Test that the OpenAPI schema itself is valid."""
     
@@ -54,12 +84,14 @@ class TestOpenAPISchemaValidity:
         assert len(openapi_schema["paths"]) > 0
     
     @pytest.mark.contract
-    def test_all_endpoints_have_responses(self, openapi_schema):
+    def test_all_endpoints_have_responses(self, endpoint_index):
         """Verify all endpoints define responses."""
-        for path, methods in openapi_schema["paths"].items():
-            for method, details in methods.items():
-                if method in ["get", "post", "put", "delete", "patch"]:
-                    assert "responses" in details, f"No responses for {method.upper()} {path}"
+        missing = [
+            f"{method.upper()} {path}"
+            for path, method, details in endpoint_index
+            if "responses" not in details
+        ]
+        assert not missing, f"No responses for {missing}"
     
     @pytest.mark.contract
     def test_api_version_matches(self, openapi_schema):
@@ -72,11 +104,11 @@ class TestOpenAPISchemaValidity:
         assert "BrandTruth" in openapi_schema["info"]["title"]
 
 
+@pytest.mark.xdist_group(name="openapi_endpoint_schema_compliance")
 class TestEndpointSchemaCompliance:
     """Test that actual API responses match their schemas."""
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_root_endpoint_schema(self, async_client):
         """Test / endpoint matches schema."""
         response = await async_client.get("/")
@@ -89,7 +121,6 @@ class TestEndpointSchemaCompliance:
         assert "endpoints" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_health_endpoint_schema(self, async_client):
         """Test /health endpoint matches schema."""
         response = await async_client.get("/health")
@@ -101,16 +132,11 @@ class TestEndpointSchemaCompliance:
         assert "version" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_predict_endpoint_schema(self, async_client):
         """Test /predict endpoint request/response schema."""
-        request_data = {
-            "headline": "Test Headline",
-            "primary_text": "Test primary text for the ad",
-            "cta": "Learn More"
-        }
-        
-        response = await async_client.post("/predict", json=request_data)
+        response = await async_client.post(
+            "/predict", content=_PREDICT_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 200
         
         data = response.json()
@@ -124,7 +150,6 @@ class TestEndpointSchemaCompliance:
         assert 0 <= data["score"] <= 100
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_predict_demo_endpoint_schema(self, async_client):
         """Test /predict/demo endpoint schema (POST)."""
         response = await async_client.post("/predict/demo")
@@ -136,7 +161,6 @@ class TestEndpointSchemaCompliance:
         assert "summary" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_attention_demo_endpoint_schema(self, async_client):
         """Test /attention/demo endpoint schema (POST)."""
         response = await async_client.post("/attention/demo")
@@ -148,7 +172,6 @@ class TestEndpointSchemaCompliance:
         assert "summary" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_export_formats_endpoint_schema(self, async_client):
         """Test /export/formats endpoint schema."""
         response = await async_client.get("/export/formats")
@@ -167,7 +190,6 @@ class TestEndpointSchemaCompliance:
             assert "height" in fmt
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_video_styles_endpoint_schema(self, async_client):
         """Test /video/styles endpoint schema."""
         response = await async_client.get("/video/styles")
@@ -183,7 +205,6 @@ class TestEndpointSchemaCompliance:
             assert "description" in style
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_video_avatars_endpoint_schema(self, async_client):
         """Test /video/avatars endpoint schema."""
         response = await async_client.get("/video/avatars")
@@ -194,7 +215,6 @@ class TestEndpointSchemaCompliance:
         assert isinstance(data["avatars"], list)
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_video_music_endpoint_schema(self, async_client):
         """Test /video/music endpoint schema."""
         response = await async_client.get("/video/music")
@@ -205,39 +225,32 @@ class TestEndpointSchemaCompliance:
         assert isinstance(data["tracks"], list)
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
-    async def test_fatigue_demo_endpoint_schema(self, async_client):
+    @pytest.mark.parametrize("scenario", ["fresh", "healthy", "moderate", "high", "critical"])
+    async def test_fatigue_demo_endpoint_schema(self, async_client, scenario):
         """Test /fatigue/demo/:scenario endpoint schema (POST)."""
-        scenarios = ["fresh", "healthy", "moderate", "high", "critical"]
+        response = await async_client.post(f"/fatigue/demo/{scenario}")
+        assert response.status_code == 200
         
-        for scenario in scenarios:
-            response = await async_client.post(f"/fatigue/demo/{scenario}")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "demo" in data
-            assert "scenario" in data
-            assert "fatigue_score" in data
-            assert "summary" in data
+        data = response.json()
+        assert "demo" in data
+        assert "scenario" in data
+        assert "fatigue_score" in data
+        assert "summary" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
-    async def test_sentiment_demo_endpoint_schema(self, async_client):
+    @pytest.mark.parametrize("scenario", ["normal", "crisis", "positive"])
+    async def test_sentiment_demo_endpoint_schema(self, async_client, scenario):
         """Test /sentiment/demo/:scenario endpoint schema (POST)."""
-        scenarios = ["normal", "crisis", "positive"]
+        response = await async_client.post(f"/sentiment/demo/{scenario}")
+        assert response.status_code == 200
         
-        for scenario in scenarios:
-            response = await async_client.post(f"/sentiment/demo/{scenario}")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "demo" in data
-            assert "scenario" in data
-            assert "health" in data
-            assert "auto_pause" in data
+        data = response.json()
+        assert "demo" in data
+        assert "scenario" in data
+        assert "health" in data
+        assert "auto_pause" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_proof_demo_endpoint_schema(self, async_client):
         """Test /proof/demo endpoint schema (POST)."""
         response = await async_client.post("/proof/demo")
@@ -249,22 +262,18 @@ class TestEndpointSchemaCompliance:
         assert "safety_score" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
-    async def test_intel_demo_endpoint_schema(self, async_client):
+    @pytest.mark.parametrize("industry", ["career", "saas", "ecommerce"])
+    async def test_intel_demo_endpoint_schema(self, async_client, industry):
         """Test /intel/demo/:industry endpoint schema (POST)."""
-        industries = ["career", "saas", "ecommerce"]
+        response = await async_client.post(f"/intel/demo/{industry}")
+        assert response.status_code == 200
         
-        for industry in industries:
-            response = await async_client.post(f"/intel/demo/{industry}")
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "demo" in data
-            assert "industry" in data
-            assert "summary" in data
+        data = response.json()
+        assert "demo" in data
+        assert "industry" in data
+        assert "summary" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_jobs_endpoint_schema(self, async_client):
         """Test /jobs endpoint schema."""
         response = await async_client.get("/jobs")
@@ -275,85 +284,70 @@ class TestEndpointSchemaCompliance:
         assert isinstance(data["jobs"], list)
 
 
+@pytest.mark.xdist_group(name="openapi_request_validation")
 class TestRequestValidation:
     """Test that invalid requests are properly rejected."""
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_predict_missing_required_field(self, async_client):
         """Test /predict rejects missing required fields."""
-        # Missing headline
-        request_data = {
-            "primary_text": "Test text",
-            "cta": "Learn More"
-        }
-        
-        response = await async_client.post("/predict", json=request_data)
+        response = await async_client.post(
+            "/predict", content=_PREDICT_NO_HEADLINE_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 422  # Validation error
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_intel_invalid_industry(self, async_client):
         """Test /intel/demo rejects invalid industry (POST)."""
         response = await async_client.post("/intel/demo/invalid_industry_xyz")
         assert response.status_code == 400
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_video_invalid_style(self, async_client):
         """Test /video/demo rejects invalid style (POST)."""
         response = await async_client.post("/video/demo/invalid_style_xyz")
         assert response.status_code == 400
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_fatigue_invalid_scenario(self, async_client):
         """Test /fatigue/demo rejects invalid scenario (POST)."""
         response = await async_client.post("/fatigue/demo/invalid_scenario_xyz")
         assert response.status_code == 400
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_sentiment_invalid_scenario(self, async_client):
         """Test /sentiment/demo rejects invalid scenario (POST)."""
         response = await async_client.post("/sentiment/demo/invalid_scenario_xyz")
         assert response.status_code == 400
 
 
+@pytest.mark.xdist_group(name="openapi_response_types")
 class TestResponseTypes:
     """Test that responses have correct content types."""
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_json_content_type(self, async_client):
         """Test JSON endpoints return correct content type."""
         response = await async_client.get("/")
         assert "application/json" in response.headers.get("content-type", "")
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_health_json_content_type(self, async_client):
         """Test health endpoint returns JSON."""
         response = await async_client.get("/health")
         assert "application/json" in response.headers.get("content-type", "")
 
 
+@pytest.mark.xdist_group(name="openapi_critical_endpoints")
 class TestCriticalEndpoints:
     """Test the most critical API endpoints for ad generation."""
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_video_generate_endpoint_schema(self, async_client):
         """Test /video/generate endpoint schema."""
-        request_data = {
-            "brand_name": "TestBrand",
-            "product_description": "Test product description",
-            "target_audience": "Test audience",
-            "key_benefits": ["Benefit 1", "Benefit 2"],
-            "cta": "Get Started"
-        }
-        
-        response = await async_client.post("/video/generate", json=request_data)
+        response = await async_client.post(
+            "/video/generate", content=_VIDEO_GENERATE_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 200
         
         data = response.json()
@@ -363,16 +357,11 @@ class TestCriticalEndpoints:
         assert "script" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_attention_analyze_endpoint_schema(self, async_client):
         """Test /attention/analyze endpoint schema."""
-        request_data = {
-            "image_url": "https://images.unsplash.com/photo-1486312338219-ce68d2c6f44d?w=600",
-            "headline": "Test Headline",
-            "cta": "Learn More"
-        }
-        
-        response = await async_client.post("/attention/analyze", json=request_data)
+        response = await async_client.post(
+            "/attention/analyze", content=_ATTENTION_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 200
         
         data = response.json()
@@ -380,15 +369,11 @@ class TestCriticalEndpoints:
         assert "summary" in data
     
     @pytest.mark.contract
-    @pytest.mark.asyncio
     async def test_sentiment_check_endpoint_schema(self, async_client):
         """Test /sentiment/check endpoint schema."""
-        request_data = {
-            "brand_name": "TestBrand",
-            "scenario": "normal"
-        }
-        
-        response = await async_client.post("/sentiment/check", json=request_data)
+        response = await async_client.post(
+            "/sentiment/check", content=_SENTIMENT_CHECK_BODY, headers=JSON_HEADERS
+        )
         assert response.status_code == 200
         
         data = response.json()
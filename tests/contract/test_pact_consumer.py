@@ -8,72 +8,51 @@ Install: pip install pact-python
 """
 
 import pytest
-import atexit
-from pathlib import Path
 
 # Try to import pact, skip tests if not installed
 try:
-    from pact import Consumer, Provider, Like, EachLike, Term
+    from pact import Like, EachLike, Term
     PACT_AVAILABLE = True
 except ImportError:
     PACT_AVAILABLE = False
     pytest.skip("pact-python not installed", allow_module_level=True)
 
 
-# =============================================================================
-# PACT SETUP
-# =============================================================================
-
-PACT_DIR = Path(__file__).parent / "pacts"
-PACT_DIR.mkdir(exist_ok=True)
-
-# Create the pact between consumer (frontend) and provider (backend)
-pact = Consumer("BrandTruthFrontend").has_pact_with(
-    Provider("BrandTruthAPI"),
-    pact_dir=str(PACT_DIR),
-    log_dir=str(PACT_DIR / "logs"),
-)
-
-# Start the mock service
-pact.start_service()
-
-# Ensure we stop the service when tests complete
-atexit.register(pact.stop_service)
-
-
 # =============================================================================
 # CONSUMER CONTRACT TESTS
 # =============================================================================
 
+@pytest.mark.xdist_group(name="pact_health_contract")
 class TestHealthContract:
     """Contract for /health endpoint."""
     
     @pytest.mark.pact
-    def test_health_endpoint_contract(self):
+    def test_health_endpoint_contract(self, pact_mock, pact_url, http):
         """Frontend expects health endpoint to return status."""
         expected = {
             "status": "healthy"
         }
         
-        (pact
+        (pact_mock
          .given("the API is running")
          .upon_receiving("a health check request")
          .with_request("GET", "/health")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            # Simulate frontend calling the API
-            import requests
-            result = requests.get(f"{pact.uri}/health")
-            assert result.status_code == 200
-            assert result.json()["status"] == "healthy"
+        pact_mock.setup()
+        # Simulate frontend calling the API
+        result = http.get(f"{pact_url}/health")
+        assert result.status_code == 200
+        assert result.json()["status"] == "healthy"
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_predict_contract")
 class TestPredictContract:
     """Contract for /predict endpoint."""
     
     @pytest.mark.pact
-    def test_predict_endpoint_contract(self):
+    def test_predict_endpoint_contract(self, pact_mock, pact_url, http):
         """Frontend expects prediction response structure."""
         request_body = {
             "headline": "Test Headline",
@@ -110,30 +89,31 @@ class TestPredictContract:
             }, minimum=0),
         }
         
-        (pact
+        (pact_mock
          .given("prediction service is available")
          .upon_receiving("a performance prediction request")
          .with_request("POST", "/predict", body=request_body, headers={"Content-Type": "application/json"})
          .will_respond_with(200, body=expected_response))
         
-        with pact:
-            import requests
-            result = requests.post(
-                f"{pact.uri}/predict",
-                json=request_body,
-                headers={"Content-Type": "application/json"}
-            )
-            assert result.status_code == 200
-            data = result.json()
-            assert "overall_score" in data
-            assert "performance_tier" in data
+        pact_mock.setup()
+        result = http.post(
+            f"{pact_url}/predict",
+            json=request_body,
+            headers={"Content-Type": "application/json"}
+        )
+        assert result.status_code == 200
+        data = result.json()
+        assert "overall_score" in data
+        assert "performance_tier" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_export_formats_contract")
 class TestExportFormatsContract:
     """Contract for /export/formats endpoint."""
     
     @pytest.mark.pact
-    def test_export_formats_contract(self):
+    def test_export_formats_contract(self, pact_mock, pact_url, http):
         """Frontend expects format list structure."""
         expected = {
             "formats": EachLike({
@@ -146,26 +126,27 @@ class TestExportFormatsContract:
             })
         }
         
-        (pact
+        (pact_mock
          .given("export formats are available")
          .upon_receiving("a request for available formats")
          .with_request("GET", "/export/formats")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/export/formats")
-            assert result.status_code == 200
-            data = result.json()
-            assert "formats" in data
-            assert isinstance(data["formats"], list)
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/export/formats")
+        assert result.status_code == 200
+        data = result.json()
+        assert "formats" in data
+        assert isinstance(data["formats"], list)
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_video_styles_contract")
 class TestVideoStylesContract:
     """Contract for /video/styles endpoint."""
     
     @pytest.mark.pact
-    def test_video_styles_contract(self):
+    def test_video_styles_contract(self, pact_mock, pact_url, http):
         """Frontend expects video styles structure."""
         expected = {
             "styles": EachLike({
@@ -177,49 +158,51 @@ class TestVideoStylesContract:
             })
         }
         
-        (pact
+        (pact_mock
          .given("video styles are available")
          .upon_receiving("a request for video styles")
          .with_request("GET", "/video/styles")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/video/styles")
-            assert result.status_code == 200
-            data = result.json()
-            assert "styles" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/video/styles")
+        assert result.status_code == 200
+        data = result.json()
+        assert "styles" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_intel_industries_contract")
 class TestIntelIndustriesContract:
     """Contract for /intel/industries endpoint."""
     
     @pytest.mark.pact
-    def test_intel_industries_contract(self):
+    def test_intel_industries_contract(self, pact_mock, pact_url, http):
         """Frontend expects industries list."""
         expected = {
             "industries": EachLike("career", minimum=1)
         }
         
-        (pact
+        (pact_mock
          .given("industries list is available")
          .upon_receiving("a request for supported industries")
          .with_request("GET", "/intel/industries")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/intel/industries")
-            assert result.status_code == 200
-            data = result.json()
-            assert "industries" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/intel/industries")
+        assert result.status_code == 200
+        data = result.json()
+        assert "industries" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_fatigue_demo_contract")
 class TestFatigueDemoContract:
     """Contract for /fatigue/demo/:scenario endpoint."""
     
     @pytest.mark.pact
-    def test_fatigue_demo_fresh_contract(self):
+    def test_fatigue_demo_fresh_contract(self, pact_mock, pact_url, http):
         """Frontend expects fatigue response for fresh scenario."""
         expected = {
             "fatigue_score": Like(15),
@@ -234,25 +217,26 @@ class TestFatigueDemoContract:
             }),
         }
         
-        (pact
+        (pact_mock
          .given("fatigue demo is available")
          .upon_receiving("a request for fresh fatigue demo")
          .with_request("GET", "/fatigue/demo/fresh")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/fatigue/demo/fresh")
-            assert result.status_code == 200
-            data = result.json()
-            assert "fatigue_score" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/fatigue/demo/fresh")
+        assert result.status_code == 200
+        data = result.json()
+        assert "fatigue_score" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_sentiment_demo_contract")
 class TestSentimentDemoContract:
     """Contract for /sentiment/demo/:scenario endpoint."""
     
     @pytest.mark.pact
-    def test_sentiment_demo_normal_contract(self):
+    def test_sentiment_demo_normal_contract(self, pact_mock, pact_url, http):
         """Frontend expects sentiment response for normal scenario."""
         expected = {
             "brand_name": Like("TestBrand"),
@@ -262,26 +246,27 @@ class TestSentimentDemoContract:
             "top_concerns": EachLike("Concern", minimum=0),
         }
         
-        (pact
+        (pact_mock
          .given("sentiment demo is available")
          .upon_receiving("a request for normal sentiment demo")
          .with_request("GET", "/sentiment/demo/normal")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/sentiment/demo/normal")
-            assert result.status_code == 200
-            data = result.json()
-            assert "brand_name" in data
-            assert "should_pause" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/sentiment/demo/normal")
+        assert result.status_code == 200
+        data = result.json()
+        assert "brand_name" in data
+        assert "should_pause" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_proof_demo_contract")
 class TestProofDemoContract:
     """Contract for /proof/demo endpoint."""
     
     @pytest.mark.pact
-    def test_proof_demo_contract(self):
+    def test_proof_demo_contract(self, pact_mock, pact_url, http):
         """Frontend expects proof pack response structure."""
         expected = {
             "ad_id": Like("ad_001"),
@@ -298,25 +283,26 @@ class TestProofDemoContract:
             }, minimum=0),
         }
         
-        (pact
+        (pact_mock
          .given("proof demo is available")
          .upon_receiving("a request for proof pack demo")
          .with_request("GET", "/proof/demo")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/proof/demo")
-            assert result.status_code == 200
-            data = result.json()
-            assert "compliance_status" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/proof/demo")
+        assert result.status_code == 200
+        data = result.json()
+        assert "compliance_status" in data
+        pact_mock.verify()
 
 
+@pytest.mark.xdist_group(name="pact_jobs_contract")
 class TestJobsContract:
     """Contract for /jobs endpoint."""
     
     @pytest.mark.pact
-    def test_jobs_list_contract(self):
+    def test_jobs_list_contract(self, pact_mock, pact_url, http):
         """Frontend expects jobs list structure."""
         expected = {
             "jobs": EachLike({
@@ -326,15 +312,15 @@ class TestJobsContract:
             }, minimum=0)
         }
         
-        (pact
+        (pact_mock
          .given("jobs endpoint is available")
          .upon_receiving("a request for jobs list")
          .with_request("GET", "/jobs")
          .will_respond_with(200, body=expected))
         
-        with pact:
-            import requests
-            result = requests.get(f"{pact.uri}/jobs")
-            assert result.status_code == 200
-            data = result.json()
-            assert "jobs" in data
+        pact_mock.setup()
+        result = http.get(f"{pact_url}/jobs")
+        assert result.status_code == 200
+        data = result.json()
+        assert "jobs" in data
+        pact_mock.verify()
@@ -7,13 +7,15 @@ Run this after running consumer tests to validate contracts.
 Install: pip install pact-python
 """
 
+import hashlib
 import pytest
 import subprocess
 import sys
 from pathlib import Path
 
-# Try to import pact verifier
+# Try to import pact verifier (requests is a pact-python dependency)
 try:
+    import requests
     from pact import Verifier
     PACT_AVAILABLE = True
 except ImportError:
@@ -21,6 +23,27 @@ except ImportError:
 
 
 PACT_DIR = Path(__file__).parent / "pacts"
+PROVIDER_SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Digests of (pact file, provider URL, provider source) that last verified OK
+_PACT_CACHE_KEY = "pact_verify/passed"
+_PACT_CACHE_SIZE = 64
+
+
+def _provider_fingerprint() -> bytes:
+    """Digest of the provider source, so any code change invalidates the cache."""
+    digest = hashlib.sha256()
+    for path in sorted(PROVIDER_SRC_DIR.rglob("*.py")):
+        digest.update(path.relative_to(PROVIDER_SRC_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def _pact_digest(pact_file: Path, provider_url: str, provider: bytes) -> str:
+    """Identify a pact file's content as verified against one provider build."""
+    return hashlib.sha256(
+        pact_file.read_bytes() + provider_url.encode() + provider
+    ).hexdigest()
 
 
 @pytest.mark.skipif(not PACT_AVAILABLE, reason="pact-python not installed")
@@ -34,34 +57,51 @@ class TestProviderVerification:
     
     @pytest.mark.pact
     @pytest.mark.slow
-    def test_verify_pacts(self, provider_url):
-        """Verify all pacts against the running provider."""
+    def test_verify_pacts(self, provider_url, request):
+        """Verify all pacts against the running provider.
+
+        A pact file that passed against the same provider URL, with the same
+        content and the same provider source under src/, is skipped (cached
+        in .pytest_cache; --no-pact-cache forces a full run).
+        """
+        # Listed at run time: consumer tests in the same session write the pacts
         pact_files = list(PACT_DIR.glob("*.json"))
-        
         if not pact_files:
             pytest.skip("No pact files found. Run consumer tests first.")
         
+        cache = getattr(request.config, "cache", None)
+        if request.config.getoption("no_pact_cache"):
+            cache = None
+        verified = cache.get(_PACT_CACHE_KEY, []) if cache is not None else []
+        
         verifier = Verifier(
             provider="BrandTruthAPI",
             provider_base_url=provider_url,
         )
         
-        # Verify each pact file
-        for pact_file in pact_files:
-            output, logs = verifier.verify_pacts(
-                str(pact_file),
-                verbose=True,
-                provider_states_setup_url=f"{provider_url}/_pact/setup",
-            )
-            
-            assert output == 0, f"Pact verification failed for {pact_file.name}"
+        provider = _provider_fingerprint()
+        digests = {p: _pact_digest(p, provider_url, provider) for p in pact_files}
+        pending = [p for p in pact_files if digests[p] not in verified]
+        if not pending:
+            pytest.skip("all pacts previously verified")
+        
+        # One verifier run for all pending files (one Ruby process, not one each)
+        output, logs = verifier.verify_pacts(
+            *(str(p) for p in pending),
+            verbose=True,
+            provider_states_setup_url=f"{provider_url}/_pact/setup",
+        )
+        
+        names = ", ".join(p.name for p in pending)
+        assert output == 0, f"Pact verification failed for {names}:\n{logs}"
+        if cache is not None:
+            verified.extend(digests[p] for p in pending)
+            cache.set(_PACT_CACHE_KEY, verified[-_PACT_CACHE_SIZE:])
     
     @pytest.mark.pact
     def test_provider_states_available(self, provider_url):
         """Test that provider state setup endpoint exists (optional)."""
         # This is optional - only needed if using provider states
-        import requests
-        
         # Try to reach the provider
         try:
             response = requests.get(f"{provider_url}/health", timeout=5)
@@ -106,19 +146,14 @@ def verify_contracts():
         provider_base_url=args.provider_url,
     )
     
-    all_passed = True
-    for pact_file in pact_files:
-        print(f"\nVerifying: {pact_file.name}")
-        try:
-            output, logs = verifier.verify_pacts(str(pact_file), verbose=True)
-            if output != 0:
-                all_passed = False
-                print(f"  ❌ FAILED")
-            else:
-                print(f"  ✅ PASSED")
-        except Exception as e:
-            print(f"  ❌ ERROR: {e}")
-            all_passed = False
+    print("\nVerifying: " + ", ".join(p.name for p in pact_files))
+    try:
+        output, logs = verifier.verify_pacts(*(str(p) for p in pact_files), verbose=True)
+        all_passed = output == 0
+        print("  ✅ PASSED" if all_passed else "  ❌ FAILED")
+    except Exception as e:
+        print(f"  ❌ ERROR: {e}")
+        all_passed = False
     
     sys.exit(0 if all_passed else 1)
 
@@ -8,7 +8,6 @@ These tests verify:
 4. Error responses follow expected format
 """
 
-import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
 
@@ -253,7 +252,6 @@ class TestWorkflowProgressContract:
 class TestWorkflowAPIRoutes:
     """Contract tests for workflow route handlers."""
 
-    @pytest.mark.anyio
     async def test_result_endpoint_returns_composed_ads(self):
         """Verify result endpoint includes composed_ads in response."""
         from src.temporal.routes import router
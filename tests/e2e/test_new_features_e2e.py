@@ -9,11 +9,6 @@ from httpx import AsyncClient, ASGITransport
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     transport = ASGITransport(app=app)
@@ -24,7 +19,6 @@ async def client():
 class TestAdCreationWorkflow:
     """E2E test for complete ad creation workflow."""
 
-    @pytest.mark.anyio
     async def test_complete_ad_creation_flow(self, client):
         """Test complete flow from hooks to iteration."""
         # Step 1: Generate hooks
@@ -73,7 +67,6 @@ class TestAdCreationWorkflow:
 class TestCampaignPlanningWorkflow:
     """E2E test for campaign planning workflow."""
 
-    @pytest.mark.anyio
     async def test_complete_campaign_planning_flow(self, client):
         """Test complete flow from budget to A/B test planning."""
         # Step 1: Simulate budget
@@ -133,7 +126,6 @@ class TestCampaignPlanningWorkflow:
 class TestLandingPageOptimizationWorkflow:
     """E2E test for landing page optimization workflow."""
 
-    @pytest.mark.anyio
     async def test_landing_page_optimization_flow(self, client):
         """Test flow from landing analysis to iteration."""
         # Step 1: Analyze landing page
@@ -167,7 +159,6 @@ class TestLandingPageOptimizationWorkflow:
 class TestDemoWorkflow:
     """E2E test for demo endpoints."""
 
-    @pytest.mark.anyio
     async def test_all_demos_work(self, client):
         """Test all demo endpoints return valid data."""
         demos = [
@@ -191,7 +182,6 @@ class TestDemoWorkflow:
 class TestCareeriedScenario:
     """E2E test simulating Careerfied ad campaign setup."""
 
-    @pytest.mark.anyio
     async def test_careerfied_campaign_setup(self, client):
         """Simulate setting up a complete Careerfied campaign."""
         
@@ -305,7 +295,6 @@ class TestCareeriedScenario:
 class TestIterativeOptimization:
     """E2E test for iterative ad optimization."""
 
-    @pytest.mark.anyio
     async def test_optimization_cycle(self, client):
         """Test a complete optimization cycle."""
         
@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestABTestAPI:
     """Integration tests for /abtest endpoints."""
 
-    @pytest.mark.anyio
     async def test_plan_ab_test(self, client):
         """Test POST /abtest/plan endpoint."""
         response = await client.post(
@@ -44,7 +38,6 @@ class TestABTestAPI:
         assert "estimated_days" in data
         assert "testing_sequence" in data
 
-    @pytest.mark.anyio
     async def test_plan_returns_test_pairs(self, client):
         """Test plan returns properly structured test pairs."""
         response = await client.post(
@@ -65,7 +58,6 @@ class TestABTestAPI:
             assert "variant_b" in pair
             assert "priority" in pair
 
-    @pytest.mark.anyio
     async def test_calculate_significance(self, client):
         """Test POST /abtest/calculate endpoint."""
         response = await client.post(
@@ -84,7 +76,6 @@ class TestABTestAPI:
         assert "variant_rate" in data
         assert "lift" in data
 
-    @pytest.mark.anyio
     async def test_calculate_not_significant(self, client):
         """Test calculation returns not significant for small differences."""
         response = await client.post(
@@ -100,7 +91,6 @@ class TestABTestAPI:
         data = response.json()
         assert data["is_significant"] == False
 
-    @pytest.mark.anyio
     async def test_abtest_demo(self, client):
         """Test POST /abtest/demo endpoint."""
         response = await client.post("/abtest/demo")
@@ -109,7 +99,6 @@ class TestABTestAPI:
         assert "estimated_days" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_higher_budget_fewer_days(self, client):
         """Test higher budget reduces estimated days."""
         low_budget = await client.post(
@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestAudienceAPI:
     """Integration tests for /audience endpoints."""
 
-    @pytest.mark.anyio
     async def test_suggest_audiences(self, client):
         """Test POST /audience/suggest endpoint."""
         response = await client.post(
@@ -42,7 +36,6 @@ class TestAudienceAPI:
         assert "exclusions" in data
         assert "lookalike_strategy" in data
 
-    @pytest.mark.anyio
     async def test_suggest_returns_budget_allocation(self, client):
         """Test suggestion includes budget allocation."""
         response = await client.post(
@@ -58,7 +51,6 @@ class TestAudienceAPI:
         assert "budget_allocation" in data
         assert "testing_order" in data
 
-    @pytest.mark.anyio
     async def test_suggest_with_existing_customers(self, client):
         """Test suggestion with customer data enables lookalikes."""
         response = await client.post(
@@ -76,7 +68,6 @@ class TestAudienceAPI:
         lookalike_audiences = [a for a in data["primary_audiences"] if a.get("type") == "lookalike"]
         assert len(lookalike_audiences) > 0
 
-    @pytest.mark.anyio
     async def test_suggest_with_website_traffic(self, client):
         """Test suggestion with traffic data enables retargeting."""
         response = await client.post(
@@ -94,7 +85,6 @@ class TestAudienceAPI:
         retargeting = [a for a in data["primary_audiences"] if a.get("type") == "retargeting"]
         assert len(retargeting) > 0
 
-    @pytest.mark.anyio
     async def test_audience_demo(self, client):
         """Test POST /audience/demo endpoint."""
         response = await client.post("/audience/demo")
@@ -103,7 +93,6 @@ class TestAudienceAPI:
         assert "primary_audiences" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_audiences_have_scores(self, client):
         """Test audiences have relevance scores."""
         response = await client.post(
@@ -120,7 +109,6 @@ class TestAudienceAPI:
             assert "relevance_score" in aud
             assert 0 <= aud["relevance_score"] <= 100
 
-    @pytest.mark.anyio
     async def test_exclusions_returned(self, client):
         """Test exclusions are returned with reasons."""
         response = await client.post(
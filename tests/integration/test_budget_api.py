@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestBudgetAPI:
     """Integration tests for /budget endpoints."""
 
-    @pytest.mark.anyio
     async def test_simulate_budget(self, client):
         """Test POST /budget/simulate endpoint."""
         response = await client.post(
@@ -39,7 +33,6 @@ class TestBudgetAPI:
         assert "tier" in data
         assert data["daily_budget"] > 0
 
-    @pytest.mark.anyio
     async def test_simulate_returns_metrics(self, client):
         """Test simulation returns expected metrics."""
         response = await client.post(
@@ -59,7 +52,6 @@ class TestBudgetAPI:
         assert "expected_cpa" in data
         assert "expected_roas" in data
 
-    @pytest.mark.anyio
     async def test_simulate_with_target_cpa(self, client):
         """Test simulation with custom target CPA."""
         response = await client.post(
@@ -76,7 +68,6 @@ class TestBudgetAPI:
         data = response.json()
         assert data["daily_budget"] > 0
 
-    @pytest.mark.anyio
     async def test_get_benchmarks(self, client):
         """Test GET /budget/benchmarks endpoint."""
         response = await client.get("/budget/benchmarks")
@@ -86,7 +77,6 @@ class TestBudgetAPI:
         assert "saas" in data["benchmarks"]
         assert "ecommerce" in data["benchmarks"]
 
-    @pytest.mark.anyio
     async def test_get_benchmarks_single_industry(self, client):
         """Test GET /budget/benchmarks with industry filter."""
         response = await client.get("/budget/benchmarks?industry=saas")
@@ -95,7 +85,6 @@ class TestBudgetAPI:
         assert "benchmarks" in data
         assert "saas" in data["benchmarks"]
 
-    @pytest.mark.anyio
     async def test_budget_demo(self, client):
         """Test POST /budget/demo endpoint."""
         response = await client.post("/budget/demo")
@@ -104,7 +93,6 @@ class TestBudgetAPI:
         assert "daily_budget" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_simulate_all_industries(self, client):
         """Test simulation works for all industries."""
         industries = ["saas", "ecommerce", "fintech", "healthcare", "education", "consumer_app"]
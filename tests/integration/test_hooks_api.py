@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestHooksAPI:
     """Integration tests for /hooks endpoints."""
 
-    @pytest.mark.anyio
     async def test_generate_hooks(self, client):
         """Test POST /hooks/generate endpoint."""
         response = await client.post(
@@ -42,7 +36,6 @@ class TestHooksAPI:
         assert "best_hook" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_generate_hooks_with_emojis(self, client):
         """Test hook generation with emojis."""
         response = await client.post(
@@ -59,7 +52,6 @@ class TestHooksAPI:
         data = response.json()
         assert len(data["hooks"]) == 3
 
-    @pytest.mark.anyio
     async def test_get_patterns(self, client):
         """Test GET /hooks/patterns endpoint."""
         response = await client.get("/hooks/patterns")
@@ -69,7 +61,6 @@ class TestHooksAPI:
         assert "power_words" in data
         assert len(data["patterns"]) == 10
 
-    @pytest.mark.anyio
     async def test_hooks_demo(self, client):
         """Test POST /hooks/demo endpoint."""
         response = await client.post("/hooks/demo")
@@ -78,7 +69,6 @@ class TestHooksAPI:
         assert "hooks" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_generate_hooks_validation(self, client):
         """Test validation errors."""
         response = await client.post(
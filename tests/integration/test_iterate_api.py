@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestIterateAPI:
     """Integration tests for /iterate endpoints."""
 
-    @pytest.mark.anyio
     async def test_analyze_ad(self, client):
         """Test POST /iterate/analyze endpoint."""
         response = await client.post(
@@ -45,7 +39,6 @@ class TestIterateAPI:
         assert "priority_fixes" in data
         assert "estimated_improvement" in data
 
-    @pytest.mark.anyio
     async def test_analyze_returns_diagnoses(self, client):
         """Test analysis returns properly structured diagnoses."""
         response = await client.post(
@@ -67,7 +60,6 @@ class TestIterateAPI:
             assert "severity" in diag
             assert "description" in diag
 
-    @pytest.mark.anyio
     async def test_analyze_returns_improvements(self, client):
         """Test analysis returns improved variants."""
         response = await client.post(
@@ -90,7 +82,6 @@ class TestIterateAPI:
             assert "improved" in imp
             assert "rationale" in imp
 
-    @pytest.mark.anyio
     async def test_analyze_detects_low_ctr(self, client):
         """Test low CTR is diagnosed."""
         response = await client.post(
@@ -110,7 +101,6 @@ class TestIterateAPI:
         issues = [d["issue"] for d in data["diagnoses"]]
         assert "low_ctr" in issues
 
-    @pytest.mark.anyio
     async def test_analyze_detects_high_frequency(self, client):
         """Test high frequency is diagnosed."""
         response = await client.post(
@@ -131,7 +121,6 @@ class TestIterateAPI:
         issues = [d["issue"] for d in data["diagnoses"]]
         assert "high_frequency" in issues
 
-    @pytest.mark.anyio
     async def test_iterate_demo(self, client):
         """Test POST /iterate/demo endpoint."""
         response = await client.post("/iterate/demo")
@@ -140,7 +129,6 @@ class TestIterateAPI:
         assert "diagnoses" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_analyze_good_performance(self, client):
         """Test analysis of good performing ad."""
         response = await client.post(
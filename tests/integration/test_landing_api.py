@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestLandingAPI:
     """Integration tests for /landing endpoints."""
 
-    @pytest.mark.anyio
     async def test_analyze_landing_page(self, client):
         """Test POST /landing/analyze endpoint."""
         response = await client.post(
@@ -39,7 +33,6 @@ class TestLandingAPI:
         assert "message_match_level" in data
         assert 0 <= data["overall_score"] <= 100
 
-    @pytest.mark.anyio
     async def test_analyze_returns_component_scores(self, client):
         """Test component scores are returned."""
         response = await client.post(
@@ -58,7 +51,6 @@ class TestLandingAPI:
         assert "mobile_score" in data
         assert "load_speed_score" in data
 
-    @pytest.mark.anyio
     async def test_landing_demo(self, client):
         """Test POST /landing/demo endpoint."""
         response = await client.post("/landing/demo")
@@ -67,7 +59,6 @@ class TestLandingAPI:
         assert "score" in data or "overall_score" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_analyze_validation(self, client):
         """Test validation errors."""
         response = await client.post(
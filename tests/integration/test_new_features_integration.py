@@ -6,11 +6,6 @@ from httpx import AsyncClient, ASGITransport
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     transport = ASGITransport(app=app)
@@ -21,7 +16,6 @@ async def client():
 class TestHookGeneratorIntegration:
     """Integration tests for Hook Generator API."""
 
-    @pytest.mark.anyio
     async def test_generate_hooks_full_request(self, client):
         """Test full hook generation request."""
         response = await client.post("/hooks/generate", json={
@@ -40,7 +34,6 @@ class TestHookGeneratorIntegration:
         assert data["best_hook"] is not None
         assert data["avg_score"] > 0
 
-    @pytest.mark.anyio
     async def test_generate_hooks_minimal_request(self, client):
         """Test minimal hook generation request."""
         response = await client.post("/hooks/generate", json={
@@ -52,7 +45,6 @@ class TestHookGeneratorIntegration:
         data = response.json()
         assert len(data["hooks"]) >= 5
 
-    @pytest.mark.anyio
     async def test_get_patterns(self, client):
         """Test getting hook patterns."""
         response = await client.get("/hooks/patterns")
@@ -61,7 +53,6 @@ class TestHookGeneratorIntegration:
         assert len(data["patterns"]) == 10
         assert len(data["power_words"]) >= 7
 
-    @pytest.mark.anyio
     async def test_hooks_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/hooks/demo")
@@ -74,7 +65,6 @@ class TestHookGeneratorIntegration:
 class TestLandingPageAnalyzerIntegration:
     """Integration tests for Landing Page Analyzer API."""
 
-    @pytest.mark.anyio
     async def test_analyze_landing_page(self, client):
         """Test landing page analysis."""
         response = await client.post("/landing/analyze", json={
@@ -89,7 +79,6 @@ class TestLandingPageAnalyzerIntegration:
         assert data["message_match_level"] in ["excellent", "good", "fair", "poor", "mismatch"]
         assert "recommendations" in data
 
-    @pytest.mark.anyio
     async def test_landing_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/landing/demo")
@@ -101,7 +90,6 @@ class TestLandingPageAnalyzerIntegration:
 class TestBudgetSimulatorIntegration:
     """Integration tests for Budget Simulator API."""
 
-    @pytest.mark.anyio
     async def test_simulate_budget(self, client):
         """Test budget simulation."""
         response = await client.post("/budget/simulate", json={
@@ -117,7 +105,6 @@ class TestBudgetSimulatorIntegration:
         assert data["expected_conversions"] >= 0
         assert data["tier"] in ["starter", "growth", "scale", "enterprise"]
 
-    @pytest.mark.anyio
     async def test_simulate_with_target_cpa(self, client):
         """Test budget simulation with target CPA."""
         response = await client.post("/budget/simulate", json={
@@ -131,7 +118,6 @@ class TestBudgetSimulatorIntegration:
         data = response.json()
         assert data["daily_budget"] > 0
 
-    @pytest.mark.anyio
     async def test_get_benchmarks(self, client):
         """Test getting industry benchmarks."""
         response = await client.get("/budget/benchmarks")
@@ -140,7 +126,6 @@ class TestBudgetSimulatorIntegration:
         assert "saas" in data
         assert "ecommerce" in data
 
-    @pytest.mark.anyio
     async def test_budget_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/budget/demo")
@@ -152,7 +137,6 @@ class TestBudgetSimulatorIntegration:
 class TestPlatformRecommenderIntegration:
     """Integration tests for Platform Recommender API."""
 
-    @pytest.mark.anyio
     async def test_recommend_platforms(self, client):
         """Test platform recommendation."""
         response = await client.post("/platforms/recommend", json={
@@ -168,7 +152,6 @@ class TestPlatformRecommenderIntegration:
         assert len(data["recommendations"]) >= 5
         assert len(data["budget_allocation"]) > 0
 
-    @pytest.mark.anyio
     async def test_get_platforms_list(self, client):
         """Test getting platforms list."""
         response = await client.get("/platforms/list")
@@ -176,7 +159,6 @@ class TestPlatformRecommenderIntegration:
         data = response.json()
         assert len(data) >= 7
 
-    @pytest.mark.anyio
     async def test_platforms_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/platforms/demo")
@@ -188,7 +170,6 @@ class TestPlatformRecommenderIntegration:
 class TestABTestPlannerIntegration:
     """Integration tests for A/B Test Planner API."""
 
-    @pytest.mark.anyio
     async def test_plan_ab_test(self, client):
         """Test A/B test planning."""
         response = await client.post("/abtest/plan", json={
@@ -209,7 +190,6 @@ class TestABTestPlannerIntegration:
         assert len(data["test_pairs"]) > 0
         assert len(data["testing_sequence"]) > 0
 
-    @pytest.mark.anyio
     async def test_calculate_significance(self, client):
         """Test significance calculation."""
         response = await client.post("/abtest/calculate", json={
@@ -225,7 +205,6 @@ class TestABTestPlannerIntegration:
         assert "control_rate" in data
         assert "variant_rate" in data
 
-    @pytest.mark.anyio
     async def test_abtest_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/abtest/demo")
@@ -237,7 +216,6 @@ class TestABTestPlannerIntegration:
 class TestAudienceTargetingIntegration:
     """Integration tests for Audience Targeting API."""
 
-    @pytest.mark.anyio
     async def test_suggest_audiences(self, client):
         """Test audience suggestion."""
         response = await client.post("/audience/suggest", json={
@@ -255,7 +233,6 @@ class TestAudienceTargetingIntegration:
         assert len(data["exclusions"]) > 0
         assert len(data["testing_order"]) > 0
 
-    @pytest.mark.anyio
     async def test_suggest_with_customer_data(self, client):
         """Test audience suggestion with customer data."""
         response = await client.post("/audience/suggest", json={
@@ -271,7 +248,6 @@ class TestAudienceTargetingIntegration:
         audience_types = [a["type"] for a in data["primary_audiences"]]
         assert "lookalike" in audience_types or "retargeting" in audience_types
 
-    @pytest.mark.anyio
     async def test_audience_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/audience/demo")
@@ -283,7 +259,6 @@ class TestAudienceTargetingIntegration:
 class TestIterationAssistantIntegration:
     """Integration tests for Iteration Assistant API."""
 
-    @pytest.mark.anyio
     async def test_analyze_underperforming_ad(self, client):
         """Test analyzing underperforming ad."""
         response = await client.post("/iterate/analyze", json={
@@ -305,7 +280,6 @@ class TestIterationAssistantIntegration:
         assert len(data["priority_fixes"]) > 0
         assert data["estimated_improvement"] is not None
 
-    @pytest.mark.anyio
     async def test_analyze_good_performing_ad(self, client):
         """Test analyzing well-performing ad."""
         response = await client.post("/iterate/analyze", json={
@@ -326,7 +300,6 @@ class TestIterationAssistantIntegration:
         critical_issues = [d for d in data["diagnoses"] if d["severity"] == "critical"]
         assert len(critical_issues) == 0
 
-    @pytest.mark.anyio
     async def test_iterate_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/iterate/demo")
@@ -338,7 +311,6 @@ class TestIterationAssistantIntegration:
 class TestSocialProofCollectorIntegration:
     """Integration tests for Social Proof Collector API."""
 
-    @pytest.mark.anyio
     async def test_collect_social_proof(self, client):
         """Test social proof collection."""
         response = await client.post("/social/collect", json={
@@ -359,7 +331,6 @@ class TestSocialProofCollectorIntegration:
         assert 0 <= data["trust_score"] <= 100
         assert len(data["ad_snippets"]) > 0
 
-    @pytest.mark.anyio
     async def test_collect_minimal(self, client):
         """Test collection with minimal data."""
         response = await client.post("/social/collect", json={
@@ -370,7 +341,6 @@ class TestSocialProofCollectorIntegration:
         data = response.json()
         assert data["trust_score"] < 50  # Low score with minimal data
 
-    @pytest.mark.anyio
     async def test_social_demo(self, client):
         """Test demo endpoint."""
         response = await client.post("/social/demo")
@@ -382,7 +352,6 @@ class TestSocialProofCollectorIntegration:
 class TestCrossFeatureIntegration:
     """Test integration between multiple features."""
 
-    @pytest.mark.anyio
     async def test_hooks_to_iteration_flow(self, client):
         """Test flow from hook generation to iteration analysis."""
         # Generate hooks
@@ -407,7 +376,6 @@ class TestCrossFeatureIntegration:
         })
         assert iterate_response.status_code == 200
 
-    @pytest.mark.anyio
     async def test_budget_to_platform_flow(self, client):
         """Test flow from budget simulation to platform recommendation."""
         # Get budget simulation
@@ -429,7 +397,6 @@ class TestCrossFeatureIntegration:
         })
         assert platform_response.status_code == 200
 
-    @pytest.mark.anyio
     async def test_audience_to_abtest_flow(self, client):
         """Test flow from audience targeting to A/B test planning."""
         # Get audience suggestions
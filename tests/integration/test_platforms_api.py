@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestPlatformsAPI:
     """Integration tests for /platforms endpoints."""
 
-    @pytest.mark.anyio
     async def test_recommend_platforms(self, client):
         """Test POST /platforms/recommend endpoint."""
         response = await client.post(
@@ -40,7 +34,6 @@ class TestPlatformsAPI:
         assert "budget_allocation" in data
         assert "recommendations" in data
 
-    @pytest.mark.anyio
     async def test_recommend_returns_rankings(self, client):
         """Test recommendations include rankings."""
         response = await client.post(
@@ -59,7 +52,6 @@ class TestPlatformsAPI:
             assert "score" in rec
             assert "rank" in rec
 
-    @pytest.mark.anyio
     async def test_get_platforms_list(self, client):
         """Test GET /platforms/list endpoint."""
         response = await client.get("/platforms/list")
@@ -68,7 +60,6 @@ class TestPlatformsAPI:
         assert "platforms" in data
         assert len(data["platforms"]) >= 7
 
-    @pytest.mark.anyio
     async def test_platforms_demo(self, client):
         """Test POST /platforms/demo endpoint."""
         response = await client.post("/platforms/demo")
@@ -77,7 +68,6 @@ class TestPlatformsAPI:
         assert "primary_platform" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_recommend_low_budget(self, client):
         """Test recommendation with low budget."""
         response = await client.post(
@@ -93,7 +83,6 @@ class TestPlatformsAPI:
         # Low budget should focus on single platform
         assert "focus" in data["strategy"].lower() or len(data["budget_allocation"]) <= 2
 
-    @pytest.mark.anyio
     async def test_recommend_high_budget(self, client):
         """Test recommendation with high budget."""
         response = await client.post(
@@ -6,11 +6,6 @@ from httpx import AsyncClient
 from api_server import app
 
 
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
 @pytest.fixture
 async def client():
     async with AsyncClient(app=app, base_url="http://test") as ac:
@@ -20,7 +15,6 @@ async def client():
 class TestSocialAPI:
     """Integration tests for /social endpoints."""
 
-    @pytest.mark.anyio
     async def test_collect_social_proof(self, client):
         """Test POST /social/collect endpoint."""
         response = await client.post(
@@ -44,7 +38,6 @@ class TestSocialAPI:
         assert "trust_score" in data
         assert "ad_snippets" in data
 
-    @pytest.mark.anyio
     async def test_collect_returns_proofs(self, client):
         """Test collection returns properly structured proofs."""
         response = await client.post(
@@ -64,7 +57,6 @@ class TestSocialAPI:
             assert "content" in proof
             assert "ad_ready" in proof
 
-    @pytest.mark.anyio
     async def test_collect_calculates_trust_score(self, client):
         """Test trust score is calculated correctly."""
         # Minimal proof
@@ -93,7 +85,6 @@ class TestSocialAPI:
         assert full.status_code == 200
         assert full.json()["trust_score"] > minimal.json()["trust_score"]
 
-    @pytest.mark.anyio
     async def test_collect_returns_ad_snippets(self, client):
         """Test ad-ready snippets are generated."""
         response = await client.post(
@@ -110,7 +101,6 @@ class TestSocialAPI:
         data = response.json()
         assert len(data["ad_snippets"]) > 0
 
-    @pytest.mark.anyio
     async def test_collect_returns_best_proof(self, client):
         """Test best testimonial and stat are selected."""
         response = await client.post(
@@ -128,7 +118,6 @@ class TestSocialAPI:
         assert "best_testimonial" in data
         assert "best_stat" in data
 
-    @pytest.mark.anyio
     async def test_social_demo(self, client):
         """Test POST /social/demo endpoint."""
         response = await client.post("/social/demo")
@@ -137,7 +126,6 @@ class TestSocialAPI:
         assert "trust_score" in data
         assert "summary" in data
 
-    @pytest.mark.anyio
     async def test_collect_minimal_request(self, client):
         """Test collection with minimal data."""
         response = await client.post(
@@ -153,7 +141,6 @@ class TestSocialAPI:
         assert data["trust_score"] >= 0
         assert "recommendations" in data
 
-    @pytest.mark.anyio
     async def test_collect_formats_large_numbers(self, client):
         """Test large user counts are formatted."""
         response = await client.post(
@@ -1,6 +1,8 @@
 # tests/unit/test_budget_simulator.py
 """Unit tests for Budget Simulator (Slice 18)."""
 
+import math
+
 import pytest
 from src.analyzers.budget_simulator import (
     BudgetSimulator, BudgetRequest, Industry, CampaignGoal, BudgetTier,
@@ -35,7 +37,7 @@ class TestBudgetSimulator:
     async def test_simulate_returns_monthly_budget(self, simulator, sample_request):
         """Test monthly budget is calculated."""
         result = await simulator.simulate(sample_request)
-        assert result.monthly_budget == pytest.approx(result.daily_budget * 30, rel=0.01)
+        assert math.isclose(result.monthly_budget, result.daily_budget * 30, rel_tol=0.01)
 
     @pytest.mark.asyncio
     async def test_simulate_returns_budget_tier(self, simulator, sample_request):
@@ -1,6 +1,8 @@
 # tests/unit/test_platform_recommender.py
 """Unit tests for Platform Recommender (Slice 19)."""
 
+from itertools import pairwise
+
 import pytest
 from src.analyzers.platform_recommender import (
     PlatformRecommender, PlatformRequest, Platform, ProductType, AudienceType,
@@ -55,7 +57,7 @@ class TestPlatformRecommender:
         """Test recommendations are sorted by score descending."""
         result = await recommender.recommend(sample_request)
         scores = [r.score for r in result.recommendations]
-        assert scores == sorted(scores, reverse=True)
+        assert all(a >= b for a, b in pairwise(scores))
 
     @pytest.mark.asyncio
     async def test_recommendations_have_required_fields(self, recommender, sample_request):
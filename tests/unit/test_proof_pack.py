@@ -320,42 +320,32 @@ class TestProofPackGenerator:
         assert len(pack.approval_history) > 0
         assert any("proof_pack_generated" in a.action for a in pack.approval_history)
     
-    def test_export_to_json(self, generator):
+    async def test_export_to_json(self, generator):
         """Test JSON export."""
-        import asyncio
-        
-        async def run():
-            pack = await generator.generate(
-                ad_id="test_010",
-                campaign_name="Test",
-                brand_name="Test",
-                headline="Test",
-                primary_text="Test",
-                cta="Test",
-            )
-            return generator.export_to_json(pack)
-        
-        json_str = asyncio.run(run())
+        pack = await generator.generate(
+            ad_id="test_010",
+            campaign_name="Test",
+            brand_name="Test",
+            headline="Test",
+            primary_text="Test",
+            cta="Test",
+        )
+        json_str = generator.export_to_json(pack)
         
         assert isinstance(json_str, str)
         assert "test_010" in json_str
     
-    def test_export_to_html(self, generator):
+    async def test_export_to_html(self, generator):
         """Test HTML export."""
-        import asyncio
-        
-        async def run():
-            pack = await generator.generate(
-                ad_id="test_011",
-                campaign_name="Test",
-                brand_name="Test",
-                headline="Test",
-                primary_text="Test",
-                cta="Test",
-            )
-            return generator.export_to_html(pack)
-        
-        html = asyncio.run(run())
+        pack = await generator.generate(
+            ad_id="test_011",
+            campaign_name="Test",
+            brand_name="Test",
+            headline="Test",
+            primary_text="Test",
+            cta="Test",
+        )
+        html = generator.export_to_html(pack)
         
         assert isinstance(html, str)
         assert "<html>" in html
@@ -0,0 +1,376 @@
+# tests/unit/test_qdrant_client.py
+"""Unit tests for Qdrant client helpers that don't need a server."""
+
+import asyncio
+import math
+import time
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from qdrant_client.models import Distance
+
+from src.utils.retry import DEFAULT_RETRY_CONFIG, is_retryable_error
+from src.vector.qdrant_client import (
+    CircuitBreaker,
+    QdrantClient,
+    QdrantConfig,
+    _is_retryable_qdrant_error,
+)
+
+
+@pytest.fixture
+def client():
+    """QdrantClient with an 8-dimensional config and no connection."""
+    client = QdrantClient()
+    client.config = QdrantConfig(EMBEDDING_DIM=8)
+    return client
+
+
+@pytest.fixture
+async def memory_client(client):
+    """The 8-dimensional client backed by an in-memory Qdrant with both collections."""
+    from qdrant_client import AsyncQdrantClient
+    from qdrant_client.models import VectorParams
+
+    client._client = AsyncQdrantClient(location=":memory:")
+    for name in (client.config.COLLECTION_BRANDS, client.config.COLLECTION_AD_CREATIVES):
+        await client._client.create_collection(
+            name, vectors_config=VectorParams(size=8, distance=Distance.COSINE),
+        )
+    yield client
+    await client.close()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self):
+        """Test the circuit opens after consecutive failures."""
+        breaker = CircuitBreaker(failure_threshold=3, cooldown=30.0)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_success_resets_failures(self):
+        """Test a success clears the failure count."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30.0)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_half_open_after_cooldown(self):
+        """Test calls are allowed on trial once the cooldown elapses."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30.0)
+        breaker.record_failure()
+        breaker.opened_at -= 31.0
+
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_failure_reopens(self):
+        """Test one failure during the trial re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=30.0)
+        breaker.state = "half_open"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_only_connection_errors_count(self):
+        """Test bad requests don't count as connection failures."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown=30.0)
+        assert breaker.is_connection_error(TimeoutError())
+        assert breaker.is_connection_error(ConnectionError())
+        assert not breaker.is_connection_error(ValueError())
+
+
+class TestPrepVector:
+    """Tests for client-side vector validation."""
+
+    def test_returns_contiguous_float32(self, client):
+        """Test lists are converted to contiguous float32 arrays."""
+        arr = client._prep_vector([1.0] * 8)
+        assert arr.dtype == np.float32
+        assert arr.flags["C_CONTIGUOUS"]
+
+    def test_rejects_wrong_dimension(self, client):
+        """Test dimension mismatches fail before reaching the server."""
+        with pytest.raises(ValueError):
+            client._prep_vector([1.0] * 7)
+
+    def test_normalizes_for_dot(self, client):
+        """Test vectors are unit-normalized and DOT is used with USE_DOT."""
+        client.config.USE_DOT = True
+        arr = client._prep_vector([3.0] * 8)
+        assert math.isclose(np.linalg.norm(arr), 1.0, rel_tol=1e-6)
+        assert client._distance() == Distance.DOT
+
+    def test_does_not_mutate_input(self, client):
+        """Test normalizing doesn't modify the caller's array."""
+        client.config.USE_DOT = True
+        vector = np.full(8, 3.0, dtype=np.float32)
+        client._prep_vector(vector)
+        assert vector[0] == 3.0
+
+
+class TestIngestStream:
+    """Tests for the overlapped embed -> upsert pipeline."""
+
+    class FakeEmbedder:
+        async def embed_batch(self, texts):
+            return [[float(len(text))] * 8 for text in texts]
+
+    @staticmethod
+    async def items(count):
+        for i in range(count):
+            yield i, f"text {i}", {"brand_name": f"brand {i}"}
+
+    async def test_ingests_all_items(self, client):
+        """Test every streamed item is embedded and upserted."""
+        from qdrant_client import AsyncQdrantClient
+        from qdrant_client.models import VectorParams
+
+        client._client = AsyncQdrantClient(location=":memory:")
+        await client._client.create_collection(
+            "brands", vectors_config=VectorParams(size=8, distance=Distance.COSINE),
+        )
+
+        stats = await client.ingest_stream("brands", self.items(250), self.FakeEmbedder(), batch_size=100)
+
+        assert stats["points"] == 250
+        assert (await client._client.count("brands")).count == 250
+
+
+
+class TestBulkLoad:
+    """Tests for bulk loading with indexing paused."""
+
+    async def test_restores_previous_indexing_threshold(self, memory_client):
+        """Test the collection's own threshold is restored, not the default."""
+        from qdrant_client.models import PointStruct
+
+        qdrant = memory_client._client
+        get_collection = qdrant.get_collection
+        thresholds = []
+
+        async def get_collection_with_threshold(collection_name, **kwargs):
+            info = await get_collection(collection_name, **kwargs)
+            info.config.optimizer_config.indexing_threshold = 5000
+            return info
+
+        async def record_update_collection(collection_name, optimizers_config=None, **kwargs):
+            thresholds.append(optimizers_config.indexing_threshold)
+            return True
+
+        qdrant.get_collection = get_collection_with_threshold
+        qdrant.update_collection = record_update_collection
+
+        points = (PointStruct(id=i, vector=[1.0] * 8, payload={}) for i in range(1, 11))
+        assert await memory_client.bulk_load("brands", points, parallel=1) is True
+
+        assert thresholds == [0, 5000]
+        assert (await qdrant.count("brands")).count == 10
+
+class TestSchemaCache:
+    """Tests for the cached collection schema."""
+
+    async def test_warm_ensure_collections_skips_fetch(self, client):
+        """Test a second ensure_collections is served from the schema cache."""
+        from qdrant_client import AsyncQdrantClient
+
+        client._client = AsyncQdrantClient(location=":memory:")
+        await client.ensure_collections()
+
+        calls = []
+        get_collection = client._client.get_collection
+
+        async def counting_get_collection(name):
+            calls.append(name)
+            return await get_collection(name)
+
+        client._client.get_collection = counting_get_collection
+        await client.ensure_collections()
+        assert calls == []
+
+        await client._refresh_schema(force=True)
+        assert sorted(calls) == sorted(client._payload_indexes())
+
+
+
+class TestSingleton:
+    """Tests for the QdrantClient singleton."""
+
+    def test_get_instance_across_event_loops(self, monkeypatch):
+        """Test contended cold starts work from more than one event loop."""
+        async def slow_initialize(self):
+            await asyncio.sleep(0)  # second caller waits on the lock
+
+        monkeypatch.setattr(QdrantClient, "_initialize", slow_initialize)
+        monkeypatch.setattr(QdrantClient, "_instance", None)
+
+        async def cold_start():
+            QdrantClient._instance = None
+            first, second = await asyncio.gather(
+                QdrantClient.get_instance(), QdrantClient.get_instance(),
+            )
+            assert first is second
+
+        for _ in range(2):
+            asyncio.run(cold_start())
+
+class TestUpsertQueue:
+    """Tests for the batched single-point upsert queue."""
+
+    async def test_enqueue_then_flush_writes_points(self, memory_client):
+        """Test queued upserts are written once flush() returns."""
+        results = [
+            await memory_client.upsert_brand(i, [float(i + 1)] * 8, {"brand_name": f"b{i}"})
+            for i in range(5)
+        ]
+        assert results == [True] * 5
+
+        await memory_client.flush()
+
+        assert (await memory_client._client.count("brands")).count == 5
+        assert memory_client.failed_points == 0
+
+    async def test_failed_init_refuses_upserts(self, client, monkeypatch):
+        """Test nothing is queued when the initial connection fails."""
+        class UnreachableClient:
+            def __init__(self, **kwargs):
+                pass
+
+            async def get_collections(self):
+                raise ConnectionError("refused")
+
+        monkeypatch.setattr("src.vector.qdrant_client.AsyncQdrantClient", UnreachableClient)
+        await client._initialize()
+
+        assert await client.upsert_brand("b", [1.0] * 8, {}) is False
+        assert client._ingest_queue.qsize() == 0
+        assert client._flush_task is None
+
+    async def test_breaker_open_drops_are_reported(self, memory_client):
+        """Test points dropped while the circuit is open are counted and raised."""
+        for i in range(3):
+            await memory_client.upsert_ad_creative(i, [1.0] * 8, {})
+        # Open the circuit before the queued points are written
+        memory_client._breaker.state = "open"
+        memory_client._breaker.opened_at = time.monotonic()
+
+        with pytest.raises(ConnectionError):
+            await memory_client.flush()
+
+        assert memory_client.failed_points == 3
+        assert (await memory_client._client.count("ad_creatives")).count == 0
+
+    async def test_upsert_error_raised_from_flush(self, memory_client):
+        """Test a failed batch write surfaces from flush() instead of being swallowed."""
+        await memory_client._client.delete_collection("brands")
+        await memory_client.upsert_brand(1, [1.0] * 8, {})
+
+        with pytest.raises(Exception):
+            await memory_client.flush()
+
+        assert memory_client.failed_points == 1
+        await memory_client.flush()  # the error is reported once
+
+
+class TestSearchCache:
+    """Tests for the per-collection search result cache."""
+
+    async def test_cached_hits_are_copies(self, memory_client):
+        """Test mutating returned hits doesn't change later cached results."""
+        await memory_client.upsert_brand(
+            1, [1.0] * 8, {"brand_name": "Acme", "confidence_score": 0.9},
+        )
+        await memory_client.flush()
+
+        first = await memory_client.search_similar_brands([1.0] * 8)
+        first[0]["payload"]["brand_name"] = "changed"
+        first.clear()
+
+        second = await memory_client.search_similar_brands([1.0] * 8)
+        assert second[0]["payload"]["brand_name"] == "Acme"
+        assert memory_client.cache_stats()["brands"]["hits"] == 1
+
+
+class TestSearchCoalescing:
+    """Tests for batching concurrent searches into one request."""
+
+    async def test_concurrent_searches_share_one_request(self, memory_client):
+        """Test searches issued together go out as a single query_batch_points call."""
+        await memory_client.upsert_brand(
+            1, [1.0] * 8, {"brand_name": "Acme", "confidence_score": 0.9},
+        )
+        await memory_client.flush()
+
+        batches = []
+        query_batch_points = memory_client._client.query_batch_points
+
+        async def counting_query_batch_points(collection_name, requests, **kwargs):
+            batches.append(len(requests))
+            return await query_batch_points(collection_name, requests, **kwargs)
+
+        memory_client._client.query_batch_points = counting_query_batch_points
+
+        results = await asyncio.gather(
+            *(memory_client.search_similar_brands([1.0] * 8) for _ in range(4))
+        )
+
+        assert batches == [4]
+        assert all(hits == results[0] for hits in results)
+        assert results[0][0]["payload"]["brand_name"] == "Acme"
+
+
+class TestUpdateAdPerformanceMany:
+    """Tests for the batched payload update."""
+
+    async def test_updates_every_point(self, memory_client):
+        """Test each point gets its own score, with shared values grouped."""
+        for i in range(1, 5):
+            await memory_client.upsert_ad_creative(i, [float(i)] * 8, {"performance_score": 0.0})
+        await memory_client.flush()
+
+        updates = [(1, 0.9, True), (2, 0.9, True), (3, 0.4, False), (4, 0.7, False)]
+        assert await memory_client.update_ad_performance_many(updates) is True
+
+        points = await memory_client._client.retrieve("ad_creatives", ids=[1, 2, 3, 4])
+        payloads = {point.id: point.payload for point in points}
+        for point_id, score, approved in updates:
+            assert payloads[point_id] == {"performance_score": score, "is_approved": approved}
+
+    async def test_empty_updates_are_a_no_op(self, memory_client):
+        """Test no request is sent for an empty update list."""
+        assert await memory_client.update_ad_performance_many([]) is True
+
+
+class TestRetryPredicate:
+    """Tests for the Qdrant-specific retry predicate."""
+
+    @pytest.mark.parametrize("error", [
+        TimeoutError(),
+        Exception("StatusCode.RESOURCE_EXHAUSTED"),
+        Exception("StatusCode.DEADLINE_EXCEEDED"),
+    ])
+    def test_transient_qdrant_errors_retry(self, error):
+        """Test Qdrant write-load errors retry without widening the global predicate."""
+        assert _is_retryable_qdrant_error(error, DEFAULT_RETRY_CONFIG)
+        assert not is_retryable_error(error, DEFAULT_RETRY_CONFIG)
+
+    def test_falls_back_to_default_predicate(self):
+        """Test the generic retryable errors still apply."""
+        assert _is_retryable_qdrant_error(Exception("503 unavailable"), DEFAULT_RETRY_CONFIG)
+        assert not _is_retryable_qdrant_error(ValueError("bad vector"), DEFAULT_RETRY_CONFIG)
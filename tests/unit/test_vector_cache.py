@@ -0,0 +1,135 @@
+# tests/unit/test_vector_cache.py
+"""Unit tests for the in-process LRU + TTL vector cache."""
+
+import asyncio
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.vector.cache import LRUEmbeddingCache
+
+
+class TestLRUEmbeddingCache:
+    """Tests for LRUEmbeddingCache."""
+
+    async def test_get_miss_returns_none(self):
+        """Test missing keys return None and count as misses."""
+        cache = LRUEmbeddingCache()
+        assert await cache.get("missing") is None
+        assert cache.stats()["misses"] == 1
+
+    async def test_set_then_get(self):
+        """Test stored values are returned and count as hits."""
+        cache = LRUEmbeddingCache()
+        await cache.set("key", [0.1, 0.2])
+        assert await cache.get("key") == [0.1, 0.2]
+        assert cache.stats()["hits"] == 1
+
+    async def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache = LRUEmbeddingCache(capacity=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")  # "b" is now least recently used
+        await cache.set("c", 3)
+
+        assert await cache.get("a") == 1
+        assert await cache.get("b") is None
+        assert await cache.get("c") == 3
+
+    async def test_expired_entries_are_misses(self):
+        """Test entries older than the TTL are dropped."""
+        cache = LRUEmbeddingCache(ttl=-1)
+        await cache.set("key", "value")
+        assert await cache.get("key") is None
+        assert cache.stats()["size"] == 0
+
+    async def test_clear(self):
+        """Test clear drops all entries."""
+        cache = LRUEmbeddingCache()
+        await cache.set("key", "value")
+        await cache.clear()
+        assert await cache.get("key") is None
+
+    def test_text_key_is_stable(self):
+        """Test text keys are deterministic and distinguish texts."""
+        assert LRUEmbeddingCache.text_key("shoes") == LRUEmbeddingCache.text_key("shoes")
+        assert LRUEmbeddingCache.text_key("shoes") != LRUEmbeddingCache.text_key("boots")
+
+
+class TestSearchQueryCache:
+    """Tests for query embedding caching in EmbeddingService."""
+
+    @staticmethod
+    def service(vector):
+        from src.vector.embeddings import EmbeddingService
+
+        service = EmbeddingService()
+        calls = []
+
+        async def embed_text(text, dimensions=None):
+            calls.append(text)
+            return list(vector)
+
+        service.embed_text = embed_text
+        return service, calls
+
+    async def test_repeat_query_skips_embedding(self):
+        """Test a repeated query is served from the cache."""
+        service, calls = self.service([0.5, 0.25])
+        first = await service.embed_search_query("running shoes")
+        first[0] = 9.0  # callers get their own list
+
+        assert await service.embed_search_query("running shoes") == [0.5, 0.25]
+        assert calls == ["running shoes"]
+
+    async def test_zero_vectors_not_cached(self):
+        """Test fallback zero vectors are not cached."""
+        service, calls = self.service([0.0, 0.0])
+        await service.embed_search_query("shoes")
+        await service.embed_search_query("shoes")
+        assert calls == ["shoes", "shoes"]
+
+
+class TestEmbeddingServiceShutdown:
+    """Tests for closing the embedding service's HTTP transport."""
+
+    async def test_close_embedding_service_closes_transport(self, monkeypatch):
+        """Test the singleton's pooled client is closed and the singleton reset."""
+        from src.vector.embeddings import EmbeddingService, close_embedding_service
+
+        monkeypatch.delenv("AZURE_OPENAI_ENDPOINT", raising=False)
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setattr(EmbeddingService, "_instance", None)
+
+        service = await EmbeddingService.get_instance()
+        transport = service._client._client
+        await close_embedding_service()
+
+        assert transport.is_closed
+        assert service._client is None
+        assert EmbeddingService._instance is None
+
+
+class TestEmbeddingServiceSingleton:
+    """Tests for the embedding service singleton."""
+
+    def test_get_instance_across_event_loops(self, monkeypatch):
+        """Test contended cold starts work from more than one event loop."""
+        from src.vector.embeddings import EmbeddingService
+
+        async def slow_initialize(self):
+            await asyncio.sleep(0)  # second caller waits on the lock
+
+        monkeypatch.setattr(EmbeddingService, "_initialize", slow_initialize)
+
+        async def cold_start():
+            EmbeddingService._instance = None
+            first, second = await asyncio.gather(
+                EmbeddingService.get_instance(), EmbeddingService.get_instance(),
+            )
+            assert first is second
+
+        monkeypatch.setattr(EmbeddingService, "_instance", None)
+        for _ in range(2):
+            asyncio.run(cold_start())